@@ -0,0 +1,965 @@
+"""Benchmarking my solution files, more carefully than the single timing in test_solutions.py
+Assumes this file is in the folder with solution files
+
+Each part gets some warmup runs and then some timed repeats (perf_counter_ns)
+The report gives min/median/p95 of the repeats
+If the solution file has a prepare(s) function, that gets benchmarked as "parse",
+    and the parts are benchmarked on its output
+
+Results can be saved to a JSON baseline (keyed by module name)
+Later runs get compared against the baseline, and fail if a part's median regressed too much
+
+Ex.
+python ./solutions/bench.py --day 16 --repeats 10
+python ./solutions/bench.py --save
+python ./solutions/bench.py --threshold 0.25
+
+There's also a batch mode, for running one solution file over a whole folder of inputs
+The inputs get spread over a process pool, and the report gives each input's answers
+    plus throughput (inputs per second) and latency percentiles
+With --stream, solution files with streaming entry points (solution_part1_lines() etc.)
+    get each input as a stream of lines (utils.inputs.iter_lines()) instead of one string
+Ex.
+python ./solutions/bench.py batch nickb_day16.py ./many_inputs/day16 --jobs 8
+python ./solutions/bench.py batch nickb_day22.py ./many_inputs/day22 --stream
+
+And a scaling mode, timing solution files on generated inputs (utils/generators.py) of growing size
+The report gives the seconds at each size and the fitted growth (seconds ~ size^k)
+Sizes default to multiples of the real input size, and --plot draws runtime vs size (needs matplotlib)
+Ex.
+python ./solutions/bench.py scale nickb_day16.py --sizes 41 81 141 281
+python ./solutions/bench.py --day 1 --day 2 scale --factors 1 10 100 --plot scaling.png
+
+And a microbenchmark of the sorted containers in utils.utilities (BinaryList vs the old FlatBinaryList)
+Each starts out holding size random numbers, then gets timed on pushes, finds and removes
+Ex.
+python ./solutions/bench.py sorted --sizes 100000 1000000 --ops 20000
+
+And a microbenchmark of the day 1 similarity score engines (nickb_day1.similarity_score() etc.)
+    against the original pandas value_counts version, on random lists of location IDs
+Ex.
+python ./solutions/bench.py similarity --sizes 1000000 10000000
+
+And a history of runs across commits, in bench_history.sqlite
+record times every module (like the default mode) and stores the per-part and per-module
+    medians, tagged with the git commit and the Python version
+compare reports the speedups/regressions between the latest runs recorded for two commits
+    (anything git can resolve, or a hash prefix from the history)
+Ex.
+python ./solutions/bench.py --repeats 10 record
+python ./solutions/bench.py compare HEAD~3 HEAD
+"""
+
+import os
+import sys
+import json
+import math
+import argparse
+import functools
+import glob
+import importlib
+import numbers
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from test_solutions import CONFIG, load_input
+from utils.generators import generate, DEFAULT_SIZES, MAX_SIZES, SIZE_DESCRIPTIONS
+from utils.inputs import iter_lines
+from utils.memo import scope
+from utils.utilities import BinaryList, FlatBinaryList, load_lazy_imports
+
+CURRENT_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+BASELINE_JSON = os.path.join(CURRENT_DIRECTORY, "bench_baseline.json")
+
+# SQLite history of benchmark runs, see BenchHistory
+BENCH_HISTORY = os.path.join(CURRENT_DIRECTORY, "bench_history.sqlite")
+
+# the timings recorded for each module ("total" is the sum of the others)
+PARTS = ("parse", "1", "2", "total")
+
+# default fractional slowdown (of the median) that counts as a regression
+THRESHOLD = 0.2
+
+# default scaling sizes, as multiples of the real input size
+FACTORS = (0.25, 0.5, 1, 2)
+
+# container sizes and classes for the sorted microbenchmark
+SORTED_SIZES = (10**5, 3 * 10**5, 10**6)
+SORTED_CLASSES = {"BinaryList": BinaryList, "FlatBinaryList": FlatBinaryList}
+
+# list lengths for the similarity score microbenchmark
+SIMILARITY_SIZES = (10**5, 10**6, 10**7)
+
+
+def percentile(values: list, q: float) -> float:
+    """The q-th percentile (0 <= q <= 100) of values, nearest-rank style"""
+    values = sorted(values)
+    k = max(math.ceil(q / 100 * len(values)) - 1, 0)
+    return values[k]
+
+
+def summarize(times_ns: list[int]) -> dict:
+    """Summary stats (in seconds) for a list of timings in nanoseconds"""
+    return {
+        "min": min(times_ns) / 1e9,
+        "median": statistics.median(times_ns) / 1e9,
+        "p95": percentile(times_ns, 95) / 1e9,
+        "repeats": len(times_ns),
+    }
+
+
+def time_part(solution: callable, s: str, warmup: int, repeats: int) -> list[int]:
+    """Run solution(s) warmup times untimed, then repeats times timed
+    Returns the list of timings in nanoseconds
+    Each run gets its own utils.memo scope, so repeats don't get answers from a warm cache
+    """
+    for _ in range(warmup):
+        with scope():
+            solution(s)
+    times_ns = []
+    for _ in range(repeats):
+        with scope():
+            start = time.perf_counter_ns()
+            solution(s)
+            end = time.perf_counter_ns()
+        times_ns.append(end - start)
+    return times_ns
+
+
+def bench_solution(day: int, file_name: str, warmup: int = 1, repeats: int = 5) -> dict:
+    """Benchmark both parts of a solution file
+    Returns a dictionary with keys "1" and "2" giving the summary stats of each part
+    (plus "parse" if the module has a prepare() function)
+    """
+    module = importlib.import_module(file_name.removesuffix(".py"))
+    load_lazy_imports(module)
+    s = load_input(module, day)
+    results = {}
+    prepare = getattr(module, "prepare", None)
+    if prepare is not None:
+        results["parse"] = summarize(time_part(prepare, s, warmup, repeats))
+        s = prepare(s)
+    results["1"] = summarize(time_part(module.solution_part1, s, warmup, repeats))
+    results["2"] = summarize(time_part(module.solution_part2, s, warmup, repeats))
+    return results
+
+
+def load_baseline(path: str = BASELINE_JSON) -> dict:
+    """Load the baseline, or an empty one if it doesn't exist yet"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_baseline(results: dict, path: str = BASELINE_JSON):
+    """Merge results into the baseline file (only overwriting the modules that were run)"""
+    baseline = load_baseline(path)
+    baseline.update(results)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(baseline, file, indent=2, sort_keys=True)
+
+
+def find_regressions(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Compare median times against the baseline
+    Returns a list of messages, one for each part that got slower by more than threshold
+    """
+    regressions = []
+    for module_name, parts in results.items():
+        for part, stats in parts.items():
+            if part not in baseline.get(module_name, {}):
+                continue
+            base_median = baseline[module_name][part]["median"]
+            if stats["median"] > base_median * (1 + threshold):
+                regressions.append(
+                    f"{module_name} part {part}: median {stats['median']:.4f}s"
+                    f" vs baseline {base_median:.4f}s"
+                )
+    return regressions
+
+
+def part_label(part: str) -> str:
+    """How to print a part key"""
+    if part in ("parse", "total"):
+        return part.title()
+    return f"Part {part}"
+
+
+def print_bench_report(module_name: str, parts: dict, baseline: dict):
+    """Print the stats for one module, with the change vs the baseline median if there is one"""
+    print("--------------------")
+    print(module_name)
+    print("--------------------")
+    for part, stats in parts.items():
+        label = part_label(part)
+        line = (
+            f"{label}: min {stats['min']:.4f}s"
+            f"  median {stats['median']:.4f}s"
+            f"  p95 {stats['p95']:.4f}s"
+            f"  ({stats['repeats']} repeats)"
+        )
+        if part in baseline.get(module_name, {}):
+            base_median = baseline[module_name][part]["median"]
+            change = stats["median"] / base_median - 1 if base_median else 0.0
+            line += f"  [{change:+.1%} vs baseline]"
+        print(line)
+
+
+class BenchHistory:
+    """History of benchmark runs across commits (SQLite, next to this file)
+    Each run is tagged with the git commit (and whether the tree was dirty) and the Python version
+    Each timing is one module and part ("parse", "1", "2", or "total" for the whole module)
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path or BENCH_HISTORY
+        self.connection = sqlite3.connect(self.path, timeout=60)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS runs ("
+                "run_id INTEGER PRIMARY KEY, git_commit TEXT, dirty INTEGER, python TEXT, "
+                "recorded_at TEXT, warmup INTEGER, repeats INTEGER)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS timings ("
+                "run_id INTEGER, module TEXT, part TEXT, min REAL, median REAL, p95 REAL, "
+                "PRIMARY KEY (run_id, module, part))"
+            )
+
+    def add_run(
+        self, results: dict, commit: str, dirty: bool, warmup: int, repeats: int
+    ) -> int:
+        """Store the results of a run (module name -> part -> summary stats), return its run_id"""
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (git_commit, dirty, python, recorded_at, warmup, repeats) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    commit,
+                    int(dirty),
+                    platform.python_version(),
+                    time.strftime("%Y-%m-%d %H:%M:%S"),
+                    warmup,
+                    repeats,
+                ),
+            )
+            run_id = cursor.lastrowid
+            for module_name, parts in results.items():
+                rows = [
+                    (run_id, module_name, part, st["min"], st["median"], st["p95"])
+                    for part, st in parts.items()
+                ]
+                rows.append(
+                    (run_id, module_name, "total")
+                    + tuple(
+                        sum(st[key] for st in parts.values())
+                        for key in ("min", "median", "p95")
+                    )
+                )
+                self.connection.executemany(
+                    "INSERT INTO timings VALUES (?, ?, ?, ?, ?, ?)", rows
+                )
+        return run_id
+
+    def find_run(self, commit: str, python: str = None) -> dict | None:
+        """The latest run for a commit (full hash or a prefix), optionally for one Python version
+        Returns a dictionary of the runs row, None if there's no such run
+        """
+        query = "SELECT * FROM runs WHERE git_commit LIKE ?"
+        params = [commit + "%"]
+        if python is not None:
+            query += " AND python LIKE ?"
+            params.append(python + "%")
+        cursor = self.connection.execute(
+            query + " ORDER BY run_id DESC LIMIT 1", params
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return dict(zip([column[0] for column in cursor.description], row))
+
+    def get_timings(self, run_id: int) -> dict:
+        """(module name, part) -> median seconds for a run"""
+        rows = self.connection.execute(
+            "SELECT module, part, median FROM timings WHERE run_id = ?", (run_id,)
+        )
+        return {(module_name, part): median for module_name, part, median in rows}
+
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
+
+
+def git_commit(ref: str = "HEAD") -> tuple[str, bool]:
+    """(full hash, whether there are uncommitted changes) for a git ref of this repo
+    The hash is just ref itself if git can't resolve it (ex. no git, or a hash prefix
+        that only exists in the history database)
+    """
+    repo = os.path.dirname(CURRENT_DIRECTORY)
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+            cwd=repo,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=repo,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ref, False
+    return commit, bool(status)
+
+
+def describe_run(run: dict) -> str:
+    """Short description of a runs row"""
+    dirty = "+dirty" if run["dirty"] else ""
+    return (
+        f"{run['git_commit'][:10]}{dirty} (run {run['run_id']}, Python {run['python']},"
+        f" {run['recorded_at']}, {run['repeats']} repeats)"
+    )
+
+
+def compare_runs(
+    timings_a: dict, timings_b: dict, threshold: float
+) -> tuple[list[tuple], list[str], list[str]]:
+    """Compare the median timings of two runs, for the (module, part)s in both
+    Returns the table rows (module, part, seconds A, seconds B, speedup A/B),
+        and messages for the regressions and improvements (changes bigger than threshold)
+    """
+    rows = []
+    regressions = []
+    improvements = []
+    keys = sorted(
+        timings_a.keys() & timings_b.keys(),
+        key=lambda key: (key[0], PARTS.index(key[1])),
+    )
+    for module_name, part in keys:
+        a = timings_a[(module_name, part)]
+        b = timings_b[(module_name, part)]
+        speedup = a / b if b else math.inf
+        rows.append((module_name, part, a, b, speedup))
+        message = (
+            f"{module_name} {part_label(part)}: {a:.4f}s -> {b:.4f}s (x{speedup:.2f})"
+        )
+        if b > a * (1 + threshold):
+            regressions.append(message)
+        elif a > b * (1 + threshold):
+            improvements.append(message)
+    return rows, regressions, improvements
+
+
+def solve_input(
+    module_name: str, path: str, parts: tuple[int] = (1, 2), stream: bool = False
+) -> dict:
+    """Solve the given parts for one input file (for batch mode, runs in a worker)
+    Returns a dictionary with the answers, the latency (seconds from reading the input
+        to having all the answers), and the traceback if anything errored
+    stream: use the module's streaming entry points (solution_part1_lines() etc.),
+        each part reading through the file itself
+    """
+    start = time.perf_counter()
+    result = {"path": path, "answers": {}, "error": None}
+    try:
+        module = importlib.import_module(module_name)
+        load_lazy_imports(module)
+        if stream:
+            # each part streams through the file itself
+            inputs = {part: iter_lines(path) for part in parts}
+            suffix = "_lines"
+        else:
+            s = load_input(module, path=path)
+            prepare = getattr(module, "prepare", None)
+            if prepare is not None:
+                s = prepare(s)
+            inputs = dict.fromkeys(parts, s)
+            suffix = ""
+        for part in parts:
+            with scope():
+                answer = getattr(module, f"solution_part{part}{suffix}")(inputs[part])
+            if isinstance(answer, numbers.Integral):
+                answer = int(answer)
+            result["answers"][part] = answer
+    except Exception:  # pylint: disable=broad-exception-caught
+        result["error"] = traceback.format_exc()
+    result["latency"] = time.perf_counter() - start
+    return result
+
+
+def run_batch(
+    file_name: str,
+    folder: str,
+    jobs: int = 1,
+    parts: tuple[int] = (1, 2),
+    stream: bool = False,
+) -> list[dict]:
+    """Run a solution file on every input file in a folder, printing a report
+    Returns the list of results from solve_input(), in file name order
+    """
+    paths = sorted(p for p in glob.glob(os.path.join(folder, "*")) if os.path.isfile(p))
+    assert paths, f"No input files in {folder}"
+    module_name = file_name.removesuffix(".py")
+    worker = functools.partial(solve_input, module_name, parts=parts, stream=stream)
+
+    start = time.perf_counter()
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(worker, paths))
+    else:
+        results = [worker(path) for path in paths]
+    wall = time.perf_counter() - start
+
+    print("--------------------")
+    print(f"Batch: {file_name} on {len(paths)} inputs from {folder}")
+    print("--------------------")
+    for result in results:
+        name = os.path.basename(result["path"])
+        if result["error"] is not None:
+            last_line = result["error"].strip().splitlines()[-1]
+            print(f"{name}: ERRORED ({last_line})")
+            continue
+        answers = ", ".join(
+            f"part {part} = {answer}" for part, answer in result["answers"].items()
+        )
+        print(f"{name}: {answers} ({result['latency']:.4f}s)")
+
+    latencies = [result["latency"] for result in results]
+    num_errored = sum(result["error"] is not None for result in results)
+    print()
+    print(f"Wall seconds: {wall:.2f} with {jobs} job(s)")
+    print(f"Throughput: {len(results) / wall:.2f} inputs/second")
+    print(
+        f"Latency: p50 {percentile(latencies, 50):.4f}s"
+        f"  p95 {percentile(latencies, 95):.4f}s"
+        f"  p99 {percentile(latencies, 99):.4f}s"
+        f"  max {max(latencies):.4f}s"
+    )
+    if num_errored:
+        print(f"Errored: {num_errored} of {len(results)}")
+
+    return results
+
+
+def scaling_sizes(day: int, factors: tuple[float] = FACTORS) -> list[int]:
+    """Sizes for the day as multiples of its default size (deduplicated, capped at the max)"""
+    sizes = {max(1, round(DEFAULT_SIZES[day] * factor)) for factor in factors}
+    if day in MAX_SIZES:
+        sizes = {min(size, MAX_SIZES[day]) for size in sizes}
+    return sorted(sizes)
+
+
+def bench_scaling(
+    day: int,
+    file_name: str,
+    sizes: list[int],
+    seed: int = 0,
+    repeats: int = 1,
+    max_seconds: float = None,
+) -> list[dict]:
+    """Time a solution file on generated inputs of each size (in increasing order)
+    Returns one dictionary per size, giving the seconds (min of the repeats) for "1" and "2"
+        (plus "parse" if the module has a prepare() function), None where it errored
+    Stops after the first size that takes more than max_seconds in total
+    The smallest size gets one untimed warmup run, so one-off costs (lazy imports etc.) don't skew it
+    """
+    module = importlib.import_module(file_name.removesuffix(".py"))
+    load_lazy_imports(module)
+    prepare = getattr(module, "prepare", None)
+    steps = [("1", module.solution_part1), ("2", module.solution_part2)]
+    if prepare is not None:
+        steps.insert(0, ("parse", prepare))
+
+    points = []
+    for size in sorted(sizes):
+        point = {"size": size, "errors": {}}
+        warmup = 0 if points else 1
+        try:
+            s = generate(day, size, seed)
+        except Exception:  # pylint: disable=broad-exception-caught
+            point["errors"]["generate"] = traceback.format_exc()
+            points.append(point)
+            break
+        for key, function in steps:
+            try:
+                point[key] = min(time_part(function, s, warmup, repeats)) / 1e9
+            except Exception:  # pylint: disable=broad-exception-caught
+                point[key] = None
+                point["errors"][key] = traceback.format_exc()
+            if key == "parse":
+                s = prepare(s) if point[key] is not None else s
+        points.append(point)
+
+        total = sum(point.get(key) or 0.0 for key, _ in steps)
+        if max_seconds is not None and total > max_seconds:
+            break
+    return points
+
+
+def growth_exponent(points: list[dict], key: str) -> float | None:
+    """Fitted k for seconds ~ size^k (log-log least squares)
+    Ignores timings under a millisecond since they're mostly noise, None if too few points are left
+    """
+    xy = [
+        (math.log(point["size"]), math.log(point[key]))
+        for point in points
+        if point.get(key) is not None and point[key] >= 1e-3
+    ]
+    if len(xy) < 2 or len({x for x, _ in xy}) < 2:
+        return None
+    slope, _ = statistics.linear_regression(*zip(*xy))
+    return slope
+
+
+def print_scaling_report(module_name: str, day: int, points: list[dict]):
+    """Print the seconds at each size and the fitted growth of each part"""
+    keys = [key for key in ("parse", "1", "2") if any(key in point for point in points)]
+    labels = [part_label(key) for key in keys]
+    print("--------------------")
+    print(f"{module_name} (size = {SIZE_DESCRIPTIONS[day]})")
+    print("--------------------")
+    print(f"{'size':>10}" + "".join(f"{label:>12}" for label in labels))
+    for point in points:
+        line = f"{point['size']:>10}"
+        for key in keys:
+            if key in point["errors"]:
+                line += f"{'ERRORED':>12}"
+            elif key in point:
+                line += f"{point[key]:>11.4f}s"
+            else:
+                line += f"{'':>12}"
+        print(line)
+        for key, error in point["errors"].items():
+            print(f"    {key}: {error.strip().splitlines()[-1]}")
+    growth = []
+    for key, label in zip(keys, labels):
+        k = growth_exponent(points, key)
+        if k is not None:
+            growth.append(f"{label} ~ size^{k:.2f}")
+    if growth:
+        print("Growth: " + ", ".join(growth))
+
+
+def plot_scaling(results: dict, path: str):
+    """Plot runtime against size (log-log) for each solution file, saving to path
+    results maps module name -> (day, points from bench_scaling())
+    Needs matplotlib (not in requirements.txt), raises ImportError without it
+    """
+    matplotlib = importlib.import_module("matplotlib")
+    matplotlib.use("Agg")
+    plt = importlib.import_module("matplotlib.pyplot")
+
+    cols = math.ceil(math.sqrt(len(results)))
+    rows = math.ceil(len(results) / cols)
+    fig, axes = plt.subplots(rows, cols, figsize=(4 * cols, 3 * rows), squeeze=False)
+    for ax in axes.flat[len(results) :]:
+        ax.set_visible(False)
+    for ax, (module_name, (day, points)) in zip(axes.flat, results.items()):
+        for key in ("parse", "1", "2"):
+            xy = [(p["size"], p[key]) for p in points if p.get(key) is not None]
+            if xy:
+                ax.loglog(*zip(*xy), marker="o", label=key)
+        ax.set_title(module_name)
+        ax.set_xlabel(SIZE_DESCRIPTIONS[day])
+        ax.set_ylabel("seconds")
+        ax.legend()
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def bench_sorted(size: int, ops: int = 10_000, seed: int = 0) -> dict:
+    """Time the sorted containers at one size
+    Each starts out holding size random numbers, then does ops pushes, ops finds, and ops removes
+        (of the same new random numbers, so it ends up back at size)
+    Returns class name -> operation -> nanoseconds per operation
+    """
+    rng = random.Random(seed)
+    items = sorted(rng.random() for _ in range(size))
+    objs = [rng.random() for _ in range(ops)]
+
+    results = {}
+    contents = []
+    for name, cls in SORTED_CLASSES.items():
+        container = cls(items)
+        results[name] = {}
+        for op in ("push", "find", "remove"):
+            function = getattr(container, op)
+            start = time.perf_counter_ns()
+            for obj in objs:
+                function(obj)
+            results[name][op] = (time.perf_counter_ns() - start) / ops
+        contents.append(list(container))
+    assert all(c == contents[0] for c in contents), "Sorted containers disagree"
+    return results
+
+
+def print_sorted_report(size: int, results: dict):
+    """Print the microseconds per operation of each container, and the speedup over the last one"""
+    baseline = list(results.values())[-1]
+    print(f"size {size}")
+    print(f"{'':>16}" + "".join(f"{op:>12}" for op in ("push", "find", "remove")))
+    for name, timings in results.items():
+        line = f"{name:>16}"
+        for op, ns in timings.items():
+            line += f"{ns / 1e3:>10.2f}us"
+        print(line)
+    speedups = ", ".join(
+        f"{op} x{baseline[op] / ns:.1f}" for op, ns in list(results.values())[0].items()
+    )
+    print(f"Speedup: {speedups}")
+
+
+def bench_similarity(
+    size: int,
+    max_id: int = 99_999,
+    chunk_size: int = 10**6,
+    repeats: int = 3,
+    seed: int = 0,
+) -> dict:
+    """Time the day 1 similarity score engines on two random lists of size location IDs
+    (5 digit ones by default, like the real input, and with about half of the right list
+        copied from the left list so there are matches)
+    Returns engine name -> best seconds out of the repeats
+    """
+    day1 = importlib.import_module("nickb_day1")
+    rng = np.random.default_rng(seed)
+    l1 = rng.integers(10_000, max_id + 1, size=size)
+    l2 = np.where(
+        rng.random(size) < 0.5,
+        rng.choice(l1, size=size),
+        rng.integers(10_000, max_id + 1, size=size),
+    )
+    array = np.stack([l1, l2], axis=1)
+    engines = {
+        "score": lambda: day1.similarity_score(l1, l2),
+        "bincount": lambda: day1.similarity_bincount(l1, l2),
+        "unique": lambda: day1.similarity_unique(l1, l2),
+        "chunked": lambda: day1.similarity_chunked(
+            array[i : i + chunk_size] for i in range(0, size, chunk_size)
+        ),
+        "value_counts": lambda: day1.similarity_value_counts(l1, l2),
+    }
+
+    if max_id >= max(day1.DENSE_FACTOR * size, day1.DENSE_MIN):
+        # too sparse, the bincount would be huge
+        del engines["bincount"]
+
+    results = {}
+    answers = set()
+    for name, engine in engines.items():
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            answers.add(engine())
+            times.append(time.perf_counter() - start)
+        results[name] = min(times)
+    assert len(answers) == 1, "Similarity score engines disagree"
+    return results
+
+
+def print_similarity_report(size: int, results: dict):
+    """Print the seconds each engine took, and its speedup over the last one (the pandas version)"""
+    baseline = list(results.values())[-1]
+    print(f"size {size:,}")
+    for name, seconds in results.items():
+        print(f"{name:>16}{seconds:>10.4f}s{baseline / seconds:>8.1f}x")
+
+
+def parse_args() -> argparse.Namespace:
+    """Command line arguments for running this file"""
+    parser = argparse.ArgumentParser(description="Benchmark solutions")
+    parser.add_argument("--day", type=int, action="append", help="only these day(s)")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs per part")
+    parser.add_argument("--repeats", type=int, default=5, help="timed runs per part")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help=f"fractional median slowdown that fails the run (default {THRESHOLD})",
+    )
+    parser.add_argument("--baseline", default=BASELINE_JSON, help="baseline JSON path")
+    parser.add_argument(
+        "--save", action="store_true", help="save the results into the baseline"
+    )
+
+    subparsers = parser.add_subparsers(dest="command")
+    parser_batch = subparsers.add_parser(
+        "batch", help="run one solution file over a folder of inputs"
+    )
+    parser_batch.add_argument("file", help="solution file, ex. nickb_day16.py")
+    parser_batch.add_argument("folder", help="folder of input files")
+    parser_batch.add_argument(
+        "--jobs", "-j", type=int, default=1, help="number of worker processes"
+    )
+    parser_batch.add_argument(
+        "--part", type=int, action="append", choices=(1, 2), help="only these part(s)"
+    )
+    parser_batch.add_argument(
+        "--stream",
+        action="store_true",
+        help="use the streaming entry points (solution_part1_lines() etc.)",
+    )
+
+    parser_scale = subparsers.add_parser(
+        "scale", help="time solution files on generated inputs of growing size"
+    )
+    parser_scale.add_argument(
+        "files", nargs="*", help="solution files (default: everything in CONFIG)"
+    )
+    parser_scale.add_argument(
+        "--sizes", type=int, nargs="+", help="explicit sizes (see SIZE_DESCRIPTIONS)"
+    )
+    parser_scale.add_argument(
+        "--factors",
+        type=float,
+        nargs="+",
+        default=FACTORS,
+        help=f"sizes as multiples of the real input size (default {FACTORS})",
+    )
+    parser_scale.add_argument("--seed", type=int, default=0, help="generator seed")
+    parser_scale.add_argument(
+        "--repeats", type=int, default=1, help="timed runs per size (min is reported)"
+    )
+    parser_scale.add_argument(
+        "--max-seconds",
+        type=float,
+        default=60,
+        help="skip bigger sizes once a size takes this long (default 60)",
+    )
+    parser_scale.add_argument("--plot", help="save a runtime vs size plot here")
+
+    parser_sorted = subparsers.add_parser(
+        "sorted", help="microbenchmark the sorted containers in utils.utilities"
+    )
+    parser_sorted.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=SORTED_SIZES,
+        help=f"starting sizes (default {SORTED_SIZES})",
+    )
+    parser_sorted.add_argument(
+        "--ops", type=int, default=10_000, help="timed operations of each kind"
+    )
+    parser_sorted.add_argument("--seed", type=int, default=0, help="random seed")
+
+    parser_similarity = subparsers.add_parser(
+        "similarity", help="microbenchmark the day 1 similarity score engines"
+    )
+    parser_similarity.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=SIMILARITY_SIZES,
+        help=f"list lengths (default {SIMILARITY_SIZES})",
+    )
+    parser_similarity.add_argument(
+        "--max-id", type=int, default=99_999, help="largest location ID"
+    )
+    parser_similarity.add_argument("--seed", type=int, default=0, help="random seed")
+
+    parser_record = subparsers.add_parser(
+        "record", help="time every module and add the run to the history database"
+    )
+    parser_record.add_argument(
+        "--db", default=BENCH_HISTORY, help="history database path"
+    )
+
+    parser_compare = subparsers.add_parser(
+        "compare", help="compare the recorded runs of two commits"
+    )
+    parser_compare.add_argument("commit_a", help="the before commit")
+    parser_compare.add_argument("commit_b", help="the after commit")
+    parser_compare.add_argument(
+        "--python", help="only runs on this Python version (ex. 3.12)"
+    )
+    parser_compare.add_argument(
+        "--db", default=BENCH_HISTORY, help="history database path"
+    )
+    return parser.parse_args()
+
+
+def main_record(args: argparse.Namespace) -> int:
+    """Time every module and record the run, return an exit code (1 if anything failed)"""
+    commit, dirty = git_commit()
+    if dirty:
+        print(f"Warning: uncommitted changes, recording as {commit[:10]}+dirty")
+        print()
+
+    results = {}
+    failed = []
+    for day, file_name in CONFIG:
+        if args.day and day not in args.day:
+            continue
+        module_name = file_name.removesuffix(".py")
+        try:
+            results[module_name] = bench_solution(
+                day, file_name, args.warmup, args.repeats
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            failed.append(module_name)
+            last_line = traceback.format_exc().strip().splitlines()[-1]
+            print(f"{module_name}: FAILED ({last_line})")
+            print()
+            continue
+        print_bench_report(module_name, results[module_name], {})
+        print()
+
+    history = BenchHistory(args.db)
+    run_id = history.add_run(results, commit, dirty, args.warmup, args.repeats)
+    history.close()
+    print(
+        f"Recorded run {run_id} ({len(results)} modules) for {commit[:10]} in {args.db}"
+    )
+    if failed:
+        print(f"Failed (not recorded): {', '.join(failed)}")
+    return int(bool(failed))
+
+
+def main_compare(args: argparse.Namespace) -> int:
+    """Compare two commits' runs, return an exit code (1 if anything regressed)"""
+    history = BenchHistory(args.db)
+    runs = []
+    for ref in (args.commit_a, args.commit_b):
+        commit, _ = git_commit(ref)
+        run = history.find_run(commit, args.python)
+        if run is None:
+            print(f"No recorded run for {ref} ({commit[:10]}), see 'bench.py record'")
+            history.close()
+            return 1
+        runs.append(run)
+    timings_a, timings_b = (history.get_timings(run["run_id"]) for run in runs)
+    history.close()
+
+    rows, regressions, improvements = compare_runs(timings_a, timings_b, args.threshold)
+    print(f"A: {describe_run(runs[0])}")
+    print(f"B: {describe_run(runs[1])}")
+    if runs[0]["python"] != runs[1]["python"]:
+        print("Warning: different Python versions")
+    print()
+    print(f"{'module':<20}{'part':>6}{'A median':>12}{'B median':>12}{'speedup':>10}")
+    for module_name, part, a, b, speedup in rows:
+        print(f"{module_name:<20}{part:>6}{a:>11.4f}s{b:>11.4f}s{speedup:>9.2f}x")
+    print()
+    for title, messages in (
+        (f"Regressions (more than {args.threshold:.0%} slower)", regressions),
+        (f"Improvements (more than {args.threshold:.0%} faster)", improvements),
+    ):
+        if messages:
+            print(f"{title}:")
+            for message in messages:
+                print(f"- {message}")
+    if not regressions:
+        print("No regressions")
+    return int(bool(regressions))
+
+
+def main_scale(args: argparse.Namespace) -> int:
+    """Run the scaling benchmarks, return an exit code (1 if anything errored)"""
+    files = args.files or [file_name for _, file_name in CONFIG]
+    days = {file_name: day for day, file_name in CONFIG}
+
+    results = {}
+    for file_name in files:
+        assert file_name in days, f"{file_name} not found in config"
+        day = days[file_name]
+        if args.day and day not in args.day:
+            continue
+        sizes = args.sizes or scaling_sizes(day, args.factors)
+        module_name = file_name.removesuffix(".py")
+        points = bench_scaling(
+            day, file_name, sizes, args.seed, args.repeats, args.max_seconds
+        )
+        results[module_name] = (day, points)
+        print_scaling_report(module_name, day, points)
+        print()
+
+    if args.plot:
+        try:
+            plot_scaling(results, args.plot)
+            print(f"Saved plot to {args.plot}")
+        except ImportError:
+            print("Can't plot without matplotlib (pip install matplotlib)")
+
+    errored = any(p["errors"] for _, points in results.values() for p in points)
+    return int(errored)
+
+
+def main_baseline(args: argparse.Namespace) -> int:
+    """Run the benchmarks, return an exit code (1 if anything regressed)"""
+    baseline = load_baseline(args.baseline)
+
+    results = {}
+    for day, file_name in CONFIG:
+        if args.day and day not in args.day:
+            continue
+        module_name = file_name.removesuffix(".py")
+        results[module_name] = bench_solution(day, file_name, args.warmup, args.repeats)
+        print_bench_report(module_name, results[module_name], baseline)
+        print()
+
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    if regressions:
+        print(f"Regressions (more than {args.threshold:.0%} slower):")
+        for regression in regressions:
+            print(f"- {regression}")
+        return 1
+    print("No regressions")
+    return 0
+
+
+def main() -> int:
+    """Run whichever mode was asked for, return an exit code"""
+    args = parse_args()
+    match args.command:
+        case "batch":
+            results = run_batch(
+                args.file,
+                args.folder,
+                args.jobs,
+                tuple(args.part or (1, 2)),
+                args.stream,
+            )
+            return int(any(result["error"] is not None for result in results))
+        case "scale":
+            return main_scale(args)
+        case "record":
+            return main_record(args)
+        case "compare":
+            return main_compare(args)
+        case "sorted":
+            for size in args.sizes:
+                print_sorted_report(size, bench_sorted(size, args.ops, args.seed))
+                print()
+            return 0
+        case "similarity":
+            for size in args.sizes:
+                results = bench_similarity(size, args.max_id, seed=args.seed)
+                print_similarity_report(size, results)
+                print()
+            return 0
+        case _:
+            return main_baseline(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+"""A long-lived solver process, so repeated runs skip python startup and the heavy imports
+Assumes this file is in the folder with solution files
+
+The server listens on a Unix socket and keeps the solution files (and numpy/pandas/etc.) imported
+Solution files that changed on disk get reloaded with importlib.reload() before they're run
+(Changes to utils/ need a server restart)
+
+Ex.
+python ./solutions/daemon.py serve &
+python ./solutions/daemon.py run 16 1
+python ./solutions/daemon.py run 16 2 --input ./inputs/some_other_input.txt
+python ./solutions/daemon.py stop
+
+Protocol: one JSON object per line each way
+Requests: {"command": "run", "day": 16, "part": 1, "input": "/path", "file": "nickb_day16.py"}
+    ("input" and "file" are optional, defaulting to get_input(day) and the CONFIG file for the day,
+    and "counters": true turns on utils.counters for the solve)
+    or {"command": "ping"} or {"command": "stop"}
+Responses: {"answer": ..., "seconds": ..., "parse_seconds": ..., "reloaded": ..., "memo": ...,
+    "counters": ..., "parse_counters": ...} or {"error": "..."} ("memo" is the utils.memo stats of
+    the solve, "parse_counters" the utils.counters counts of prepare())
+"""
+
+import os
+import sys
+import json
+import argparse
+import contextlib
+import importlib
+import numbers
+import socket
+import socketserver
+import tempfile
+import time
+import traceback
+
+from utils import memo
+from utils.counters import counting, format_counts
+from utils.utilities import lazy_import, load_lazy_imports
+
+# only the server needs this, so the client stays quick to start
+test_solutions = lazy_import("test_solutions")
+
+SOCKET_PATH = os.path.join(tempfile.gettempdir(), "aoc2024_solver.sock")
+
+# imported up front so no request pays for them
+WARM_MODULES = ["numpy", "pandas", "networkx", "scipy.optimize"]
+
+
+class SolverServer(socketserver.UnixStreamServer):
+    """Unix socket server that keeps solution modules imported between requests"""
+
+    def __init__(self, socket_path: str = SOCKET_PATH):
+        # clear out a socket file left over from a server that didn't shut down cleanly
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        super().__init__(socket_path, SolverHandler)
+        self.socket_path = socket_path
+
+        # set by a "stop" command, see serve()
+        self.stopping = False
+
+        # module name -> modification time (ns) of its file when it was (re)loaded
+        self.mtimes = {}
+
+        for name in WARM_MODULES:
+            # dir() forces lazy_import()-ed modules to actually load
+            dir(importlib.import_module(name))
+        for _, file_name in test_solutions.CONFIG:
+            try:
+                self.get_module(file_name.removesuffix(".py"))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # not fatal, requests for it will report the error
+                print(f"Failed to import {file_name}: {e!r}")
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+    def get_module(self, module_name: str) -> tuple[object, bool]:
+        """Get a solution module, reloading it if its file changed
+        Returns (module, whether it got (re)loaded)
+        """
+        if module_name not in sys.modules:
+            module = importlib.import_module(module_name)
+            load_lazy_imports(module)
+            self.mtimes[module_name] = os.stat(module.__file__).st_mtime_ns
+            return module, True
+
+        module = sys.modules[module_name]
+        mtime = os.stat(module.__file__).st_mtime_ns
+        if mtime != self.mtimes.get(module_name):
+            module = importlib.reload(module)
+            load_lazy_imports(module)
+            self.mtimes[module_name] = mtime
+            return module, True
+        return module, False
+
+    def solve(
+        self,
+        day: int,
+        part: int,
+        input_path: str = None,
+        file_name: str = None,
+        counters: bool = False,
+    ):
+        """Run one part of a day's solution, returning the response dictionary
+        counters: turn on utils.counters for the solve, adding "counters" to the response
+        """
+        if file_name is None:
+            file_names = [f for d, f in test_solutions.CONFIG if d == day]
+            assert file_names, f"Day {day} not found in config"
+            file_name = file_names[-1]
+        module, reloaded = self.get_module(file_name.removesuffix(".py"))
+
+        s = test_solutions.load_input(module, day, input_path)
+
+        # same parse-once hook as the test harness
+        # (counted separately, since some days do their searching in prepare(), ex. day 20)
+        parse_seconds = None
+        parse_counts = {}
+        prepare = getattr(module, "prepare", None)
+        if prepare is not None:
+            with (
+                counting() if counters else contextlib.nullcontext(parse_counts)
+            ) as parse_counts:
+                start = time.perf_counter()
+                s = prepare(s)
+                parse_seconds = time.perf_counter() - start
+
+        # fresh memo caches for each request, so they don't grow across inputs
+        solution = getattr(module, f"solution_part{part}")
+        counts = {}
+        with (
+            memo.scope() as memo_stats,
+            counting() if counters else contextlib.nullcontext(counts) as counts,
+        ):
+            start = time.perf_counter()
+            answer = solution(s)
+            seconds = time.perf_counter() - start
+
+        return {
+            "answer": (
+                int(answer) if isinstance(answer, numbers.Integral) else str(answer)
+            ),
+            "seconds": seconds,
+            "parse_seconds": parse_seconds,
+            "file": file_name,
+            "reloaded": reloaded,
+            "memo": memo_stats,
+            "counters": counts,
+            "parse_counters": parse_counts,
+        }
+
+
+class SolverHandler(socketserver.StreamRequestHandler):
+    """Handles one connection: reads a JSON request line, writes a JSON response line"""
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            match request.get("command", "run"):
+                case "ping":
+                    response = {"ok": True, "pid": os.getpid()}
+                case "stop":
+                    response = {"ok": True}
+                    self.server.stopping = True
+                case "run":
+                    response = self.server.solve(
+                        int(request["day"]),
+                        int(request["part"]),
+                        request.get("input"),
+                        request.get("file"),
+                        bool(request.get("counters")),
+                    )
+                case command:
+                    response = {"error": f"Unknown command {command!r}"}
+        except Exception:  # pylint: disable=broad-exception-caught
+            response = {"error": traceback.format_exc()}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+def serve(socket_path: str = SOCKET_PATH):
+    """Run the server until it gets a "stop" command"""
+    with SolverServer(socket_path) as server:
+        print(f"Listening on {socket_path}")
+        while not server.stopping:
+            server.handle_request()
+
+
+def send_request(request: dict, socket_path: str = SOCKET_PATH) -> dict:
+    """Send a request to the server and return its response"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        with sock.makefile("rwb") as file:
+            file.write(json.dumps(request).encode("utf-8") + b"\n")
+            file.flush()
+            return json.loads(file.readline())
+
+
+def parse_args() -> argparse.Namespace:
+    """Command line arguments for running this file"""
+    parser = argparse.ArgumentParser(description="Warm solver daemon and its client")
+    parser.add_argument("--socket", default=SOCKET_PATH, help="Unix socket path")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("serve", help="run the server")
+    subparsers.add_parser("ping", help="check the server is up")
+    subparsers.add_parser("stop", help="stop the server")
+    parser_run = subparsers.add_parser("run", help="run a day's solution on the server")
+    parser_run.add_argument("day", type=int)
+    parser_run.add_argument("part", type=int, choices=(1, 2))
+    parser_run.add_argument("--input", help="input file (default: get_input(day))")
+    parser_run.add_argument("--file", help="solution file (default: from CONFIG)")
+    parser_run.add_argument(
+        "--counters", action="store_true", help="count the work the solve does"
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the server or the client, return an exit code"""
+    args = parse_args()
+    if args.command == "serve":
+        serve(args.socket)
+        return 0
+
+    request = {"command": args.command}
+    if args.command == "run":
+        request["day"] = args.day
+        request["part"] = args.part
+        if args.input:
+            request["input"] = os.path.abspath(args.input)
+        if args.file:
+            request["file"] = args.file
+        if args.counters:
+            request["counters"] = True
+    response = send_request(request, args.socket)
+
+    if "error" in response:
+        print(response["error"])
+        return 1
+    if args.command == "run":
+        print(response["answer"])
+        print(f"Seconds: {response['seconds']:.4f}", file=sys.stderr)
+        for line in memo.format_stats(response.get("memo", {})):
+            print(f"Memo: {line}", file=sys.stderr)
+        if response.get("parse_counters"):
+            print(
+                f"Parse counters: {format_counts(response['parse_counters'])}",
+                file=sys.stderr,
+            )
+        if response.get("counters"):
+            print(f"Counters: {format_counts(response['counters'])}", file=sys.stderr)
+    else:
+        print(response)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,12 +13,14 @@ from collections import deque, defaultdict
 from frozendict import frozendict
 import math
 import numpy as np
-import pandas as pd
-import networkx as nx
-from scipy.optimize import bisect
 
 from utils.inputs import get_input
-from utils.utilities import BinaryList
+from utils.utilities import BinaryList, lazy_import
+
+# heavy packages get imported on first use, delete whichever aren't needed
+pd = lazy_import("pandas")
+nx = lazy_import("networkx")
+optimize = lazy_import("scipy.optimize")
 
 DAY = 0  # FIXME
 
@@ -1,40 +1,256 @@
-"""Day 1"""
+"""Day 1
+
+Part 1 pairs up the sorted columns, so it's a sort of each column
+In memory that's just np.sort, but solution_part1_lines() also handles location lists bigger than RAM,
+    with an external sort:
+- read RUN_SIZE lines at a time, sort each column of the chunk, and write them to int32 scratch files
+- memory-map the sorted runs, and k-way merge each column's runs (merge_runs())
+- walk the two merged columns in lockstep, adding up |a - b| as we go
+So it only ever holds a chunk of lines, or a block of each run, in memory
+If the whole input fits in one run, it skips the scratch files and sorts in memory
+
+Part 2 is a join of the left list against the counts of the right list, in numpy (similarity_score()),
+    and solution_part2_lines() only keeps the counts of each column between chunks
+"""
 
 # pylint: disable=invalid-name, redefined-outer-name
 
+from typing import Generator, Iterable
+import itertools
+import os
+import tempfile
+
 import numpy as np
-import pandas as pd
 
 from utils.inputs import get_input
+from utils.ints import int_table
+from utils.utilities import lazy_import
+
+pd = lazy_import("pandas")
 
 DAY = 1
 
+# lines per sorted run in the external sort (2 int32 columns, so 32 MiB)
+RUN_SIZE = 2**22
+
+# similarity_score() counts with np.bincount when the values are at most
+#     max(DENSE_FACTOR * number of values, DENSE_MIN), otherwise with np.unique
+DENSE_FACTOR = 4
+DENSE_MIN = 2**16
+
+# total number of values read from the runs in each round of the merge (spread over the runs)
+MERGE_BUFFER = 2**22
+
 
 def solution_part1(s: str) -> int:
     """Part 1 solution from the plaintext input"""
-    array = np.array(list(map(int, s.strip().split()))).reshape(-1, 2)
-    l1 = sorted(array[:, 0])
-    l2 = sorted(array[:, 1])
-    soln = sum(abs(np.array(l1) - np.array(l2)))
-    return soln
+    array = int_table(s, 2)
+    return sorted_distance(array[:, 0], array[:, 1])
+
+
+def sorted_distance(l1: np.ndarray, l2: np.ndarray) -> int:
+    """Total distance between the two lists once they're sorted (the in-memory np.sort path)"""
+    return int(np.abs(np.sort(l1).astype(np.int64) - np.sort(l2)).sum())
 
 
 def solution_part2(s: str) -> int:
     """Part 2 solution from the plaintext input"""
-    array = np.array(list(map(int, s.strip().split()))).reshape(-1, 2)
+    array = int_table(s, 2)
+    return similarity_score(array[:, 0], array[:, 1])
+
+
+def similarity_score(l1: np.ndarray, l2: np.ndarray) -> int:
+    """Each number in l1 times the number of times it appears in l2, added up
+    A join of l1 against the counts of l2: np.bincount if l2's values are dense enough
+        (up to DENSE_FACTOR times as many possible values as numbers), otherwise np.unique
+    """
+    if not len(l1) or not len(l2):
+        return 0
+    if l2.min() >= 0 and l2.max() < max(DENSE_FACTOR * len(l2), DENSE_MIN):
+        return similarity_bincount(l1, l2)
+    return similarity_unique(l1, l2)
+
+
+def similarity_bincount(l1: np.ndarray, l2: np.ndarray) -> int:
+    """similarity_score() using np.bincount(l2) as a lookup table (l2 non-negative)"""
+    counts = np.bincount(l2)
+    l1 = l1[(l1 >= 0) & (l1 < len(counts))]
+    return int((l1.astype(np.int64) * counts[l1]).sum())
+
+
+def similarity_unique(l1: np.ndarray, l2: np.ndarray) -> int:
+    """similarity_score() joining the np.unique() counts of both lists
+    (Looking up every number of l1 in the distinct values of l2 would be a binary search each,
+        jumping all over memory, while the distinct values of l1 are sorted, so far fewer and in order)
+    """
+    return join_counts(
+        np.unique(l1, return_counts=True), np.unique(l2, return_counts=True)
+    )
+
+
+def join_counts(counts1: tuple, counts2: tuple) -> int:
+    """similarity_score() from the counts of both lists (pairs of sorted distinct values, number of each)"""
+    common, idx1, idx2 = np.intersect1d(
+        counts1[0], counts2[0], assume_unique=True, return_indices=True
+    )
+    return int(
+        (
+            common.astype(np.int64)
+            * counts1[1][idx1].astype(np.int64)
+            * counts2[1][idx2]
+        ).sum()
+    )
 
-    l1 = list(array[:, 0])
-    l2 = list(array[:, 1])
 
+def similarity_value_counts(l1: np.ndarray, l2: np.ndarray) -> int:
+    """similarity_score() the original way, with pandas (kept to benchmark against)"""
     l1_counts = pd.Series(l1).value_counts()
     l2_counts = pd.Series(l2).value_counts()
     idx = l1_counts.index.intersection(l2_counts.index)
     l1_counts = l1_counts[idx]
     l2_counts = l2_counts[idx]
+    return int((idx * l1_counts * l2_counts).sum())
+
+
+def add_counts(counts: tuple | None, values: np.ndarray) -> tuple:
+    """Add values to counts, a pair (sorted distinct values, number of each) or None for empty"""
+    new_values, new_counts = np.unique(values, return_counts=True)
+    if counts is None:
+        return new_values, new_counts.astype(np.int64)
+    old_values, old_counts = counts
+    merged = np.union1d(old_values, new_values)
+    merged_counts = np.zeros(len(merged), dtype=np.int64)
+    merged_counts[np.searchsorted(merged, old_values)] += old_counts
+    merged_counts[np.searchsorted(merged, new_values)] += new_counts
+    return merged, merged_counts
+
+
+def similarity_chunked(chunks: Iterable[np.ndarray]) -> int:
+    """similarity_score() of the columns of arrays of shape (chunk size, 2), given a chunk at a time
+    Only holds one chunk plus the counts of each column (so memory is bounded by the number of
+        distinct location IDs, not the number of lines)
+    """
+    counts1 = counts2 = None
+    for chunk in chunks:
+        counts1 = add_counts(counts1, chunk[:, 0])
+        counts2 = add_counts(counts2, chunk[:, 1])
+    if counts1 is None:
+        return 0
+    return join_counts(counts1, counts2)
+
+
+def iter_chunks(
+    lines: Iterable[str], chunk_size: int
+) -> Generator[np.ndarray, None, None]:
+    """Parse the lines chunk_size at a time, yielding int32 arrays of shape (chunk_size, 2)"""
+    lines = iter(lines)
+    while chunk := list(itertools.islice(lines, chunk_size)):
+        array = int_table("\n".join(chunk), 2)
+        assert array.min() >= 0 and array.max() <= np.iinfo(np.int32).max
+        yield array.astype(np.int32)
+
+
+def write_runs(
+    chunks: Iterable[np.ndarray], directory: str
+) -> tuple[list[np.memmap], list[np.memmap]]:
+    """Sort each column of each chunk, appending the sorted runs to one int32 scratch file per column
+    Returns the sorted runs of each column, as slices of the memory-mapped files
+    (Two files however many runs there are, so it doesn't run out of file handles)
+    """
+    paths = [os.path.join(directory, f"column{column}.int32") for column in (0, 1)]
+    bounds = [0]
+    with open(paths[0], "wb") as file0, open(paths[1], "wb") as file1:
+        for chunk in chunks:
+            np.sort(chunk[:, 0]).tofile(file0)
+            np.sort(chunk[:, 1]).tofile(file1)
+            bounds.append(bounds[-1] + len(chunk))
+
+    column0 = np.memmap(paths[0], dtype=np.int32, mode="r")
+    column1 = np.memmap(paths[1], dtype=np.int32, mode="r")
+    runs0 = [column0[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+    runs1 = [column1[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+    return runs0, runs1
+
+
+def merge_runs(
+    runs: list[np.ndarray], buffer_size: int = MERGE_BUFFER
+) -> Generator[np.ndarray, None, None]:
+    """k-way merge of sorted runs, yielding the merged values a sorted chunk at a time
+    Each round reads the next block of every run: everything up to the smallest last value of a block
+        (of a run that has more after the block) can't be beaten by what's still unread, so it's final
+    The run that block came from gets used up entirely, so each round makes progress
+    """
+    block_size = max(buffer_size // len(runs), 1)
+    positions = [0] * len(runs)
+    while True:
+        blocks = {
+            k: run[positions[k] : positions[k] + block_size]
+            for k, run in enumerate(runs)
+            if positions[k] < len(run)
+        }
+        if not blocks:
+            return
+        limits = [
+            block[-1]
+            for k, block in blocks.items()
+            if positions[k] + len(block) < len(runs[k])
+        ]
+        parts = []
+        for k, block in blocks.items():
+            n = np.searchsorted(block, min(limits), "right") if limits else len(block)
+            parts.append(block[:n])
+            positions[k] += n
+        yield np.sort(np.concatenate(parts))
+
+
+def lockstep_distance(
+    merged1: Iterable[np.ndarray], merged2: Iterable[np.ndarray]
+) -> int:
+    """Total distance between two lists given as streams of sorted chunks (of any sizes)"""
+    merged1 = iter(merged1)
+    merged2 = iter(merged2)
+    a = b = np.zeros(0, dtype=np.int32)
+    total = 0
+    while True:
+        if not len(a):
+            a = next(merged1, None)
+        if not len(b):
+            b = next(merged2, None)
+        if a is None or b is None:
+            assert a is None and b is None, "The lists are different lengths"
+            return total
+        n = min(len(a), len(b))
+        total += int(np.abs(a[:n].astype(np.int64) - b[:n]).sum())
+        a = a[n:]
+        b = b[n:]
+
+
+def solution_part1_lines(
+    lines: Iterable[str], run_size: int = RUN_SIZE, scratch_dir: str = None
+) -> int:
+    """Part 1 solution streaming the lines (ex. from utils.inputs.iter_input_lines())
+    External sort with runs of run_size lines, in a temporary folder in scratch_dir
+        (default: the system's temporary folder)
+    """
+    chunks = iter_chunks(lines, run_size)
+    first = next(chunks, None)
+    if first is None:
+        return 0
+    second = next(chunks, None)
+    if second is None:
+        return sorted_distance(first[:, 0], first[:, 1])
+
+    with tempfile.TemporaryDirectory(dir=scratch_dir) as directory:
+        runs1, runs2 = write_runs(itertools.chain([first, second], chunks), directory)
+        del first, second
+        return lockstep_distance(merge_runs(runs1), merge_runs(runs2))
 
-    soln = (idx * l1_counts * l2_counts).sum()
 
-    return soln
+def solution_part2_lines(lines: Iterable[str], chunk_size: int = RUN_SIZE) -> int:
+    """Part 2 solution streaming the lines (ex. from utils.inputs.iter_input_lines())
+    Only holds chunk_size lines at a time, plus the counts of each number
+    """
+    return similarity_chunked(iter_chunks(lines, chunk_size))
 
 
 if __name__ == "__main__":
@@ -2,36 +2,41 @@
 
 Part 2 was a dynamic programming kind of thing
 cache made coding it up straightforward as a recursive kind of thing
+(utils.memo rather than functools.cache, so the cache is keyed on just (i, j) and only lives for one solve)
 """
 
 # pylint: disable=invalid-name, redefined-outer-name
 
-from functools import cache
 import numpy as np
+from utils.grid import parse_grid, find_all, neighbour_offsets, pad
 from utils.inputs import get_input
+from utils.memo import memo, scope
+from utils.search import bfs, UNREACHED
 
 DAY = 10
 
+# prepare() can take the input as bytes (see utils.inputs.get_input_bytes())
+INPUT_BYTES = True
 
-def spread(A: np.ndarray, h: int, locs: set[tuple[int, int]]):
+
+def trail_neighbours(heights: list[int], offsets: list[int]):
     """For part 1
-    Spread the set of locations at height h to locations with height h + 1
+    Neighbour function for utils.search, on the flat ids of the padded array of heights:
+        the neighbouring locations one step higher
     """
-    n, m = A.shape
-    locs_new = set()
-    for i, j in locs:
-        for di, dj in ((0, 1), (0, -1), (1, 0), (-1, 0)):
-            _i, _j = i + di, j + dj
-            if (0 <= _i < n) and (0 <= _j < m) and (A[_i, _j] == h + 1):
-                locs_new.add((i + di, j + dj))
-    return locs_new
-
-
-@cache
-def calc_rating(A: tuple[tuple], i: int, j: int):
+
+    def neighbours(k: int) -> list[int]:
+        h = heights[k] + 1
+        return [k + o for o in offsets if heights[k + o] == h]
+
+    return neighbours
+
+
+@memo(key=lambda A, i, j: (i, j))
+def calc_rating(A: list[list[int]], i: int, j: int):
     """For part 2
     The rating of location (i, j) in A
-    Computed recursively (with caching)
+    Computed recursively (with caching, keyed on just (i, j) so only call it within a scope())
     If (i, j) is at height h < 9, its rating is the sum of the
         ratings of the trails it can branch to
     """
@@ -54,38 +59,53 @@ def calc_rating(A: tuple[tuple], i: int, j: int):
     return rating
 
 
-def solution_part1(s: str) -> int:
-    """Part 1 solution from the plaintext input"""
-    # make it a numpy array
-    A = np.array([list(map(int, line)) for line in s.strip().split("\n")])
+def prepare(s: str | memoryview) -> tuple[np.ndarray, list[tuple[int, int]]]:
+    """Parse the input (text or bytes) once, for both parts
+    Returns the array of heights and the list of (i, j) coords of zeros (trailheads)
+    """
+    # make it a numpy array of heights
+    A = (parse_grid(s, copy=False) - ord("0")).astype(int)
 
     # a list of tuples (i, j) of coords of zeros (trailheads)
-    idx_zeros = [(int(i), int(j)) for i, j in zip(*np.where(A == 0))]
+    idx_zeros = find_all(A, 0)
 
-    # count up the scores
+    return A, idx_zeros
+
+
+def solution_part1(s: str | tuple) -> int:
+    """Part 1 solution from the plaintext input (or the output of prepare())"""
+    A, idx_zeros = prepare(s) if isinstance(s, str) else s
+
+    # flat ids on A padded with -1s (never one step higher), so no bounds checks
+    P = pad(A, -1)
+    m = P.shape[1]
+    heights = P.reshape(-1).tolist()
+    neighbours = trail_neighbours(heights, neighbour_offsets(m).tolist())
+    is_nine = P.reshape(-1) == 9
+
+    # count up the scores: the 9s reachable from each trailhead
     total_score = 0
     for i, j in idx_zeros:
-        locs = {(i, j)}
-        for h in range(9):
-            locs = spread(A, h, locs)
-        trailhead_score = len(locs)
+        dist = bfs(len(heights), [(i + 1) * m + j + 1], neighbours)
+        trailhead_score = int(np.count_nonzero(dist[is_nine] != UNREACHED))
         total_score += trailhead_score
 
     return total_score
 
 
-def solution_part2(s: str) -> int:
-    """Part 2 solution from the plaintext input"""
-    A = np.array([list(map(int, line)) for line in s.strip().split("\n")])
-    idx_zeros = [(int(i), int(j)) for i, j in zip(*np.where(A == 0))]
+def solution_part2(s: str | tuple) -> int:
+    """Part 2 solution from the plaintext input (or the output of prepare())"""
+    A, idx_zeros = prepare(s) if isinstance(s, str) else s
 
-    # hashable version of A so @cache is happy
-    A_hashable = tuple([tuple([int(x) for x in row]) for row in A])
+    # nested lists are quicker to index than the array
+    A_list = A.tolist()
 
+    # the calc_rating() cache is only valid for this A
     total_rating = 0
-    for i, j in idx_zeros:
-        trailhead_rating = calc_rating(A_hashable, i, j)
-        total_rating += trailhead_rating
+    with scope():
+        for i, j in idx_zeros:
+            trailhead_rating = calc_rating(A_list, i, j)
+            total_rating += trailhead_rating
 
     return total_rating
 
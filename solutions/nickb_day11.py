@@ -8,8 +8,8 @@ cache for good measure but it's not necessary
 # pylint: disable=invalid-name, redefined-outer-name
 
 from collections import defaultdict
-from functools import cache
 from utils.inputs import get_input
+from utils.memo import memo
 
 DAY = 11
 
@@ -24,7 +24,7 @@ def step_stones_dict(stones_dict: dict) -> dict:
     return new_stones_dict
 
 
-@cache
+@memo()
 def step_stone(stone: int) -> list[int]:
     """Return the result of a step on a single stone"""
     if stone == 0:
@@ -5,70 +5,39 @@
 from collections import defaultdict
 import numpy as np
 
+from utils.grid import parse_grid, neighbour_offsets, pad
 from utils.inputs import get_input
+from utils.search import label_components
 
 DAY = 12
 
-
-def spread(A: np.ndarray, locs: set) -> set:
-    """Get the set of locs we spread to in 1 step"""
-    n, m = A.shape
-
-    # get the region
-    i, j = next(iter(locs))
-    r = A[i, j]
-
-    new_locs = set()
-    for i, j in locs:
-        for di, dj in ((0, 1), (0, -1), (1, 0), (-1, 0)):
-            _i, _j = i + di, j + dj
-
-            # check bounds
-            if not (0 <= _i < n and 0 <= _j < m):
-                continue
-
-            # check region
-            if A[_i, _j] != r:
-                continue
-
-            # add loc
-            new_locs.add((_i, _j))
-
-    return new_locs
-
-
-def find_region(A: np.ndarray, i: int, j: int) -> set:
-    """Find the set of locations for the region of A[i, j]
-    Does spreading just on the "frontier" to make things a bit quicker
-    """
-    locs = {(i, j)}
-    frontier = {(i, j)}
-    n = len(locs) + 1
-    while len(locs) != n:
-        n = len(locs)
-        new_locs = spread(A, frontier)
-        frontier = new_locs - locs
-        locs = locs | frontier
-    return locs
+# prepare() can take the input as bytes (see utils.inputs.get_input_bytes())
+INPUT_BYTES = True
 
 
 def find_regions(A: np.ndarray) -> list[set]:
-    """Return the list of locs sets of regions"""
-    # set of points with regions already assigned
-    assigned = set()
+    """Return the list of locs sets of regions
+    The regions are the connected components of same-plant neighbours,
+        labelled by utils.search on the flat ids of A padded with 0s (not a plant)
+    """
+    P = pad(A, 0)
+    m = P.shape[1]
+    plants = P.reshape(-1).tolist()
+    offsets = neighbour_offsets(m).tolist()
 
-    regions = []
+    def neighbours(k: int) -> list[int]:
+        return [k + o for o in offsets if plants[k + o] == plants[k]]
 
-    n, m = A.shape
-    for i in range(n):
-        for j in range(m):
-            if (i, j) in assigned:
-                continue
-            region = find_region(A, i, j)
-            regions.append(region)
-            assigned.update(region)
+    labels = label_components(len(plants), neighbours, mask=P.reshape(-1) != 0)
 
-    return regions
+    # group the locations (back in A's coords) by label
+    labels = labels.reshape(P.shape)[1:-1, 1:-1].reshape(-1)
+    order = np.argsort(labels, kind="stable")
+    starts = np.flatnonzero(np.diff(labels[order])) + 1
+    m = A.shape[1]
+    return [
+        {(int(k // m), int(k % m)) for k in group} for group in np.split(order, starts)
+    ]
 
 
 def get_region_area(region: set):
@@ -134,19 +103,25 @@ def get_num_horizontal_sides(locs: list):
     return int(sides)
 
 
-def solution_part1(s: str) -> int:
-    """Part 1 solution from the plaintext input"""
-    A = np.array([list(line) for line in s.strip().split("\n")])
-    regions = find_regions(A)
+def prepare(s: str | memoryview) -> list[set]:
+    """Parse the input (text or bytes) once, for both parts
+    Returns the list of locs sets of regions
+    """
+    A = parse_grid(s, copy=False)
+    return find_regions(A)
+
+
+def solution_part1(s: str | list) -> int:
+    """Part 1 solution from the plaintext input (or the output of prepare())"""
+    regions = prepare(s) if isinstance(s, str) else s
     areas = [get_region_area(region) for region in regions]
     perimeters = [get_region_perimeter(region) for region in regions]
     return int(sum(np.array(areas) * np.array(perimeters)))
 
 
-def solution_part2(s: str) -> int:
-    """Part 2 solution from the plaintext input"""
-    A = np.array([list(line) for line in s.strip().split("\n")])
-    regions = find_regions(A)
+def solution_part2(s: str | list) -> int:
+    """Part 2 solution from the plaintext input (or the output of prepare())"""
+    regions = prepare(s) if isinstance(s, str) else s
     areas = [get_region_area(region) for region in regions]
     num_sides = [get_region_num_sides(region) for region in regions]
     return int(sum(np.array(areas) * np.array(num_sides)))
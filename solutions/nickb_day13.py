@@ -11,50 +11,38 @@ And numpy.linalg.solve turns out to be numerically precise enough for us
 
 # pylint: disable=invalid-name, redefined-outer-name
 
-import re
 import math
 import numpy as np
 
 from utils.inputs import get_input
+from utils.ints import int_table
 
 DAY = 13
 
-REGEX = r"Button A: X\+(\d+), Y\+(\d+)\nButton B: X\+(\d+), Y\+(\d+)\nPrize: X=(\d+), Y=(\d+)"
-
 PRESSES_LIMIT_PART1 = 100
 
 OFFSET_PART2 = 10000000000000
 
 
-def parse_game_part1(block):
-    """Parse the 3 lines corresponding to a game for part 1"""
-    ax, ay, bx, by, gx, gy = _parse_game(block)
-    return ax, ay, bx, by, gx, gy
-
-
-def parse_game_part2(block):
-    """Parse the 3 lines corresponding to a game for part 2"""
-    ax, ay, bx, by, gx, gy = _parse_game(block)
-    return ax, ay, bx, by, gx + OFFSET_PART2, gy + OFFSET_PART2
-
+def parse_games(s: str) -> list[tuple]:
+    """Parse the games into tuples ax, ay, bx, by, gx, gy giving the vectors v_a, v_b, v_g
+    The 3 lines of a game have 2 numbers each, so that's every 3 rows of numbers
+    """
+    games = [tuple(game) for game in int_table(s, 2).reshape(-1, 6).tolist()]
+    for game in games:
+        check_game(game)
+    return games
 
-def _parse_game(block):
-    """Helper for the basic parsing"""
-    # extract the numbers
-    res = re.match(REGEX, block.strip())
-    assert res is not None
-    nums = [int(x) for x in res.groups()]
-    assert len(nums) == 6
-    ax, ay, bx, by, gx, gy = tuple(nums)
 
-    # linear independence check using gcd to "reduce" the vectors
-    # I just wanted to avoid any numerical issues for this
+def check_game(game: tuple):
+    """Linear independence check using gcd to "reduce" the vectors
+    I just wanted to avoid any numerical issues for this
+    """
+    ax, ay, bx, by, _, _ = game
     d = math.gcd(ax, ay, bx, by)
     _ax, _ay, _bx, _by = ax // d, ay // d, bx // d, by // d
     assert not (_ax == _ay and _bx == _by)
 
-    return ax, ay, bx, by, gx, gy
-
 
 def get_a_b_for_game(game: tuple) -> tuple[int | None, int | None]:
     """Get the number of A and B presses needed to solve a game
@@ -81,7 +69,7 @@ def get_a_b_for_game(game: tuple) -> tuple[int | None, int | None]:
 def solution_part1(s: str) -> int:
     """Part 1 solution from the plaintext input"""
     # parse games as tuples ax, ay, bx, by, gx, gy giving the vectors v_a, v_b, v_g
-    games = [parse_game_part1(block) for block in s.strip().split("\n\n")]
+    games = parse_games(s)
 
     # solve the games and count up the tokens
     tokens = 0
@@ -100,7 +88,10 @@ def solution_part1(s: str) -> int:
 
 def solution_part2(s: str) -> int:
     """Part 2 solution from the plaintext input"""
-    games = [parse_game_part2(block) for block in s.strip().split("\n\n")]
+    games = [
+        (ax, ay, bx, by, gx + OFFSET_PART2, gy + OFFSET_PART2)
+        for ax, ay, bx, by, gx, gy in parse_games(s)
+    ]
 
     tokens = 0
     for game in games:
@@ -13,11 +13,11 @@ Plus the heuristic idea feels too "hope" based
 
 # pylint: disable=invalid-name, redefined-outer-name
 
-import re
 from collections import defaultdict
 import numpy as np
 
 from utils.inputs import get_input
+from utils.ints import int_table
 
 DAY = 14
 
@@ -58,9 +58,7 @@ def assign_sector(px, py, wx, wy):
 def solution_part1(s: str) -> int:
     """Part 1 solution from the plaintext input"""
     # parse robots into tuples (px, py, vx, vy)
-    robots = [
-        tuple(int(n) for n in re.findall(r"-?\d+", line)) for line in s.split("\n")
-    ]
+    robots = list(map(tuple, int_table(s, 4).tolist()))
 
     # run 100 steps
     for _ in range(100):
@@ -97,9 +95,7 @@ def solution_part2(s: str, print_verification=False) -> int:
     """
 
     if print_verification:
-        robots = [
-            tuple(int(n) for n in re.findall(r"-?\d+", line)) for line in s.split("\n")
-        ]
+        robots = list(map(tuple, int_table(s, 4).tolist()))
 
         for _ in range(7916):
             robots = step_robots(robots, WX, WY)
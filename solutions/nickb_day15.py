@@ -14,10 +14,19 @@ But making sure to avoid infinite recursion when doing that
 
 import numpy as np
 
+from utils.grid import parse_grid, grid_to_string, find_one
 from utils.inputs import get_input
 
 DAY = 15
 
+# the cells of the warehouse (as character codes, see utils.grid)
+EMPTY = ord(".")
+WALL = ord("#")
+ROBOT = ord("@")
+BOX = ord("O")
+BOX_LEFT = ord("[")
+BOX_RIGHT = ord("]")
+
 # translating characters to vectors
 DICT_MOVE_TO_VEC = {
     "^": (-1, 0),
@@ -30,7 +39,7 @@ DICT_MOVE_TO_VEC = {
 def parse_input_part1(s: str) -> tuple[np.ndarray, list[str]]:
     """Parse into an array A and list of move characters (for part 1)"""
     s1, s2 = tuple(s.split("\n\n"))
-    A = np.array([list(line) for line in s1.split("\n")])
+    A = parse_grid(s1)
     moves = list(s2.replace("\n", ""))
     return A, moves
 
@@ -38,16 +47,8 @@ def parse_input_part1(s: str) -> tuple[np.ndarray, list[str]]:
 def parse_input_part2(s: str) -> tuple[np.ndarray, list[str]]:
     """Parse into an array A and list of move characters (for part 2)"""
     s1, s2 = tuple(s.split("\n\n"))
-    A = np.array(
-        [
-            list(
-                line.replace("#", "##")
-                .replace("O", "[]")
-                .replace(".", "..")
-                .replace("@", "@.")
-            )
-            for line in s1.split("\n")
-        ]
+    A = parse_grid(
+        s1.replace("#", "##").replace("O", "[]").replace(".", "..").replace("@", "@.")
     )
     moves = list(s2.replace("\n", ""))
     return A, moves
@@ -58,36 +59,36 @@ def check_move(A: np.ndarray, i: int, j: int, di: int, dj: int) -> bool:
     assert (di, dj) in ((0, 1), (0, -1), (1, 0), (-1, 0))
 
     # if we're moving nothing, then we're trivially successful
-    if A[i, j] == ".":
+    if A[i, j] == EMPTY:
         return True
 
     # if we're moving a wall, we fail
-    if A[i, j] == "#":
+    if A[i, j] == WALL:
         return False
 
     # otherwise we're moving the player or a box
     # so we need to see if the move in front of us would succeed
 
     # player
-    if A[i, j] == "@":
+    if A[i, j] == ROBOT:
         return check_move(A, i + di, j + dj, di, dj)
 
     # single width box
-    if A[i, j] == "O":
+    if A[i, j] == BOX:
         return check_move(A, i + di, j + dj, di, dj)
 
     # double width box from the side
-    if A[i, j] in ("[", "]") and di == 0:
+    if A[i, j] in (BOX_LEFT, BOX_RIGHT) and di == 0:
         return check_move(A, i + di, j + dj, di, dj)
 
     # double width box vertically, pushing the left side of it
-    if A[i, j] == "[" and dj == 0:
+    if A[i, j] == BOX_LEFT and dj == 0:
         return check_move(A, i + di, j + dj, di, dj) and check_move(
             A, i + di, j + dj + 1, di, dj
         )
 
     # double width box vertically, pushing the right side of it
-    if A[i, j] == "]" and dj == 0:
+    if A[i, j] == BOX_RIGHT and dj == 0:
         return check_move(A, i + di, j + dj - 1, di, dj) and check_move(
             A, i + di, j + dj, di, dj
         )
@@ -106,33 +107,33 @@ def make_move(
     assert (di, dj) in ((0, 1), (0, -1), (1, 0), (-1, 0))
 
     # moving nothing
-    if A[i, j] == ".":
+    if A[i, j] == EMPTY:
         return di, dj
 
     # moving a wall
-    if A[i, j] == "#":
+    if A[i, j] == WALL:
         raise Exception("Unable to move a wall")
 
     # do the recursive moves
     did_recursive = False
 
     # player
-    if A[i, j] == "@":
+    if A[i, j] == ROBOT:
         did_recursive = True
         make_move(A, i + di, j + dj, di, dj)
 
     # single width box
-    if A[i, j] == "O":
+    if A[i, j] == BOX:
         did_recursive = True
         make_move(A, i + di, j + dj, di, dj)
 
     # double width box from the side
-    if A[i, j] in ("[", "]") and di == 0:
+    if A[i, j] in (BOX_LEFT, BOX_RIGHT) and di == 0:
         did_recursive = True
         make_move(A, i + di, j + dj, di, dj)
 
     # double width box vertically, pushing the left side of it
-    if A[i, j] == "[" and dj == 0:
+    if A[i, j] == BOX_LEFT and dj == 0:
         did_recursive = True
         make_move(A, i + di, j + dj, di, dj)
         make_move(A, i + di, j + dj + 1, di, dj)
@@ -141,7 +142,7 @@ def make_move(
             make_move(A, i, j + 1, di, dj, double_box_push=False)
 
     # double width box vertically, pushing the right side of it
-    if A[i, j] == "]" and dj == 0:
+    if A[i, j] == BOX_RIGHT and dj == 0:
         did_recursive = True
         make_move(A, i + di, j + dj - 1, di, dj)
         make_move(A, i + di, j + dj, di, dj)
@@ -155,27 +156,27 @@ def make_move(
 
     # and finally move ourselves
     A[i + di, j + dj] = A[i, j]
-    A[i, j] = "."
+    A[i, j] = EMPTY
 
     return i + di, j + dj
 
 
 def find_robot(A: np.ndarray) -> tuple[int]:
     """Returns (i, j) such that A[i, j] = '@'"""
-    return (int(t) for t in next(zip(*np.where(A == "@"))))
+    return find_one(A, ROBOT)
 
 
 def get_box_gps_coords(A: np.ndarray) -> list[int]:
     """Return the list of GPS coords (ints)
     Works for both part 1 and part 2
     """
-    I, J = np.where((A == "O") | (A == "["))
+    I, J = np.where((A == BOX) | (A == BOX_LEFT))
     return [int(t) for t in 100 * I + J]
 
 
 def array_to_string(A: np.ndarray) -> str:
     """Util so that print(array_to_string(A)) prints an array A nicely"""
-    return "\n".join(["".join(line) for line in A])
+    return grid_to_string(A)
 
 
 def solution_part1(s: str) -> int:
@@ -28,6 +28,7 @@ And using generators ('yield' and 'yield from') in the search() function made th
 from typing import Generator
 import re
 
+from utils.counters import COUNTERS
 from utils.inputs import get_input
 
 DAY = 17
@@ -89,6 +90,8 @@ class Computer:
 
     def step(self):
         """A single step in the program"""
+        if COUNTERS.enabled:
+            COUNTERS.add("instructions executed")
         instruction, operand = self.program[self.i], self.program[self.i + 1]
         self.instructions[instruction](operand)
 
@@ -8,30 +8,43 @@ scipy is a bit overkill, but it was the quickest for me to set up
 # pylint: disable=invalid-name, redefined-outer-name
 
 import numpy as np
-from scipy.optimize import bisect
 
+from utils.grid import neighbour_offsets
 from utils.inputs import get_input
+from utils.ints import int_table
+from utils.search import bfs, UNREACHED
+from utils.utilities import lazy_import
+
+optimize = lazy_import("scipy.optimize")
 
 DAY = 18
 
 
-def spread(
-    locs: set[tuple[int, int]],
+def shortest_distance(
+    all_corrupted: list[tuple[int, int]],
+    num_corrupted: int,
     n: int,
-    corrupted: set[tuple[int, int]],
-) -> set[tuple[int, int]]:
-    """Spread the set of locations on a grid with x/y coords 0, ..., n
-    Avoid the locations in 'corrupted'
-    Modifies the variable 'locs' (i.e. in place)
+) -> int:
+    """Number of steps from (0, 0) to (n, n) on a grid with x/y coords 0, ..., n,
+        avoiding the first num_corrupted corrupted bits (UNREACHED if it's impossible)
+    A BFS from utils.search on the flat ids of the grid padded with a corrupted border,
+        so (i, j) is (i + 1) * (n + 3) + j + 1
     """
-    new_locs = set()
-    for i, j in locs:
-        for di, dj in ((0, 1), (0, -1), (1, 0), (-1, 0)):
-            _i, _j = i + di, j + dj
-            if (0 <= _i <= n) and (0 <= _j <= n):
-                new_locs.add((i + di, j + dj))
-    locs = (locs | new_locs) - corrupted
-    return locs
+    m = n + 3
+    is_open = np.zeros((m, m), dtype=bool)
+    is_open[1:-1, 1:-1] = True
+    for i, j in all_corrupted[:num_corrupted]:
+        is_open[i + 1, j + 1] = False
+    is_open = is_open.reshape(-1).tolist()
+    offsets = neighbour_offsets(m).tolist()
+
+    def neighbours(k: int) -> list[int]:
+        return [k + o for o in offsets if is_open[k + o]]
+
+    start = m + 1
+    end = (n + 1) * m + n + 1
+    dist = bfs(len(is_open), [start], neighbours, target=end)
+    return int(dist[end])
 
 
 def check_possible(
@@ -40,22 +53,7 @@ def check_possible(
     n: int,
 ) -> bool:
     """Check if it's possible to reach (n, n) from (0, 0) with the given number of corrupted bits"""
-    corrupted = set(all_corrupted[:num_corrupted])
-
-    locs = {(0, 0)}
-    for _ in range(n * n):
-        len_locs = len(locs)
-        locs = spread(locs, n, corrupted)
-
-        # success if we find the exit
-        if (n, n) in locs:
-            return True
-
-        # stop iterating if we've explored everything we can
-        if len(locs) == len_locs:
-            break
-
-    return False
+    return shortest_distance(all_corrupted, num_corrupted, n) != UNREACHED
 
 
 def bisect_wrapper(x, all_corrupted, n):
@@ -68,36 +66,26 @@ def bisect_wrapper(x, all_corrupted, n):
 def solution_part1(s: str) -> int:
     """Part 1 solution from the plaintext input"""
     # parse into into a list of tuples (i, j) of the bits that'll get corrupted
-    all_corrupted = [
-        (int(t[0]), int(t[1]))
-        for t in np.array(s.strip().replace(",", " ").split()).reshape(-1, 2)
-    ]
+    all_corrupted = list(map(tuple, int_table(s, 2).tolist()))
 
     # hardcoded inputs
     n = 70
     num_corrupted = 1024
 
-    # iterate to reach the exit
-    corrupted = set(all_corrupted[:num_corrupted])
-    locs = {(0, 0)}
-    num_steps = 0
-    while (n, n) not in locs:
-        num_steps += 1
-        locs = spread(locs, n, corrupted)
+    # shortest path to the exit
+    num_steps = shortest_distance(all_corrupted, num_corrupted, n)
+    assert num_steps != UNREACHED, "Can't reach the exit"
 
     return num_steps
 
 
 def solution_part2(s: str) -> int:
     """Part 2 solution from the plaintext input"""
-    all_corrupted = [
-        (int(t[0]), int(t[1]))
-        for t in np.array(s.strip().replace(",", " ").split()).reshape(-1, 2)
-    ]
+    all_corrupted = list(map(tuple, int_table(s, 2).tolist()))
     n = 70
 
     # scipy to handle the bisection search for the fatal number of corruptions
-    root = bisect(
+    root = optimize.bisect(
         bisect_wrapper, 1024, len(all_corrupted), args=(all_corrupted, n), xtol=0.2
     )
     num_of_fatal_corruption = int(np.round(root))
@@ -7,9 +7,8 @@ And then I went back and changed my solution for part 1 to use the one for part
 
 # pylint: disable=invalid-name, redefined-outer-name
 
-from functools import cache
-
 from utils.inputs import get_input
+from utils.memo import memo, scope
 
 DAY = 19
 
@@ -22,11 +21,11 @@ def parse_input(s: str) -> tuple[list[str], list[str]]:
     return towels, designs
 
 
-@cache
-def count_ways(design: str, towels: tuple[str]) -> bool:
+@memo(key=lambda design, towels: design)
+def count_ways(design: str, towels: tuple[str]) -> int:
     """Count how many ways it's possible to build the given design out of the given towels
     Dynamic programming via recursion + caching
-    towels must be a tuple of strings so it's hashable for the caching
+    The cache is keyed on just the design, so only call it within a scope() (one set of towels)
     """
     if design == "":
         return 1
@@ -47,14 +46,16 @@ def solution_part1(s: str) -> int:
     towels = tuple(towels)
 
     # count up how many designs can be made in at least one way
-    return sum(count_ways(design, towels) > 0 for design in designs)
+    with scope():
+        return sum(count_ways(design, towels) > 0 for design in designs)
 
 
 def solution_part2(s: str) -> int:
     """Part 2 solution from the plaintext input"""
     towels, designs = parse_input(s)
     towels = tuple(towels)
-    return sum(count_ways(design, towels) for design in designs)
+    with scope():
+        return sum(count_ways(design, towels) for design in designs)
 
 
 if __name__ == "__main__":
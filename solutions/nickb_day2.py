@@ -1,13 +1,37 @@
-"""Day 2"""
+"""Day 2
+
+The whole input gets checked at once (pack_reports(), safe_reports(), dampened_safe_reports()):
+- the reports get packed into a padded int16 matrix, plus a vector of their lengths
+- a step (diff between neighbouring levels) is good if it's 1 to 3 in the report's direction,
+    and the padding past the end of a report counts as good
+- part 1: all the steps are good, for one of the two directions
+- part 2: removing level i leaves the steps before i - 1 and after i + 1, plus the step bridging
+    level i - 1 to level i + 1, so with prefix/suffix "all good so far" masks (logical_and.accumulate)
+    that's a few array operations for every level of every report, rather than a copy per removal
+For streams of reports, SafetyCounter keeps running totals of the safe and dampened-safe reports,
+    taking reports one at a time (report_safety(), O(report length) in plain python)
+    or chunks of lines at a time (with the whole-input functions above)
+"""
 
 # pylint: disable=invalid-name, redefined-outer-name
 
+from typing import Iterable, Sequence
+import itertools
+
 import numpy as np
 
 from utils.inputs import get_input
+from utils.ints import parse_ints
 
 DAY = 2
 
+# the sizes of step that are allowed (in the report's direction)
+MIN_STEP = 1
+MAX_STEP = 3
+
+# lines per chunk for SafetyCounter.add_lines()
+CHUNK_SIZE = 2**16
+
 
 def parse_line(line):
     return [int(x) for x in line.split()]
@@ -15,29 +39,169 @@ def parse_line(line):
 
 def solution_part1(s: str) -> int:
     """Part 1 solution from the plaintext input"""
-    p = [parse_line(line) for line in s.strip().split("\n")]
-    soln = sum(is_safe(line) for line in p)
-    return soln
+    levels, lengths = pack_reports(s)
+    return int(safe_reports(levels, lengths).sum())
 
 
 def solution_part2(s: str) -> int:
     """Part 2 solution from the plaintext input"""
-    p = [parse_line(line) for line in s.strip().split("\n")]
-    soln = sum(is_safe_dampened(line) for line in p)
-    return soln
-
-
-def is_safe(row):
-    diffs = np.diff(np.array(row))
-    return (
-        (all(diffs >= 0) or all(diffs <= 0))
-        and all(abs(diffs) >= 1)
-        and all(abs(diffs) <= 3)
-    )
-
-
-def is_safe_dampened(row):
-    return any(is_safe(row[:i] + row[i + 1 :]) for i in range(len(row)))
+    levels, lengths = pack_reports(s)
+    return int(dampened_safe_reports(levels, lengths).sum())
+
+
+def pack_reports(s: str) -> tuple[np.ndarray, np.ndarray]:
+    """Parse the reports into a matrix of levels of shape (num reports, longest report),
+    padded with 0s, plus the length of each report
+    Blank lines are skipped
+    """
+    values, offsets = parse_ints(s)
+    # blank lines aren't reports (their rows are empty, so they repeat an offset)
+    offsets = np.unique(offsets)
+    assert not len(values) or np.abs(values).max() < 2**14, "Levels too big for int16"
+    lengths = np.diff(offsets)
+    rows = np.repeat(np.arange(len(lengths)), lengths)
+    columns = np.arange(len(values)) - offsets[rows]
+    levels = np.zeros((len(lengths), lengths.max(initial=0)), dtype=np.int16)
+    levels[rows, columns] = values
+    return levels, lengths
+
+
+def good_steps(steps: np.ndarray, num_steps: np.ndarray, direction: int) -> np.ndarray:
+    """Mask of the steps that are good in the given direction (1 or -1),
+    for a matrix of steps where row k only has num_steps[k] real steps (the rest count as good)
+    """
+    good = (direction * steps >= MIN_STEP) & (direction * steps <= MAX_STEP)
+    good |= np.arange(steps.shape[1]) >= num_steps[:, np.newaxis]
+    return good
+
+
+def safe_reports(levels: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Mask of the safe reports, from the output of pack_reports()"""
+    steps = np.diff(levels, axis=1)
+    safe = np.zeros(len(lengths), dtype=bool)
+    for direction in (1, -1):
+        safe |= good_steps(steps, lengths - 1, direction).all(axis=1)
+    return safe
+
+
+def dampened_safe_reports(levels: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Mask of the reports that are safe after removing at most one level,
+    from the output of pack_reports()
+    """
+    num_reports, width = levels.shape
+    if width < 3:
+        # removing a level leaves at most one, which is always safe
+        return lengths > 0
+    true_column = np.ones((num_reports, 1), dtype=bool)
+
+    steps = np.diff(levels, axis=1)
+    # the steps that jump over a level: level i - 1 to level i + 1, for i from 1 to width - 2
+    bridges = levels[:, 2:] - levels[:, :-2]
+    is_level = np.arange(width) < lengths[:, np.newaxis]
+
+    safe = np.zeros(num_reports, dtype=bool)
+    for direction in (1, -1):
+        good = good_steps(steps, lengths - 1, direction)
+        # before[:, i]: all the steps before level i - 1 are good
+        before = np.logical_and.accumulate(good, axis=1)
+        before = np.concatenate([true_column, true_column, before[:, :-1]], axis=1)
+        # after[:, i]: all the steps after level i + 1 are good
+        after = np.logical_and.accumulate(good[:, ::-1], axis=1)[:, ::-1]
+        after = np.concatenate([after[:, 1:], true_column, true_column], axis=1)
+        # bridge[:, i]: the step from level i - 1 to level i + 1 is good (if there are both)
+        bridge = good_steps(bridges, lengths - 2, direction)
+        bridge = np.concatenate([true_column, bridge, true_column], axis=1)
+        safe |= (before & after & bridge & is_level).any(axis=1)
+    return safe
+
+
+def first_bad_step(levels: Sequence[int], direction: int) -> int:
+    """Index of the first step of the report that isn't good in the direction (1 or -1),
+    or -1 if they're all good
+    """
+    for j in range(len(levels) - 1):
+        if not MIN_STEP <= direction * (levels[j + 1] - levels[j]) <= MAX_STEP:
+            return j
+    return -1
+
+
+def report_safety(levels: Sequence[int]) -> tuple[bool, bool]:
+    """Whether one report is safe, and whether it's safe after removing at most one level
+    O(length of the report): if the first bad step (in a direction) is from level j to level j + 1,
+        removing any other level leaves that step in, so only removing j or j + 1 can help
+    """
+    levels = list(levels)
+    dampened_safe = False
+    for direction in (1, -1):
+        j = first_bad_step(levels, direction)
+        if j == -1:
+            return True, True
+        dampened_safe = dampened_safe or any(
+            first_bad_step(levels[:k] + levels[k + 1 :], direction) == -1
+            for k in (j, j + 1)
+        )
+    return False, dampened_safe
+
+
+class SafetyCounter:
+    """Running totals of the safe and dampened-safe reports, for streams of reports
+    Only the totals are kept between reports, so memory doesn't grow with the stream
+    Lines get stripped (so they can come straight from a file), and blank lines / empty reports
+        aren't reports, so they're skipped
+    """
+
+    def __init__(self):
+        self.reports = 0
+        self.safe = 0
+        self.dampened_safe = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"SafetyCounter(reports={self.reports}, safe={self.safe}, "
+            f"dampened_safe={self.dampened_safe})"
+        )
+
+    def add(self, levels: Sequence[int]):
+        """Count one report, given as its levels"""
+        if not levels:
+            return
+        safe, dampened_safe = report_safety(levels)
+        self.reports += 1
+        self.safe += safe
+        self.dampened_safe += dampened_safe
+
+    def add_line(self, line: str):
+        """Count one report, given as a line of the input"""
+        self.add(parse_line(line.strip()))
+
+    def add_chunk(self, lines: Sequence[str]):
+        """Count a chunk of report lines, all at once (see pack_reports())"""
+        lines = [line for line in map(str.strip, lines) if line]
+        if not lines:
+            return
+        levels, lengths = pack_reports("\n".join(lines))
+        self.reports += len(lengths)
+        self.safe += int(safe_reports(levels, lengths).sum())
+        self.dampened_safe += int(dampened_safe_reports(levels, lengths).sum())
+
+    def add_lines(self, lines: Iterable[str], chunk_size: int = CHUNK_SIZE):
+        """Count a stream of report lines (ex. a generator), chunk_size lines at a time
+        Returns self, for chaining
+        """
+        lines = iter(lines)
+        while chunk := list(itertools.islice(lines, chunk_size)):
+            self.add_chunk(chunk)
+        return self
+
+
+def solution_part1_lines(lines: Iterable[str]) -> int:
+    """Part 1 solution streaming the lines (ex. from utils.inputs.iter_input_lines())"""
+    return SafetyCounter().add_lines(lines).safe
+
+
+def solution_part2_lines(lines: Iterable[str]) -> int:
+    """Part 2 solution streaming the lines (ex. from utils.inputs.iter_input_lines())"""
+    return SafetyCounter().add_lines(lines).dampened_safe
 
 
 if __name__ == "__main__":
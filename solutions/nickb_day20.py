@@ -14,54 +14,47 @@ Also, I should probably make standard utils for things like array parsing and sh
 
 # pylint: disable=invalid-name, redefined-outer-name
 
-from collections import defaultdict
 import numpy as np
-import pandas as pd
 
+from utils.grid import parse_grid, find_one, neighbour_offsets, pad
 from utils.inputs import get_input
+from utils.search import bfs, UNREACHED
+from utils.utilities import lazy_import
 
-DAY = 20
-
-
-def parse_array(s: str) -> np.ndarray:
-    """Parse the input into a numpy array"""
-    return np.array([list(line) for line in s.strip().split("\n")])
+pd = lazy_import("pandas")
 
+DAY = 20
 
-def find_i_j_list(A: np.ndarray, target: str) -> list[tuple[int]]:
-    """Returns all (i, j) such that A[i, j] = target"""
-    return [(int(t[0]), int(t[1])) for t in zip(*np.where(A == target))]
+# prepare() can take the input as bytes (see utils.inputs.get_input_bytes())
+INPUT_BYTES = True
 
 
-def spread(A: np.ndarray, locs: set[tuple[int, int]]) -> set[tuple[int, int]]:
-    """Spread the set of locations to neighboring non-wall locations"""
-    locs_new = set()
-    for i, j in locs:
-        for di, dj in ((0, 1), (0, -1), (1, 0), (-1, 0)):
-            _i, _j = i + di, j + dj
-            if A[_i, _j] != "#":
-                locs_new.add((_i, _j))
-    return locs_new
+def parse_array(s: str | memoryview) -> np.ndarray:
+    """Parse the input into a numpy array (of character codes, see utils.grid)"""
+    return parse_grid(s, copy=False)
 
 
 def get_distances(A: np.ndarray) -> dict[tuple[int, int], int]:
     """For each non-wall location in A, find its distance to E
-    This is just Dijkstra
+    A BFS from utils.search, on the flat ids of A padded with walls
     """
-    iE, jE = find_i_j_list(A, "E")[0]
-    distances = defaultdict(lambda: np.inf)
-    distances[(iE, jE)] = 0
-    covered = {(iE, jE)}
-    frontier = [(iE, jE)]
-    d = 0
-    while frontier:
-        frontier = spread(A, frontier)
-        frontier = frontier - covered
-        d += 1
-        for i, j in frontier:
-            distances[(i, j)] = min(distances[(i, j)], d)
-        covered.update(frontier)
-    return dict(distances)
+    P = pad(A, "#")
+    m = P.shape[1]
+    is_open = (P.reshape(-1) != ord("#")).tolist()
+    offsets = neighbour_offsets(m).tolist()
+
+    def neighbours(k: int) -> list[int]:
+        return [k + o for o in offsets if is_open[k + o]]
+
+    iE, jE = find_one(P, "E")
+    dist = bfs(len(is_open), [iE * m + jE], neighbours)
+
+    # back to A's coords
+    reached = np.flatnonzero(dist != UNREACHED)
+    return {
+        (int(k // m) - 1, int(k % m) - 1): int(d)
+        for k, d in zip(reached, dist[reached])
+    }
 
 
 def get_cheats(
@@ -95,13 +88,18 @@ def get_cheat_moves(r: int) -> list[tuple[int, int]]:
     return cheat_moves
 
 
-def solution_part1(s: str) -> int:
-    """Part 1 solution from the plaintext input"""
-    # parse input into a numpy array
+def prepare(s: str | memoryview) -> dict[tuple[int, int], int]:
+    """Parse the input (text or bytes) once, for both parts
+    Returns the dictionary matching each (i, j) to its distance to E
+    """
     A = parse_array(s)
+    return get_distances(A)
 
-    # get the dictionary matching each (i, j) to its distance to E
-    distances = get_distances(A)
+
+def solution_part1(s: str | dict) -> int:
+    """Part 1 solution from the plaintext input (or the output of prepare())"""
+    # parse input into a numpy array, then get the dictionary matching each (i, j) to its distance to E
+    distances = prepare(s) if isinstance(s, str) else s
 
     # figure out all possible cheats within our 2 picosecond radius
     cheat_moves = get_cheat_moves(2)
@@ -117,10 +115,9 @@ def solution_part1(s: str) -> int:
     return num_cheats
 
 
-def solution_part2(s: str) -> int:
-    """Part 2 solution from the plaintext input"""
-    A = parse_array(s)
-    distances = get_distances(A)
+def solution_part2(s: str | dict) -> int:
+    """Part 2 solution from the plaintext input (or the output of prepare())"""
+    distances = prepare(s) if isinstance(s, str) else s
     cheat_moves = get_cheat_moves(20)
     cheats = get_cheats(distances, cheat_moves)
     num_cheats = int((pd.Series(cheats) >= 100).sum())
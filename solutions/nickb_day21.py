@@ -50,10 +50,10 @@ cycles_for_segment() for finding the cycles that achieve a segment (with caching
 # pylint: disable=invalid-name, redefined-outer-name
 
 from typing import Self
-from functools import cache
 import numpy as np
 
 from utils.inputs import get_input
+from utils.memo import memo
 
 DAY = 21
 
@@ -94,7 +94,7 @@ class ArrowKeys:
         # locations of keys
         self.KEYS_LOCS = set(self.KEYS.values())
 
-    @cache
+    @memo()
     def calc_min_num_presses_for_cycle(self, cycle: str) -> int:
         """Return the number of presses needed for the given cycle"""
         # basic check
@@ -135,7 +135,7 @@ class ArrowKeys:
 
         return num_presses_cycle
 
-    @cache
+    @memo()
     def cycles_for_segment(self, i1, j1, i2, j2) -> list[str]:
         """Returns a list of the minimum length cycles achieving the segment (i1, j1) -> (i2, j2)
         Makes sure we never leave the number pad
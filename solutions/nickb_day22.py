@@ -6,12 +6,18 @@ Runs in 25 seconds
 # pylint: disable=invalid-name, redefined-outer-name
 
 from collections import defaultdict
+from typing import Generator, Iterable
+import itertools
 import numpy as np
 
 from utils.inputs import get_input
+from utils.ints import parse_ints
 
 DAY = 22
 
+# prepare() can take the input as bytes (see utils.inputs.get_input_bytes())
+INPUT_BYTES = True
+
 MODULUS = 16777216
 
 
@@ -36,28 +42,54 @@ def steps(x, n):
     return x
 
 
-def solution_part1(s: str) -> int:
-    """Part 1 solution from the plaintext input"""
-    secret_numbers = [int(x) for x in s.strip().split()]
-    secret_numbers = [steps(x, 2000) for x in secret_numbers]
-    return sum(secret_numbers)
+def prepare(s: str | memoryview) -> np.ndarray:
+    """Parse the input once, for both parts
+    Returns the secret numbers for each monkey and each 'round' (see simulate())
+    """
+    values, _ = parse_ints(s, signed=False)
+    return simulate(values)
+
+
+def simulate(x: np.ndarray) -> np.ndarray:
+    """The secret numbers for each monkey and each 'round', shape (num monkeys, 2001),
+    from the initial secret numbers x
+    step() works elementwise on numpy arrays, so every monkey gets stepped at once
+    """
+    secrets = np.empty((2001, len(x)), dtype=np.int64)
+    secrets[0] = x
+    for k in range(2000):
+        x = step(x)
+        secrets[k + 1] = x
+    return secrets.transpose()
+
+
+def solution_part1(s: str | np.ndarray) -> int:
+    """Part 1 solution from the plaintext input (or the output of prepare())"""
+    secrets = prepare(s) if isinstance(s, str) else s
+    return int(secrets[:, -1].sum())
 
 
-def solution_part2(s: str) -> int:
-    """Part 2 solution from the plaintext input"""
-    secret_numbers = [int(x) for x in s.strip().split()]
+def solution_part2(s: str | np.ndarray) -> int:
+    """Part 2 solution from the plaintext input (or the output of prepare())"""
+    secrets = prepare(s) if isinstance(s, str) else s
+
+    # a dictionary that maps sequences of 4 diffs to the number of bananas they give us
+    sequences_to_bananas = defaultdict(int)
+    tally_bananas(secrets, sequences_to_bananas)
+
+    # the most bananas obtained out of all the sequences
+    most_bananas = max(sequences_to_bananas.values())
 
-    # this variable will track the prices of bananas for each 'round'
-    rounds = [[x % 10 for x in secret_numbers]]
+    return most_bananas
 
-    # populate the prices
-    for _ in range(2000):
-        secret_numbers = [step(x) for x in secret_numbers]
-        rounds.append([x % 10 for x in secret_numbers])
 
-    # convert to a numpy array
+def tally_bananas(secrets: np.ndarray, sequences_to_bananas: dict):
+    """Add the bananas each sequence of 4 diffs gets from these monkeys
+    into the sequences_to_bananas dictionary
+    """
+    # the prices of bananas for each 'round'
     # prices.shape = (1811, 2001)
-    prices = np.array(rounds).transpose()
+    prices = secrets % 10
 
     # get the changes in prices
     # diffs.shape = (1811, 2000)
@@ -67,9 +99,6 @@ def solution_part2(s: str) -> int:
     # that way we only buy the first time the sequence comes up (per monkey)
     seen = set()
 
-    # a dictionary that maps sequences of 4 diffs to the number of bananas they give us
-    sequences_to_bananas = defaultdict(int)
-
     # iterate over sequences of 4 diffs to populate the dictionary
     for i in range(diffs.shape[1] - 3):
         # the sequences of 4 diffs that appear
@@ -85,10 +114,33 @@ def solution_part2(s: str) -> int:
                 sequences_to_bananas[seq] += banana
             seen.add((i, seq))
 
-    # the most bananas obtained out of all the sequences
-    most_bananas = max(sequences_to_bananas.values())
 
-    return most_bananas
+def iter_secrets(
+    lines: Iterable[str], batch_size: int = 256
+) -> Generator[np.ndarray, None, None]:
+    """Simulate the monkeys batch_size lines at a time, yielding simulate() for each batch
+    Blank lines are skipped
+    """
+    lines = (line for line in map(str.strip, lines) if line)
+    while batch := list(itertools.islice(lines, batch_size)):
+        yield simulate(np.array(batch, dtype=np.int64))
+
+
+def solution_part1_lines(lines: Iterable[str]) -> int:
+    """Part 1 solution streaming the lines (ex. from utils.inputs.iter_input_lines())
+    Only holds one batch of monkeys' secret numbers at a time
+    """
+    return sum(int(secrets[:, -1].sum()) for secrets in iter_secrets(lines))
+
+
+def solution_part2_lines(lines: Iterable[str]) -> int:
+    """Part 2 solution streaming the lines (ex. from utils.inputs.iter_input_lines())
+    Only holds one batch of monkeys' secret numbers at a time (plus the banana tally)
+    """
+    sequences_to_bananas = defaultdict(int)
+    for secrets in iter_secrets(lines):
+        tally_bananas(secrets, sequences_to_bananas)
+    return max(sequences_to_bananas.values())
 
 
 if __name__ == "__main__":
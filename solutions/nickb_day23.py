@@ -5,14 +5,15 @@ networkx is doing most of the work, especially for part 2
 
 # pylint: disable=invalid-name, redefined-outer-name
 
-import networkx as nx
-
 from utils.inputs import get_input
+from utils.utilities import lazy_import
+
+nx = lazy_import("networkx")
 
 DAY = 23
 
 
-def parse_input(s: str) -> nx.Graph:
+def parse_input(s: str) -> "nx.Graph":
     """Parse the input into a networkx graph"""
     return nx.from_edgelist([line.split("-") for line in s.split("\n")])
 
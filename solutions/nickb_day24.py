@@ -26,9 +26,12 @@ from abc import ABC, abstractmethod
 from typing import Self
 
 import numpy as np
-import networkx as nx
 
 from utils.inputs import get_input
+from utils.utilities import lazy_import
+
+# only used for drawing
+nx = lazy_import("networkx")
 
 DAY = 24
 
@@ -222,7 +225,7 @@ def get_gate_node_name(gate: Gate):
 
 
 def draw_subgraph(
-    G: nx.DiGraph,
+    G: "nx.DiGraph",
     I: list[int],
     r=3,
     k=20,
@@ -7,9 +7,9 @@ Nothing fancy, just iterate over locks and keys to see if they fit
 
 import numpy as np
 
+from utils.grid import parse_grid
 from utils.inputs import get_input
 
-
 DAY = 25
 
 
@@ -29,8 +29,8 @@ def parse_input(s: str) -> tuple[list[np.ndarray], list[np.ndarray]]:
         assert A.shape == (n, m)
         top_row = A[0, :]
         bottom_row = A[-1, :]
-        is_lock = all(top_row == "#")
-        is_key = all(bottom_row == "#")
+        is_lock = all(top_row == ord("#"))
+        is_key = all(bottom_row == ord("#"))
         assert is_lock ^ is_key
         if is_lock:
             locks.append(A)
@@ -41,8 +41,8 @@ def parse_input(s: str) -> tuple[list[np.ndarray], list[np.ndarray]]:
 
 
 def parse_block(block: str) -> np.ndarray:
-    """Parse a string into a np array"""
-    A = np.array([list(line) for line in block.split("\n")])
+    """Parse a string into a np array (of character codes, see utils.grid)"""
+    A = parse_grid(block)
     return A
 
 
@@ -55,7 +55,7 @@ def solution_part1(s: str) -> int:
     num_fit = 0
     for lock in locks:
         for key in keys:
-            overlap = (lock == "#") & (lock == key)
+            overlap = (lock == ord("#")) & (lock == key)
             if not overlap.any():
                 num_fit += 1
 
@@ -4,6 +4,7 @@
 
 import numpy as np
 
+from utils.grid import parse_grid
 from utils.inputs import get_input
 
 DAY = 4
@@ -14,7 +15,7 @@ def solution_part1(s: str) -> int:
     I manually coded in the 8 relative positions (horizontal, vertical, diagonal) that an 'XMAS' could appear in
     The code (inefficiently) loops through all shifts of these to look for 'XMAS'es
     """
-    A = np.array([list(line) for line in s.strip().split("\n")])
+    A = parse_grid(s)
 
     c = 0
 
@@ -45,8 +46,8 @@ def solution_part1(s: str) -> int:
                 ):
                     continue
 
-                text = "".join(A[_idx_x, _idx_y])
-                if text == "XMAS":
+                text = A[_idx_x, _idx_y].tobytes()
+                if text == b"XMAS":
                     c = c + 1
 
     return c
@@ -57,7 +58,7 @@ def solution_part2(s: str) -> int:
     For this part we just need one "pattern", and we can match it to 4 'X-MAS'es
     The 4 correspond to the 4 rotations of the X
     """
-    A = np.array([list(line) for line in s.strip().split("\n")])
+    A = parse_grid(s)
 
     c = 0
 
@@ -68,10 +69,10 @@ def solution_part2(s: str) -> int:
     idx_y = [0, -1, 1, 1, -1]
 
     matches = [
-        "AMMSS",
-        "AMSSM",
-        "ASSMM",
-        "ASMMS",
+        b"AMMSS",
+        b"AMSSM",
+        b"ASSMM",
+        b"ASMMS",
     ]
 
     for offset_x in range(-padding, n + padding + 1):
@@ -87,7 +88,7 @@ def solution_part2(s: str) -> int:
             ):
                 continue
 
-            text = "".join(A[_idx_x, _idx_y])
+            text = A[_idx_x, _idx_y].tobytes()
             if text in matches:
                 c = c + 1
 
@@ -19,9 +19,11 @@ And the longest path can be found by ordering the printing according to the
 from functools import cache
 
 from frozendict import frozendict
-import pandas as pd
 
 from utils.inputs import get_input
+from utils.utilities import lazy_import
+
+pd = lazy_import("pandas")
 
 DAY = 5
 
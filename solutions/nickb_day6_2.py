@@ -6,8 +6,8 @@ Faster that my other solution since it works with sets of locations instead of t
 
 # pylint: disable=invalid-name, redefined-outer-name
 
-import numpy as np
-
+from utils.counters import COUNTERS
+from utils.grid import parse_grid, find_all
 from utils.inputs import get_input
 
 DAY = 6
@@ -85,6 +85,8 @@ class Lab:
 
         if (i, j) not in self.wall_locs:
             # forward step worked
+            if COUNTERS.enabled:
+                COUNTERS.add("guard steps")
             self.guard_location = (i, j)
             key = (self.guard_location, self.guard_direction)
             self.looped = key in self.history
@@ -92,6 +94,8 @@ class Lab:
             return
 
         # otherwise, the guard rotates and tries again
+        if COUNTERS.enabled:
+            COUNTERS.add("guard turns")
         self.guard_direction = self.ROTATIONS[self.guard_direction]
         self.step()
 
@@ -127,26 +131,20 @@ class Lab:
 
 def parse_input(s):
     """Parse input into the things needed to make a Lab object"""
-    A = np.array([list(line) for line in s.strip().split("\n")])
+    A = parse_grid(s)
 
     min_i, min_j = 0, 0
     max_i, max_j = A.shape[0] - 1, A.shape[1] - 1
 
-    wall_locs = set()
-    guard_location = None
-    guard_direction = None
-
-    for i in range(min_i, max_i + 1):
-        for j in range(min_j, max_j + 1):
-            if A[i, j] == "#":
-                wall_locs.add((i, j))
-            if A[i, j] in ("^", ">", "v", "<"):
-                assert guard_location is None
-                guard_location = (i, j)
-                guard_direction = str(A[i, j])
-
-    assert guard_location is not None
-    assert guard_direction is not None
+    wall_locs = set(find_all(A, "#"))
+
+    guards = [
+        (location, direction)
+        for direction in Lab.DIRECTIONS
+        for location in find_all(A, direction)
+    ]
+    assert len(guards) == 1
+    guard_location, guard_direction = guards[0]
 
     return min_i, max_i, min_j, max_j, wall_locs, guard_location, guard_direction
 
@@ -6,8 +6,11 @@ Faster solution (4 seconds) doing it recursively with pruning
 # pylint: disable=invalid-name, redefined-outer-name
 
 from collections import deque
+from typing import Iterable
 
+from utils.counters import COUNTERS
 from utils.inputs import get_input
+from utils.ints import parse_ints
 
 DAY = 7
 
@@ -17,6 +20,16 @@ def parse_line(line):
     return tuple(map(int, line.replace(":", "").split(" ")))
 
 
+def parse_input(s: str) -> list[list[int]]:
+    """Parse the whole input, ex. "190: 10 19" to [190, 10, 19] for each line
+    As python ints, since the concatenations can overflow an int64
+    """
+    values, offsets = parse_ints(s, signed=False)
+    values = values.tolist()
+    offsets = offsets.tolist()
+    return [values[a:b] for a, b in zip(offsets[:-1], offsets[1:])]
+
+
 def plus(a, b):
     return a + b
 
@@ -37,6 +50,9 @@ def check_solvable(num: int, remaining_nums: deque, ops: list[str], target: int)
     """Check if from num we can get to target with the remaining nums using operations from ops
     Recursive, with pruning if we overshoot the target (valid since the operations are "monotonic" because the input doesn't have 0s)
     """
+    if COUNTERS.enabled:
+        COUNTERS.add("check_solvable calls")
+
     # base case
     if len(remaining_nums) == 0:
         return num == target
@@ -56,7 +72,7 @@ def check_solvable(num: int, remaining_nums: deque, ops: list[str], target: int)
 
 def solution_part1(s: str):
     """Part 1 solution from the plaintext input"""
-    lines = list(map(parse_line, s.strip().split("\n")))
+    lines = parse_input(s)
 
     # confirming no lines have zeros, so the pruning in check_solvable() is valid
     assert min(map(min, lines)) > 0
@@ -71,7 +87,7 @@ def solution_part1(s: str):
 
 def solution_part2(s: str):
     """Part 2 solution from the plaintext input"""
-    lines = list(map(parse_line, s.strip().split("\n")))
+    lines = parse_input(s)
 
     # confirming no lines have zeros, so the pruning in check_solvable() is valid
     assert min(map(min, lines)) > 0
@@ -84,6 +100,28 @@ def solution_part2(s: str):
     return c
 
 
+def solve_lines(lines: Iterable[str], ops: list) -> int:
+    """Total of the targets of the solvable lines, one line at a time (blank lines are skipped)"""
+    c = 0
+    lines = (line for line in map(str.strip, lines) if line)
+    for line in map(parse_line, lines):
+        # no zeros, so the pruning in check_solvable() is valid
+        assert min(line) > 0
+        if check_solvable(line[1], deque(line[2:]), ops, line[0]):
+            c = c + line[0]
+    return c
+
+
+def solution_part1_lines(lines: Iterable[str]) -> int:
+    """Part 1 solution streaming the lines (ex. from utils.inputs.iter_input_lines())"""
+    return solve_lines(lines, OPS1)
+
+
+def solution_part2_lines(lines: Iterable[str]) -> int:
+    """Part 2 solution streaming the lines (ex. from utils.inputs.iter_input_lines())"""
+    return solve_lines(lines, OPS2)
+
+
 if __name__ == "__main__":
     s = get_input(DAY)
     print()
@@ -8,10 +8,9 @@ The key things were
 # pylint: disable=invalid-name, redefined-outer-name
 
 import itertools
-from collections import defaultdict
 import math
-import numpy as np
 
+from utils.grid import parse_grid, index_values
 from utils.inputs import get_input
 
 DAY = 8
@@ -22,15 +21,10 @@ def parse_input(s: str) -> tuple[int, int, dict]:
     Plus the dimensions of the grid
     antennas[freq] gives a list of locations (i, j) of antennas at that frequency
     """
-    A = np.array([list(line) for line in s.strip().split("\n")])
+    A = parse_grid(s)
     n, m = A.shape
 
-    antennas = defaultdict(list)
-    for i in range(n):
-        for j in range(m):
-            c = str(A[i, j])
-            if c != ".":
-                antennas[c].append((i, j))
+    antennas = index_values(A, skip=".")
 
     return n, m, antennas
 
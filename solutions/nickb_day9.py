@@ -123,7 +123,8 @@ def solution_part1(s: str) -> int:
         disk[j] = disk[i]
         disk[i] = -1
 
-    # compute answer
+    # compute answer (gaps count as zeros)
+    disk[disk == -1] = 0
     soln = int(sum(np.array(disk) * np.array(range(len(disk)))))
 
     return soln
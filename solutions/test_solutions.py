@@ -5,21 +5,89 @@ The key functions are
 test_all()
 test_day()
 test_file()
-"""
 
-# pylint: disable=bare-except
+test_all(jobs=8) (or "python ./solutions/test_solutions.py --jobs 8") runs the solutions
+    in a process pool, so the whole thing takes about as long as the slowest day
+
+Solution files can optionally define prepare(s) to parse the input once
+If they do, prepare(s) gets timed separately and both parts are passed its output
+
+Extra options for digging into where time/memory goes (also as command line switches):
+- profile=True (--profile) runs each part under cProfile and writes a .pstats file per module and part
+    to the profiles/ folder (view with "python -m pstats profiles/nickb_day12_part1.pstats")
+- memory=True (--memory) tracks each part with tracemalloc, reporting the peak and the
+    top allocation sites (as of the largest snapshot taken while the part ran)
+- counters=True (--counters) turns on utils.counters, reporting the work each part did
+    (guard steps, nodes expanded, etc.) next to its seconds, and the work prepare() did
+
+Answers get cached in answers_cache.sqlite, keyed on the input and solution source hashes,
+    so re-running only recomputes what changed
+- force=True (--force) recomputes everything anyway
+- cache=False (--no-cache) skips the cache completely
+
+Failures get reported with their traceback, and a runaway part can be contained:
+- timeout=60 (--timeout 60) and/or memory_limit=4096 (--memory-limit 4096, in MiB)
+    run each part in its own child process, killing it after the timeout and capping
+    its address space (RLIMIT_AS)
+- Parts then report a status of correct/INCORRECT/ERRORED/TIMEOUT/OUT OF MEMORY
+
+Each part runs in its own utils.memo scope (caches start empty), and the report gives the
+    hits/misses/evictions of any memo caches it used
+
+Some days have more than one implementation (ALTERNATIVES has the ones not in CONFIG)
+compare_implementations() (--compare, optionally with --generated-size) runs them all on the same
+    input, checks they agree, and prints a table of their runtime and peak memory
+
+report_import_times() (--import-times) imports each solution file in a fresh interpreter
+    and reports how long the import took, plus the heaviest packages it pulled in
+"""
 
 import os
 import sys
+import argparse
+import contextlib
+import cProfile
+import functools
+import glob
+import hashlib
 import importlib
+import json
+import multiprocessing
+import numbers
+import signal
+import sqlite3
+import subprocess
+import textwrap
+import threading
 import time
+import traceback
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
 import toml
-from utils.inputs import get_input
+from utils import memo
+from utils.counters import counting, format_counts
+from utils.generators import generate
+from utils.inputs import get_input, get_input_bytes, read_input
+from utils.utilities import load_lazy_imports
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows, so memory limits just don't get applied there
+    resource = None
 
 CURRENT_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
 
 ANSWERS_TOML = "answers.toml"
 
+# SQLite cache of computed answers, see AnswerCache
+ANSWERS_CACHE = "answers_cache.sqlite"
+
+FOLDER_UTILS = os.path.join(os.path.dirname(CURRENT_DIRECTORY), "utils")
+
+# where --profile writes .pstats files
+FOLDER_PROFILES = os.path.join(os.path.dirname(CURRENT_DIRECTORY), "profiles")
+
 # listing out the days, actual solutions, and my solution files
 CONFIG = [
     # (day, file name)
@@ -27,14 +95,10 @@ CONFIG = [
     (2, "nickb_day2.py"),
     (3, "nickb_day3.py"),
     (4, "nickb_day4.py"),
-    # (5, "nickb_day5.py"),
     (5, "nickb_day5_2.py"),
-    # (6, "nickb_day6.py"),
     (6, "nickb_day6_2.py"),
-    # (7, "nickb_day7.py"),
     (7, "nickb_day7_2.py"),
     (8, "nickb_day8.py"),
-    # (9, "nickb_day9.py"),
     (9, "nickb_day9_2.py"),
     (10, "nickb_day10.py"),
     (11, "nickb_day11.py"),
@@ -54,6 +118,16 @@ CONFIG = [
     (25, "nickb_day25.py"),
 ]
 
+# other implementations of some days (older/slower ones), day -> list of file names
+# They don't get run by test_all() etc., but compare_implementations() checks they agree with
+#     the CONFIG file and compares their runtime and peak memory
+ALTERNATIVES = {
+    5: ["nickb_day5.py"],
+    6: ["nickb_day6.py"],
+    7: ["nickb_day7.py"],
+    9: ["nickb_day9.py"],
+}
+
 # add current path to system path to simplify module imports
 sys.path.append(CURRENT_DIRECTORY)
 
@@ -61,30 +135,26 @@ with open(os.path.join(CURRENT_DIRECTORY, ANSWERS_TOML), "r", encoding="utf-8")
     ANSWERS = toml.load(f)
 
 
-def test_all() -> bool:
-    """Test all solutions"""
-    success = True
-    for line in CONFIG:
-        success = success & test_solution(*line)
-        print()
-    return success
+def test_all(jobs: int = 1, **options) -> bool:
+    """Test all solutions
+    With jobs > 1, each (day, file name) runs in a worker from a process pool
+    Reports still get printed in day order
+    options get passed along to run_solution()
+    """
+    return run_and_report(CONFIG, jobs, **options)
 
 
-def test_day(day: int) -> bool:
+def test_day(day: int, **options) -> bool:
     """Test all solutions for the given day"""
     lines = []
     for line in CONFIG:
         if line[0] == day:
             lines.append(line)
     assert len(lines) >= 1, f"Day {day} not found in config"
-    success = True
-    for line in lines:
-        success = success & test_solution(*line)
-        print()
-    return success
+    return run_and_report(lines, **options)
 
 
-def test_file(file_name: str) -> bool:
+def test_file(file_name: str, **options) -> bool:
     """Test the solutions for the given file name"""
     lines = []
     for line in CONFIG:
@@ -92,11 +162,318 @@ def test_file(file_name: str) -> bool:
             lines.append(line)
     assert len(lines) >= 1, f"File {file_name} not found in config"
     assert len(lines) <= 1, f"File {file_name} found multiple times in config"
-    return test_solution(*line)
+    return test_solution(*lines[0], **options)
 
 
-def test_solution(day, file_name) -> bool:
+def run_and_report(lines: list[tuple[int, str]], jobs: int = 1, **options) -> bool:
+    """Run the solutions for the given config lines, print the reports in order
+    Return a boolean for whether they all succeeded
+    """
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            # map() hands back results in submission order, so reports stay in day order
+            reports = executor.map(
+                functools.partial(run_solution, **options), *zip(*lines)
+            )
+            success = True
+            for report in reports:
+                success = success & print_report(report)
+                print()
+        return success
+
+    success = True
+    for line in lines:
+        success = success & test_solution(*line, **options)
+        print()
+    return success
+
+
+def test_solution(day, file_name, **options) -> bool:
     """Test a solution, print a report, return a boolean for whether it succeeded"""
+    report = run_solution(day, file_name, **options)
+    return print_report(report)
+
+
+class PeakMemoryTracker(threading.Thread):
+    """Context manager tracking memory with tracemalloc while a part runs
+    A snapshot after the part returns would miss everything it freed along the way,
+        so a background thread polls and re-snapshots whenever traced memory hits a new high
+    """
+
+    def __init__(self, interval: float = 0.05):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.stop_event = threading.Event()
+        self.snapshot = None
+        self.snapshot_size = -1
+        self.peak = 0
+
+    def __enter__(self):
+        tracemalloc.start()
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop_event.set()
+        self.join()
+        self.check()
+        self.peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            self.check()
+
+    def check(self):
+        """Take a new snapshot if traced memory is the highest it's been"""
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.snapshot_size:
+            self.snapshot_size = current
+            self.snapshot = tracemalloc.take_snapshot()
+
+    def top_sites(self, limit: int = 5) -> list[str]:
+        """The top allocation sites (by size) in the biggest snapshot"""
+        snapshot = self.snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, threading.__file__),
+                tracemalloc.Filter(False, __file__),
+            ]
+        )
+        return [str(stat) for stat in snapshot.statistics("lineno")[:limit]]
+
+
+class AnswerCache:
+    """On-disk cache of answers (SQLite, next to answers.toml)
+    Keyed on (hash of the input, hash of the solution source, part)
+    Stores the answer and how long it took to compute
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path or os.path.join(CURRENT_DIRECTORY, ANSWERS_CACHE)
+        # long timeout since parallel workers can be writing at the same time
+        self.connection = sqlite3.connect(self.path, timeout=60)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS answers ("
+                "input_hash TEXT, source_hash TEXT, part INTEGER, answer TEXT, seconds REAL, "
+                "PRIMARY KEY (input_hash, source_hash, part))"
+            )
+
+    def get(self, input_hash: str, source_hash: str, part: int) -> tuple | None:
+        """Return (answer, seconds) if it's in the cache, otherwise None"""
+        row = self.connection.execute(
+            "SELECT answer, seconds FROM answers "
+            "WHERE input_hash = ? AND source_hash = ? AND part = ?",
+            (input_hash, source_hash, part),
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def put(self, input_hash: str, source_hash: str, part: int, answer, seconds: float):
+        """Store an answer (must be an int or a str)"""
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?)",
+                (input_hash, source_hash, part, json.dumps(answer), seconds),
+            )
+
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
+
+
+def load_input(module, day: int = None, path: str = None) -> str | memoryview:
+    """The input for a solution module, from the inputs folder (day) or from a file (path)
+    Bytes (a memoryview) if the module sets INPUT_BYTES = True, meaning its prepare() takes bytes,
+        otherwise text
+    """
+    as_bytes = getattr(module, "INPUT_BYTES", False)
+    if path is not None:
+        return read_input(path, as_bytes)
+    return get_input_bytes(day) if as_bytes else get_input(day)
+
+
+def hash_input(s: str | memoryview) -> str:
+    """Hash of the input (the same for the text and the bytes of an input)"""
+    if isinstance(s, str):
+        s = s.encode("utf-8")
+    return hashlib.sha256(s).hexdigest()
+
+
+def hash_source(module) -> str:
+    """Hash of a solution module's source, plus the utils package it can depend on
+    (conservative: editing anything in utils/ invalidates every cached answer)
+    """
+    paths = [module.__file__] + sorted(
+        glob.glob(os.path.join(FOLDER_UTILS, "**", "*.py"), recursive=True)
+    )
+    h = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as file:
+            h.update(file.read())
+    return h.hexdigest()
+
+
+def check_answer(answer, soln) -> bool:
+    """Check an answer against the solution from answers.toml"""
+    if isinstance(soln, str):
+        # cast answer to string if the solution is a string
+        return bool(str(answer) == soln)
+    return bool(answer == soln)
+
+
+def run_part(
+    solution: callable,
+    s,
+    profile_path: str = None,
+    memory: bool = False,
+    memory_limit: int = None,
+    counters: bool = False,
+) -> dict:
+    """Run one part of a solution, returning a dictionary describing what happened
+    "status" is one of "ok", "errored", "oom" (plus "timeout" from run_part_isolated())
+    profile_path: if given, run under cProfile and write the stats there
+    memory: track peak memory and top allocation sites
+    memory_limit: if given, cap the address space of this process at that many MiB
+        (only sensible in a child process, see run_part_isolated())
+    counters: turn on utils.counters, "counters" gives the counts
+    The part runs in its own utils.memo scope, "memo" gives the stats of the caches it used
+    """
+    if memory_limit is not None and resource is not None:
+        limit = memory_limit * 2**20
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    profiler = cProfile.Profile() if profile_path else None
+    tracker = PeakMemoryTracker() if memory else None
+    result = {"status": "ok", "answer": None, "traceback": None}
+    memo_stats = {}
+    counts = {}
+    start = time.time()
+    try:
+        with profiler or contextlib.nullcontext(), tracker or contextlib.nullcontext():
+            with (
+                memo.scope() as memo_stats,
+                counting() if counters else contextlib.nullcontext(counts) as counts,
+            ):
+                answer = solution(s)
+        # plain int/str, so numpy scalars etc. pickle and cache cleanly
+        if isinstance(answer, numbers.Integral):
+            result["answer"] = int(answer)
+        else:
+            result["answer"] = str(answer)
+    except MemoryError:
+        result["status"] = "oom"
+        result["traceback"] = traceback.format_exc()
+    except Exception:  # pylint: disable=broad-exception-caught
+        result["status"] = "errored"
+        result["traceback"] = traceback.format_exc()
+    end = time.time()
+    result["seconds"] = end - start
+    result["memo"] = memo_stats
+    result["counters"] = counts
+
+    if profiler is not None:
+        os.makedirs(os.path.dirname(profile_path), exist_ok=True)
+        profiler.dump_stats(profile_path)
+        result["profile_path"] = profile_path
+    if tracker is not None:
+        result["memory_peak"] = tracker.peak
+        result["memory_top"] = tracker.top_sites() if tracker.snapshot else []
+
+    return result
+
+
+def _run_part_child(connection, *args):
+    """Target for the child process in run_part_isolated()"""
+    connection.send(run_part(*args))
+    connection.close()
+
+
+def run_part_isolated(
+    solution: callable,
+    s,
+    profile_path: str = None,
+    memory: bool = False,
+    memory_limit: int = None,
+    timeout: float = None,
+    counters: bool = False,
+) -> dict:
+    """run_part() but in a child process, so a runaway part can't take down the harness
+    The child gets killed after timeout seconds (status "timeout")
+    A child that dies without reporting back (ex. the kernel OOM killer) counts as "oom"
+        if it was SIGKILLed, otherwise "errored"
+    """
+    # fork where possible so the child inherits the imported module and prepared input
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    else:
+        context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_run_part_child,
+        args=(sender, solution, s, profile_path, memory, memory_limit, counters),
+    )
+    start = time.time()
+    process.start()
+    sender.close()
+
+    result = None
+    timed_out = not receiver.poll(timeout)
+    if not timed_out:
+        try:
+            result = receiver.recv()
+        except EOFError:
+            # child exited without sending anything (it may still be getting cleaned up,
+            # so this is down to its exit code, not whether it's alive)
+            pass
+    end = time.time()
+
+    if timed_out:
+        process.kill()
+        process.join()
+        return {
+            "status": "timeout",
+            "answer": None,
+            "traceback": None,
+            "seconds": end - start,
+        }
+
+    process.join()
+    if result is None:
+        killed = process.exitcode == -signal.SIGKILL
+        return {
+            "status": "oom" if killed else "errored",
+            "answer": None,
+            "traceback": f"Child process exited with code {process.exitcode}",
+            "seconds": end - start,
+        }
+    return result
+
+
+def run_solution(
+    day,
+    file_name,
+    profile: bool = False,
+    memory: bool = False,
+    cache: bool = True,
+    force: bool = False,
+    timeout: float = None,
+    memory_limit: int = None,
+    counters: bool = False,
+) -> dict:
+    """Run a solution and check it against the answers
+    Returns a report dictionary (plain data, so it can come back from a worker process)
+    profile: run each part under cProfile, writing to FOLDER_PROFILES
+    memory: track each part's peak memory and top allocation sites
+    cache: reuse answers from the AnswerCache when neither the input nor the source changed
+    force: recompute everything, but still write the results to the cache
+    timeout: seconds each part gets before it's killed
+    memory_limit: MiB of address space each part gets
+    counters: count the work each part does (utils.counters)
+    If timeout or memory_limit are given, each part runs in its own child process
+    """
     # load the answers
     assert str(day) in ANSWERS, f"{ANSWERS_TOML} does not have a solution for day {day}"
     part_1_soln, part_2_soln = ANSWERS[str(day)]
@@ -104,72 +481,466 @@ def test_solution(day, file_name) -> bool:
     # import solution functions
     module_name = file_name.removesuffix(".py")
     module = importlib.import_module(module_name)
+    load_lazy_imports(module)
     solution_part1 = module.solution_part1
     solution_part2 = module.solution_part2
 
-    s = get_input(day)
+    s = load_input(module, day)
 
-    # part 1
-    start = time.time()
-    try:
-        part_1_answer = solution_part1(s)
-        part_1_errored = False
-    except:
-        part_1_answer = None
-        part_1_errored = True
-    end = time.time()
-    part_1_seconds = end - start
-    if isinstance(part_1_soln, str):
-        # cast answer to string if the solution is a string
-        part_1_correct = bool(str(part_1_answer) == part_1_soln)
-    else:
-        part_1_correct = bool(part_1_answer == part_1_soln)
+    # look for cached answers (profiling/memory tracking only make sense on a real run)
+    answer_cache = AnswerCache() if cache else None
+    cached = {}
+    if answer_cache is not None:
+        input_hash = hash_input(s)
+        source_hash = hash_source(module)
+        if not (force or profile or memory or counters):
+            for part in (1, 2):
+                hit = answer_cache.get(input_hash, source_hash, part)
+                if hit is not None:
+                    cached[part] = hit
 
-    # part 2
+    # parse once if the module supports it, otherwise both parts get the plaintext
+    # (no need to parse if both parts are cached)
+    prepare = getattr(module, "prepare", None)
+    if len(cached) == 2:
+        prepare = None
+    parse_traceback = None
+    parse_counts = {}
     start = time.time()
-    try:
-        part_2_answer = solution_part2(s)
-        part_2_errored = False
-    except:
-        part_2_answer = None
-        part_2_errored = True
+    if prepare is not None:
+        try:
+            # some days do their searching in prepare() (ex. day 20), so count that too
+            with (
+                counting() if counters else contextlib.nullcontext(parse_counts)
+            ) as parse_counts:
+                s = prepare(s)
+        except Exception:  # pylint: disable=broad-exception-caught
+            parse_traceback = traceback.format_exc()
     end = time.time()
-    part_2_seconds = end - start
-    if isinstance(part_2_soln, str):
-        # cast answer to string if the solution is a string
-        part_2_correct = bool(str(part_2_answer) == part_2_soln)
-    else:
-        part_2_correct = bool(part_2_answer == part_2_soln)
 
-    overall_correct = part_1_correct and part_2_correct
+    report = {
+        "day": day,
+        "file_name": file_name,
+        "parse_errored": parse_traceback is not None,
+        "parse_traceback": parse_traceback,
+        "parse_seconds": None if prepare is None else end - start,
+        "parse_counters": parse_counts,
+    }
+    isolated = timeout is not None or memory_limit is not None
+    for part, solution, soln in (
+        (1, solution_part1, part_1_soln),
+        (2, solution_part2, part_2_soln),
+    ):
+        if part in cached:
+            answer, seconds = cached[part]
+            report[part] = {
+                "soln": soln,
+                "answer": answer,
+                "status": "ok",
+                "traceback": None,
+                "seconds": seconds,
+                "cached": True,
+            }
+        elif parse_traceback is not None:
+            report[part] = {
+                "soln": soln,
+                "answer": None,
+                "status": "errored",
+                "traceback": "prepare() errored",
+                "seconds": 0.0,
+                "cached": False,
+            }
+        else:
+            profile_path = None
+            if profile:
+                profile_path = os.path.join(
+                    FOLDER_PROFILES, f"{module_name}_part{part}.pstats"
+                )
+            if isolated:
+                result = run_part_isolated(
+                    solution, s, profile_path, memory, memory_limit, timeout, counters
+                )
+            else:
+                result = run_part(solution, s, profile_path, memory, counters=counters)
+            report[part] = {"soln": soln, "cached": False, **result}
+            if answer_cache is not None and result["status"] == "ok":
+                answer_cache.put(
+                    input_hash, source_hash, part, result["answer"], result["seconds"]
+                )
+
+        r = report[part]
+        r["errored"] = r["status"] != "ok"
+        r["correct"] = not r["errored"] and check_answer(r["answer"], soln)
+
+    if answer_cache is not None:
+        answer_cache.close()
+
+    return report
 
-    # print a report
+
+def print_report(report: dict) -> bool:
+    """Print a report from run_solution(), return a boolean for whether it succeeded"""
     print("--------------------")
-    print(f"Day {day}: {file_name}")
+    print(f"Day {report['day']}: {report['file_name']}")
     print("--------------------")
-    if part_1_errored:
-        print("Part 1: ERRORED")
-    else:
-        if part_1_correct:
-            print(f"Part 1: correct ({part_1_soln})")
-        else:
-            print(f"Part 1: INCORRECT (expected {part_1_soln} gave {part_1_answer})")
-    if part_2_errored:
-        print("Part 2: ERRORED")
+    if report["parse_errored"]:
+        print("Parse: ERRORED")
+        print(textwrap.indent(report["parse_traceback"].rstrip(), "    "))
+    for part in (1, 2):
+        r = report[part]
+        match r["status"]:
+            case "timeout":
+                print(f"Part {part}: TIMEOUT (after {r['seconds']:.2f} seconds)")
+            case "oom":
+                print(f"Part {part}: OUT OF MEMORY")
+            case "errored":
+                print(f"Part {part}: ERRORED")
+            case _:
+                if r["correct"]:
+                    print(f"Part {part}: correct ({r['soln']})")
+                else:
+                    print(
+                        f"Part {part}: INCORRECT (expected {r['soln']} gave {r['answer']})"
+                    )
+        if r["traceback"] and not report["parse_errored"]:
+            print(textwrap.indent(r["traceback"].rstrip(), "    "))
+    if report["parse_seconds"] is not None:
+        print(f"Parse seconds: {report['parse_seconds']:.2f}")
+    if report.get("parse_counters"):
+        print(f"Parse counters: {format_counts(report['parse_counters'])}")
+    for part in (1, 2):
+        cached_str = " (cached)" if report[part]["cached"] else ""
+        print(f"Part {part} seconds: {report[part]['seconds']:.2f}{cached_str}")
+    for part in (1, 2):
+        if report[part].get("counters"):
+            print(f"Part {part} counters: {format_counts(report[part]['counters'])}")
+    for part in (1, 2):
+        if "profile_path" in report[part]:
+            print(f"Part {part} profile: {report[part]['profile_path']}")
+    for part in (1, 2):
+        for line in memo.format_stats(report[part].get("memo", {})):
+            print(f"Part {part} memo: {line}")
+    for part in (1, 2):
+        if "memory_peak" in report[part]:
+            print(
+                f"Part {part} memory peak: {report[part]['memory_peak'] / 2**20:.2f} MiB"
+            )
+            for site in report[part]["memory_top"]:
+                print(f"    {site}")
+
+    return report[1]["correct"] and report[2]["correct"]
+
+
+def implementations(day: int) -> list[str]:
+    """All the solution files for a day, the CONFIG one(s) first and then the ALTERNATIVES"""
+    file_names = [file_name for d, file_name in CONFIG if d == day]
+    assert file_names, f"Day {day} not found in config"
+    return file_names + ALTERNATIVES.get(day, [])
+
+
+def run_implementation(
+    file_name: str, s: str, memory: bool = True, timeout: float = None
+) -> dict:
+    """Run one implementation on the input text s, for compare_implementations()
+    Times the parse (if there's a prepare()) and both parts, then does a second run with
+        tracemalloc for the peak memory (so tracing doesn't slow down the timed run)
+    Returns a dictionary with "seconds", "peaks" (bytes) and "results" (from run_part())
+    """
+    module = importlib.import_module(file_name.removesuffix(".py"))
+    load_lazy_imports(module)
+    prepare = getattr(module, "prepare", None)
+    report = {"file_name": file_name, "seconds": {}, "peaks": {}, "results": {}}
+
+    for tracked in (False, True) if memory else (False,):
+        x = s
+        if prepare is not None:
+            tracker = PeakMemoryTracker() if tracked else None
+            start = time.time()
+            try:
+                with tracker or contextlib.nullcontext():
+                    x = prepare(s)
+            except Exception:  # pylint: disable=broad-exception-caught
+                report["results"] = {
+                    part: {
+                        "status": "errored",
+                        "answer": None,
+                        "traceback": traceback.format_exc(),
+                    }
+                    for part in (1, 2)
+                }
+                break
+            if tracked:
+                report["peaks"]["parse"] = tracker.peak
+            else:
+                report["seconds"]["parse"] = time.time() - start
+
+        for part in (1, 2):
+            solution = getattr(module, f"solution_part{part}")
+            if timeout is not None:
+                result = run_part_isolated(solution, x, memory=tracked, timeout=timeout)
+            else:
+                result = run_part(solution, x, memory=tracked)
+            if tracked:
+                report["peaks"][part] = result.get("memory_peak")
+            else:
+                report["seconds"][part] = result["seconds"]
+                report["results"][part] = result
+
+        # no point measuring memory if the timed run didn't work
+        if any(result["status"] != "ok" for result in report["results"].values()):
+            break
+
+    return report
+
+
+def compare_implementations(
+    day: int,
+    size: int = None,
+    seed: int = 0,
+    memory: bool = True,
+    timeout: float = None,
+) -> bool:
+    """Run every implementation of a day on the same input, check they agree, and print a
+        table of their runtimes and peak memory (fastest first)
+    The input is the real one, or a generated one (utils.generators) if size is given
+    Returns a boolean for whether they all agree (and are correct, for the real input)
+    """
+    if size is None:
+        s = get_input(day)
+        solns = ANSWERS.get(str(day))
+        source = "real input"
     else:
-        if part_2_correct:
-            print(f"Part 2: correct ({part_2_soln})")
-        else:
-            print(f"Part 2: INCORRECT (expected {part_2_soln} gave {part_2_answer})")
-    print(f"Part 1 seconds: {part_1_seconds:.2f}")
-    print(f"Part 2 seconds: {part_2_seconds:.2f}")
+        s = generate(day, size, seed)
+        solns = None
+        source = f"generated input, size {size}, seed {seed}"
 
-    return overall_correct
+    reports = [
+        run_implementation(file_name, s, memory, timeout)
+        for file_name in implementations(day)
+    ]
 
+    print("--------------------")
+    print(f"Day {day}: {len(reports)} implementations ({source})")
+    print("--------------------")
 
-if __name__ == "__main__":
-    all_correct_bool = test_all()
+    # check answers
+    success = True
+    for part in (1, 2):
+        answers = {}
+        for report in reports:
+            result = report["results"][part]
+            if result["status"] != "ok":
+                print(f"Part {part}: {report['file_name']} {result['status'].upper()}")
+                if result["traceback"]:
+                    print(textwrap.indent(result["traceback"].rstrip(), "    "))
+                success = False
+                continue
+            answers.setdefault(str(result["answer"]), []).append(report["file_name"])
+        if len(answers) > 1:
+            success = False
+            print(f"Part {part}: DISAGREE")
+            for answer, file_names in answers.items():
+                print(f"    {answer}: {', '.join(file_names)}")
+        elif answers:
+            (answer,) = answers
+            if solns is not None and not check_answer(answer, solns[part - 1]):
+                success = False
+                print(f"Part {part}: all agree, but INCORRECT ({answer})")
+            else:
+                print(f"Part {part}: all agree ({answer})")
+
+    # comparison table
+    def total_seconds(report: dict) -> float:
+        return sum(report["seconds"].values())
+
+    reports = sorted(reports, key=total_seconds)
+    keys = [key for key in ("parse", 1, 2) if any(key in r["seconds"] for r in reports)]
+    labels = ["Parse" if key == "parse" else f"Part {key}" for key in keys]
+    print()
+    print(
+        f"{'implementation':<20}"
+        + "".join(f"{label:>10}" for label in labels)
+        + f"{'total':>10}{'vs best':>10}{'peak MiB':>10}"
+    )
+    best = total_seconds(reports[0])
+    for report in reports:
+        line = f"{report['file_name']:<20}"
+        for key in keys:
+            seconds = report["seconds"].get(key)
+            line += f"{seconds:>9.2f}s" if seconds is not None else f"{'':>10}"
+        total = total_seconds(report)
+        line += f"{total:>9.2f}s"
+        line += f"{total / best:>9.1f}x" if best else f"{'':>10}"
+        peaks = [peak for peak in report["peaks"].values() if peak is not None]
+        line += f"{max(peaks) / 2**20:>10.1f}" if peaks else f"{'':>10}"
+        print(line)
+
+    return success
+
+
+def measure_import_time(module_name: str) -> tuple[float, list[tuple[str, float]]]:
+    """Import a module in a fresh interpreter (with "-X importtime")
+    Returns the seconds the import took, and a list of (package, seconds) for the
+        packages it directly imported, heaviest first
+    Raises ImportError if the import fails
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(CURRENT_DIRECTORY), CURRENT_DIRECTORY]
+        + env.get("PYTHONPATH", "").split(os.pathsep)
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode:
+        raise ImportError(result.stderr.strip().splitlines()[-1])
+
+    # lines look like "import time:  self [us] | cumulative | imported package"
+    # with nested imports indented 2 spaces per level, each listed before its parent
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((level, name.strip(), int(cumulative) / 1e6))
+
+    # the module is the last top level entry, and its direct imports are the
+    # level 1 entries right before it
+    level, name, total = entries[-1]
+    assert level == 0 and name == module_name
+    packages = []
+    for level, name, seconds in reversed(entries[:-1]):
+        if level == 0:
+            break
+        if level == 1:
+            packages.append((name, seconds))
+
+    packages.sort(key=lambda t: -t[1])
+    return total, packages
+
+
+def report_import_times(lines: list[tuple[int, str]] = None, top: int = 3):
+    """Print the import cost of each solution file (each in a fresh interpreter)"""
+    for day, file_name in lines or CONFIG:
+        module_name = file_name.removesuffix(".py")
+        try:
+            total, packages = measure_import_time(module_name)
+        except ImportError as e:
+            print(f"Day {day}: {file_name}: IMPORT FAILED ({e})")
+            continue
+        heaviest = ", ".join(
+            f"{name} {seconds * 1000:.0f}ms" for name, seconds in packages[:top]
+        )
+        print(f"Day {day}: {file_name}: {total * 1000:.0f}ms ({heaviest})")
+
+
+def parse_args() -> argparse.Namespace:
+    """Command line arguments for running this file"""
+    parser = argparse.ArgumentParser(description="Check solutions against answers.toml")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="number of worker processes to run solutions in (default 1, i.e. serial)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="recompute answers even if they're in the answer cache",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="don't read from or write to the answer cache",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="seconds each part gets before being killed (runs parts in child processes)",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        type=int,
+        default=None,
+        help="MiB of address space each part gets (runs parts in child processes)",
+    )
+    parser.add_argument(
+        "--counters",
+        action="store_true",
+        help="count the work each part does (guard steps, nodes expanded, etc.)",
+    )
+    parser.add_argument(
+        "--compare",
+        type=int,
+        nargs="*",
+        metavar="DAY",
+        help="compare the implementations of these days (default: all days with ALTERNATIVES)",
+    )
+    parser.add_argument(
+        "--generated-size",
+        type=int,
+        default=None,
+        help="for --compare: use a generated input of this size instead of the real one",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="for --compare: generated input seed"
+    )
+    parser.add_argument(
+        "--import-times",
+        action="store_true",
+        help="just report how long each solution file takes to import",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="run each part under cProfile, writing .pstats files to the profiles/ folder",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="track each part with tracemalloc, reporting peak memory and top allocation sites",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run whichever mode was asked for, return an exit code"""
+    args = parse_args()
+    if args.import_times:
+        report_import_times()
+        return 0
+    if args.compare is not None:
+        all_agree_bool = True
+        for day in args.compare or sorted(ALTERNATIVES):
+            all_agree_bool &= compare_implementations(
+                day, args.generated_size, args.seed, timeout=args.timeout
+            )
+            print()
+        print("All agree!" if all_agree_bool else "Some disagree!")
+        return int(not all_agree_bool)
+    all_correct_bool = test_all(
+        jobs=args.jobs,
+        profile=args.profile,
+        memory=args.memory,
+        cache=not args.no_cache,
+        force=args.force,
+        timeout=args.timeout,
+        memory_limit=args.memory_limit,
+        counters=args.counters,
+    )
     if all_correct_bool:
         print("All correct!")
     else:
         print("Some incorrect!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
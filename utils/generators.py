@@ -0,0 +1,630 @@
+"""Seeded synthetic puzzle inputs, for benchmarking offline and at sizes beyond the real inputs
+
+generate(day, size, seed) gives a plaintext input for the day, in the same format as get_input()
+What "size" means depends on the day (see SIZE_DESCRIPTIONS),
+    and DEFAULT_SIZES are roughly the sizes of the real inputs
+The same (day, size, seed) always gives the same input
+
+The inputs are valid for the solutions, but some solutions lean on things about the real inputs:
+- Day 14's room is fixed at 101x103 and part 2 is hardcoded, so only part 1 scales
+- Day 17's program has the same shape as the real ones (so part 2 has an A to find),
+    size is the number of octal digits of the starting A
+- Day 18's solution hardcodes the 71x71 grid and the first 1024 bytes,
+    so size is the number of bytes (bumped up if needed so the exit ends up blocked for part 2)
+- Day 24's part 2 is hardcoded, the circuit is a correct ripple carry adder
+
+Ex.
+from utils.generators import generate
+s = generate(16, size=301, seed=1)
+"""
+
+# pylint: disable=invalid-name
+
+from collections import deque
+import itertools
+import string
+
+import numpy as np
+
+# what the size knob means for each day
+SIZE_DESCRIPTIONS = {
+    1: "lines",
+    2: "reports",
+    3: "instructions",
+    4: "grid side",
+    5: "updates",
+    6: "grid side",
+    7: "equations",
+    8: "grid side",
+    9: "disk map length",
+    10: "grid side",
+    11: "stones",
+    12: "grid side",
+    13: "claw machines",
+    14: "robots",
+    15: "grid side",
+    16: "grid side",
+    17: "octal digits of A",
+    18: "bytes",
+    19: "designs",
+    20: "grid side",
+    21: "codes",
+    22: "buyers",
+    23: "computers",
+    24: "bits",
+    25: "schematics",
+}
+
+# roughly the size of the real inputs
+DEFAULT_SIZES = {
+    1: 1000,
+    2: 1000,
+    3: 700,
+    4: 140,
+    5: 200,
+    6: 130,
+    7: 850,
+    8: 50,
+    9: 19999,
+    10: 55,
+    11: 8,
+    12: 140,
+    13: 320,
+    14: 500,
+    15: 50,
+    16: 141,
+    17: 16,
+    18: 3450,
+    19: 400,
+    20: 141,
+    21: 5,
+    22: 2000,
+    23: 520,
+    24: 45,
+    25: 500,
+}
+
+# the most the generators can do (2 letter computer names, 2 digit wire names)
+MAX_SIZES = {
+    23: 676,
+    24: 99,
+}
+
+# turn right: (di, dj) -> (dj, -di)
+DIRECTIONS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+
+def generate(day: int, size: int = None, seed: int = 0) -> str:
+    """Generate an input for the day, of the given size (default: about the real input's size)"""
+    assert day in GENERATORS, f"No generator for day {day}"
+    if size is None:
+        size = DEFAULT_SIZES[day]
+    rng = np.random.default_rng((day, seed))
+    return GENERATORS[day](rng, int(size))
+
+
+def grid_to_string(A: np.ndarray) -> str:
+    """Join a 2D array of characters into lines"""
+    return "\n".join("".join(row) for row in A)
+
+
+def maze(rng: np.random.Generator, n: int) -> np.ndarray:
+    """A random perfect maze (exactly one path between any two cells) as an n x n array of "#"/"."
+    Cells are at odd coordinates, n should be odd
+    Carved with an iterative depth first search
+    """
+    A = np.full((n, n), "#")
+    A[1, 1] = "."
+    stack = [(1, 1)]
+    while stack:
+        i, j = stack[-1]
+        options = [
+            (i + 2 * di, j + 2 * dj)
+            for di, dj in DIRECTIONS
+            if 0 < i + 2 * di < n - 1
+            and 0 < j + 2 * dj < n - 1
+            and A[i + 2 * di, j + 2 * dj] == "#"
+        ]
+        if not options:
+            stack.pop()
+            continue
+        _i, _j = options[rng.integers(len(options))]
+        A[(i + _i) // 2, (j + _j) // 2] = "."
+        A[_i, _j] = "."
+        stack.append((_i, _j))
+    return A
+
+
+def path_in_maze(A: np.ndarray, start: tuple, end: tuple) -> list[tuple[int, int]]:
+    """The locations on the (BFS shortest) path from start to end through the "." of A"""
+    parents = {start: None}
+    queue = deque([start])
+    while queue:
+        i, j = queue.popleft()
+        if (i, j) == end:
+            break
+        for di, dj in DIRECTIONS:
+            _i, _j = i + di, j + dj
+            if A[_i, _j] == "." and (_i, _j) not in parents:
+                parents[(_i, _j)] = (i, j)
+                queue.append((_i, _j))
+    path = [end]
+    while parents[path[-1]] is not None:
+        path.append(parents[path[-1]])
+    return path[::-1]
+
+
+def guard_exits(A: np.ndarray, i: int, j: int) -> bool:
+    """Whether the day 6 guard starting at (i, j) facing up walks off the grid (vs loops)"""
+    n, m = A.shape
+    d = 0
+    seen = set()
+    while (i, j, d) not in seen:
+        seen.add((i, j, d))
+        di, dj = DIRECTIONS[d]
+        _i, _j = i + di, j + dj
+        if not (0 <= _i < n and 0 <= _j < m):
+            return True
+        if A[_i, _j] == "#":
+            d = (d + 1) % 4
+        else:
+            i, j = _i, _j
+    return False
+
+
+def exit_reachable(blocked: set, n: int) -> bool:
+    """Whether (n - 1, n - 1) can be reached from (0, 0) on an n x n grid avoiding blocked"""
+    seen = {(0, 0)}
+    queue = deque([(0, 0)])
+    while queue:
+        i, j = queue.popleft()
+        if (i, j) == (n - 1, n - 1):
+            return True
+        for di, dj in DIRECTIONS:
+            _i, _j = i + di, j + dj
+            if (
+                0 <= _i < n
+                and 0 <= _j < n
+                and (_i, _j) not in seen
+                and (_i, _j) not in blocked
+            ):
+                seen.add((_i, _j))
+                queue.append((_i, _j))
+    return False
+
+
+def day17_outputs(A: int, a: int, b: int) -> list[int]:
+    """What the day 17 program 2,4,1,a,7,5,1,b,4,c,5,5,0,3,3,0 outputs, starting from A
+    (c doesn't matter, bxc ignores its operand)
+    """
+    out = []
+    while True:
+        B = (A % 8) ^ a
+        C = A >> B
+        B = B ^ b ^ C
+        out.append(B % 8)
+        A = A >> 3
+        if not A:
+            return out
+
+
+def day17_quine(program: list[int], a: int, b: int, A: int = 0) -> int | None:
+    """The smallest A making the program output itself (building A from its most significant
+    octal digit down), or None if there isn't one
+    """
+    k = len(day17_outputs(A, a, b)) if A else 0
+    if k == len(program):
+        return A
+    for digit in range(8):
+        _A = 8 * A + digit
+        if _A and day17_outputs(_A, a, b) == program[-(k + 1) :]:
+            res = day17_quine(program, a, b, _A)
+            if res is not None:
+                return res
+    return None
+
+
+def generate_day1(rng, size):
+    """Two columns of 5 digit location IDs"""
+    left = rng.integers(10000, 100000, size=size)
+    # share some IDs between the columns so part 2's similarity score isn't always 0
+    right = np.where(
+        rng.random(size) < 0.5,
+        rng.choice(left, size=size),
+        rng.integers(10000, 100000, size=size),
+    )
+    return "\n".join(f"{x}   {y}" for x, y in zip(left, right))
+
+
+def generate_day2(rng, size):
+    """Reports of 5 to 8 levels, about half of them with a bad level"""
+    lines = []
+    for _ in range(size):
+        n = int(rng.integers(5, 9))
+        diffs = rng.choice((-1, 1)) * rng.integers(1, 4, size=n - 1)
+        if rng.random() < 0.5:
+            diffs[rng.integers(n - 1)] = rng.integers(-5, 6)
+        levels = np.concatenate(([0], np.cumsum(diffs)))
+        levels += rng.integers(1, 80) - levels.min()
+        lines.append(" ".join(map(str, levels)))
+    return "\n".join(lines)
+
+
+def generate_day3(rng, size):
+    """Corrupted memory: mul(a,b), do(), don't() and junk, about 100 instructions per line"""
+    junk_chars = np.array(list("mul()don't,[]{}<>!@#$%^&*+-?:;' 0123456789"))
+    tokens = []
+    for _ in range(size):
+        x = rng.random()
+        if x < 0.6:
+            tokens.append(f"mul({rng.integers(1, 1000)},{rng.integers(1, 1000)})")
+        elif x < 0.65:
+            tokens.append("do()")
+        elif x < 0.7:
+            tokens.append("don't()")
+        else:
+            tokens.append("".join(rng.choice(junk_chars, size=rng.integers(1, 9))))
+    return "\n".join("".join(tokens[i : i + 100]) for i in range(0, size, 100))
+
+
+def generate_day4(rng, size):
+    """A grid of X, M, A, S"""
+    return grid_to_string(np.array(list("XMAS"))[rng.integers(4, size=(size, size))])
+
+
+def generate_day5(rng, size):
+    """Ordering rules for 49 pages (every pair, consistent with a hidden order)
+    and updates of odd length, about half in the right order
+    """
+    order = rng.choice(np.arange(10, 100), size=49, replace=False)
+    rules = [f"{a}|{b}" for a, b in itertools.combinations(order, 2)]
+    rules = [rules[k] for k in rng.permutation(len(rules))]
+    updates = []
+    for _ in range(size):
+        k = int(rng.choice(np.arange(5, 24, 2)))
+        update = order[np.sort(rng.choice(len(order), size=k, replace=False))]
+        if rng.random() < 0.5:
+            update = rng.permutation(update)
+        updates.append(",".join(map(str, update)))
+    return "\n".join(rules) + "\n\n" + "\n".join(updates)
+
+
+def generate_day6(rng, size):
+    """A lab with about 5% obstacles, redrawn until the guard's part 1 route leaves the grid"""
+    while True:
+        A = np.where(rng.random((size, size)) < 0.05, "#", ".")
+        i, j = (int(x) for x in rng.integers(size, size=2))
+        A[i, j] = "^"
+        if guard_exits(A, i, j):
+            return grid_to_string(A)
+
+
+def generate_day7(rng, size):
+    """Equations of 2 to 12 numbers, about half of them solvable"""
+    lines = []
+    for _ in range(size):
+        nums = [int(x) for x in rng.integers(1, 100, size=rng.integers(2, 13))]
+        if rng.random() < 0.5:
+            target = nums[0]
+            for n in nums[1:]:
+                match rng.integers(3):
+                    case 0:
+                        target += n
+                    case 1:
+                        target *= n
+                    case _:
+                        target = int(f"{target}{n}")
+            if target > 10**15:
+                target = sum(nums)
+        else:
+            target = int(rng.integers(1, 10**12))
+        lines.append(f"{target}: " + " ".join(map(str, nums)))
+    return "\n".join(lines)
+
+
+def generate_day8(rng, size):
+    """A grid with antennas of up to 62 frequencies, about 4 antennas per frequency"""
+    frequencies = np.array(list(string.ascii_letters + string.digits))
+    num_antennas = max(2, size * size // 12)
+    num_frequencies = min(len(frequencies), max(1, num_antennas // 4))
+    A = np.full((size, size), ".")
+    locations = rng.choice(size * size, size=num_antennas, replace=False)
+    A.reshape(-1)[locations] = rng.choice(
+        frequencies[:num_frequencies], size=num_antennas
+    )
+    return grid_to_string(A)
+
+
+def generate_day9(rng, size):
+    """A disk map (odd length): file sizes 1 to 9, gap sizes 0 to 9"""
+    if size % 2 == 0:
+        size += 1
+    digits = rng.integers(0, 10, size=size)
+    digits[::2] = rng.integers(1, 10, size=len(digits[::2]))
+    return "".join(map(str, digits))
+
+
+def generate_day10(rng, size):
+    """A topographic map: random heights with 0-9 hiking trails painted over them"""
+    A = rng.integers(0, 10, size=(size, size))
+    for _ in range(max(1, size * size // 100)):
+        trail = [tuple(int(x) for x in rng.integers(size, size=2))]
+        while len(trail) < 10:
+            i, j = trail[-1]
+            options = [
+                (i + di, j + dj)
+                for di, dj in DIRECTIONS
+                if 0 <= i + di < size
+                and 0 <= j + dj < size
+                and (i + di, j + dj) not in trail
+            ]
+            if not options:
+                break
+            trail.append(options[rng.integers(len(options))])
+        for height, (i, j) in enumerate(trail):
+            A[i, j] = height
+    return grid_to_string(A.astype(str))
+
+
+def generate_day11(rng, size):
+    """Stones with numbers up to a million"""
+    return " ".join(map(str, rng.integers(0, 10**6, size=size)))
+
+
+def generate_day12(rng, size):
+    """A garden of 4x4 blocks of plants, with 10% of plots changed to make the regions messier"""
+    plants = np.array(list(string.ascii_uppercase))
+    coarse = rng.integers(26, size=(size // 4 + 1, size // 4 + 1))
+    A = np.repeat(np.repeat(coarse, 4, axis=0), 4, axis=1)[:size, :size]
+    noise = rng.random((size, size)) < 0.1
+    A[noise] = rng.integers(26, size=noise.sum())
+    return grid_to_string(plants[A])
+
+
+def generate_day13(rng, size):
+    """Claw machines with independent button vectors,
+    about a third winnable in part 1 and another third winnable in part 2
+    """
+    # the prize offset in part 2
+    offset = 10**13
+    blocks = []
+    for _ in range(size):
+        # A leans towards x and B towards y, so part 2's far off prizes need positive presses
+        ax, ay, bx, by = (int(x) for x in rng.integers(10, 100, size=4))
+        while ax <= ay or by <= bx:
+            ax, ay, bx, by = (int(x) for x in rng.integers(10, 100, size=4))
+        x = rng.random()
+        if x < 2 / 3:
+            na, nb = (int(x) for x in rng.integers(1, 101, size=2))
+        else:
+            # round the presses for a prize around (offset + t, offset + t)
+            t = int(rng.integers(1000, 20000))
+            a, b = np.linalg.solve([[ax, bx], [ay, by]], [offset + t, offset + t])
+            na, nb = int(round(a)), int(round(b))
+        gx, gy = na * ax + nb * bx, na * ay + nb * by
+        if x < 1 / 3:
+            gx += int(rng.integers(1, 10))
+        elif x >= 2 / 3:
+            gx, gy = gx - offset, gy - offset
+        blocks.append(
+            f"Button A: X+{ax}, Y+{ay}\n"
+            f"Button B: X+{bx}, Y+{by}\n"
+            f"Prize: X={gx}, Y={gy}"
+        )
+    return "\n\n".join(blocks)
+
+
+def generate_day14(rng, size):
+    """Robots in the 101x103 room"""
+    px = rng.integers(0, 101, size=size)
+    py = rng.integers(0, 103, size=size)
+    vx, vy = rng.integers(-99, 100, size=(2, size))
+    return "\n".join(f"p={a},{b} v={c},{d}" for a, b, c, d in zip(px, py, vx, vy))
+
+
+def generate_day15(rng, size):
+    """A walled warehouse with 5% walls and 30% boxes, then 8 * size**2 moves"""
+    x = rng.random((size, size))
+    A = np.where(x < 0.05, "#", np.where(x < 0.35, "O", "."))
+    A[0, :] = A[-1, :] = A[:, 0] = A[:, -1] = "#"
+    i, j = (int(x) for x in rng.integers(1, size - 1, size=2))
+    A[i, j] = "@"
+    moves = "".join(rng.choice(np.array(list("<>^v")), size=8 * size * size))
+    moves = "\n".join(moves[k : k + 1000] for k in range(0, len(moves), 1000))
+    return grid_to_string(A) + "\n\n" + moves
+
+
+def generate_day16(rng, size):
+    """A maze (odd side) with S bottom left, E top right,
+    and 10% of the inner walls knocked out so there are loops and tied best paths
+    """
+    if size % 2 == 0:
+        size += 1
+    A = maze(rng, size)
+    inner = np.zeros(A.shape, dtype=bool)
+    inner[1:-1, 1:-1] = True
+    between_cells = inner & ((np.indices(A.shape).sum(axis=0) % 2) == 1)
+    A[between_cells & (rng.random(A.shape) < 0.1)] = "."
+    A[size - 2, 1] = "S"
+    A[1, size - 2] = "E"
+    return grid_to_string(A)
+
+
+def generate_day17(rng, size):
+    """A program shaped like the real ones (that has an A making it output itself),
+    and a starting A with size octal digits
+    """
+    while True:
+        a, b, c = (int(x) for x in rng.integers(0, 8, size=3))
+        program = [2, 4, 1, a, 7, 5, 1, b, 4, c, 5, 5, 0, 3, 3, 0]
+        if day17_quine(program, a, b) is not None:
+            break
+    digits = rng.integers(0, 8, size=size)
+    digits[0] = rng.integers(1, 8)
+    A = int("".join(map(str, digits)), base=8)
+    return (
+        f"Register A: {A}\n"
+        "Register B: 0\n"
+        "Register C: 0\n"
+        "\n"
+        f"Program: {','.join(map(str, program))}"
+    )
+
+
+def generate_day18(rng, size):
+    """Bytes falling on the 71x71 grid, where the first 1024 leave the exit reachable
+    and the exit is blocked by the end of the list (at least size bytes)
+    """
+    n = 71
+    cells = [(i, j) for i in range(n) for j in range(n)][1:-1]
+    while True:
+        order = [cells[k] for k in rng.permutation(len(cells))]
+        if exit_reachable(set(order[:1024]), n):
+            break
+
+    # bisect for the first byte that blocks the exit
+    lo, hi = 1024, len(order)
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if exit_reachable(set(order[:mid]), n):
+            lo = mid
+        else:
+            hi = mid
+
+    return "\n".join(f"{i},{j}" for i, j in order[: max(size, hi)])
+
+
+def generate_day19(rng, size):
+    """About 400 towels (never the single stripe of one color, so some designs are impossible)
+    and designs of 20 to 60 stripes, about half built out of towels
+    """
+    colors = np.array(list("wubrg"))
+    missing = str(rng.choice(colors))
+    towels = set()
+    while len(towels) < 400:
+        towel = "".join(rng.choice(colors, size=rng.integers(1, 9)))
+        if towel != missing:
+            towels.add(towel)
+    towels = sorted(towels)
+
+    designs = []
+    for _ in range(size):
+        length = int(rng.integers(20, 61))
+        if rng.random() < 0.5:
+            design = ""
+            while len(design) < length:
+                design += towels[rng.integers(len(towels))]
+        else:
+            design = "".join(rng.choice(colors, size=length))
+        designs.append(design)
+    return ", ".join(towels) + "\n\n" + "\n".join(designs)
+
+
+def generate_day20(rng, size):
+    """A single track (odd side) from S to E: the path between two corners of a perfect maze"""
+    if size % 2 == 0:
+        size += 1
+    start, end = (size - 2, 1), (1, size - 2)
+    path = path_in_maze(maze(rng, size), start, end)
+    A = np.full((size, size), "#")
+    for i, j in path:
+        A[i, j] = "."
+    A[start] = "S"
+    A[end] = "E"
+    return grid_to_string(A)
+
+
+def generate_day21(rng, size):
+    """Door codes: 3 digits then A"""
+    return "\n".join(f"{x:03d}A" for x in rng.integers(0, 1000, size=size))
+
+
+def generate_day22(rng, size):
+    """Initial secret numbers"""
+    return "\n".join(map(str, rng.integers(1, 2**24, size=size)))
+
+
+def generate_day23(rng, size):
+    """A network of computers (at most 676, the 2 letter names) with average degree about 13,
+    plus a planted LAN party of 13
+    """
+    names = ["".join(t) for t in itertools.product(string.ascii_lowercase, repeat=2)]
+    assert size <= len(names), f"At most {len(names)} computers"
+    names = rng.choice(names, size=size, replace=False)
+    adjacent = np.triu(rng.random((size, size)) < min(1, 13 / size), k=1)
+    party = rng.choice(size, size=min(13, size), replace=False)
+    adjacent[np.ix_(party, party)] = True
+    adjacent = np.triu(adjacent, k=1)
+    edges = [f"{names[i]}-{names[j]}" for i, j in zip(*np.nonzero(adjacent))]
+    return "\n".join(edges[k] for k in rng.permutation(len(edges)))
+
+
+def generate_day24(rng, size):
+    """A ripple carry adder for size bit numbers (size < 100, for the 2 digit wire names)
+    with random x and y values, and the gates shuffled
+    """
+    assert 1 <= size < 100, "Between 1 and 99 bits"
+    names = set()
+    while len(names) < 4 * size:
+        name = "".join(rng.choice(np.array(list(string.ascii_lowercase[:23])), size=3))
+        names.add(name)
+    names = iter(sorted(names, key=lambda _: rng.random()))
+
+    values = [f"x{i:02d}: {rng.integers(2)}" for i in range(size)]
+    values += [f"y{i:02d}: {rng.integers(2)}" for i in range(size)]
+    gates = ["x00 XOR y00 -> z00"]
+    carry = next(names) if size > 1 else "z01"
+    gates.append(f"x00 AND y00 -> {carry}")
+    for i in range(1, size):
+        half_sum, half_carry, carry_through = next(names), next(names), next(names)
+        gates.append(f"x{i:02d} XOR y{i:02d} -> {half_sum}")
+        gates.append(f"{half_sum} XOR {carry} -> z{i:02d}")
+        gates.append(f"x{i:02d} AND y{i:02d} -> {half_carry}")
+        gates.append(f"{half_sum} AND {carry} -> {carry_through}")
+        carry = next(names) if i < size - 1 else f"z{size:02d}"
+        gates.append(f"{half_carry} OR {carry_through} -> {carry}")
+    gates = [gates[k] for k in rng.permutation(len(gates))]
+    return "\n".join(values) + "\n\n" + "\n".join(gates)
+
+
+def generate_day25(rng, size):
+    """Lock and key schematics (7x5, column heights 0 to 5)"""
+    blocks = []
+    rows = np.arange(7).reshape(-1, 1)
+    for _ in range(size):
+        heights = rng.integers(0, 6, size=5)
+        if rng.random() < 0.5:
+            A = rows <= heights
+        else:
+            A = rows >= 6 - heights
+        blocks.append(grid_to_string(np.where(A, "#", ".")))
+    return "\n\n".join(blocks)
+
+
+GENERATORS = {
+    1: generate_day1,
+    2: generate_day2,
+    3: generate_day3,
+    4: generate_day4,
+    5: generate_day5,
+    6: generate_day6,
+    7: generate_day7,
+    8: generate_day8,
+    9: generate_day9,
+    10: generate_day10,
+    11: generate_day11,
+    12: generate_day12,
+    13: generate_day13,
+    14: generate_day14,
+    15: generate_day15,
+    16: generate_day16,
+    17: generate_day17,
+    18: generate_day18,
+    19: generate_day19,
+    20: generate_day20,
+    21: generate_day21,
+    22: generate_day22,
+    23: generate_day23,
+    24: generate_day24,
+    25: generate_day25,
+}
@@ -0,0 +1,98 @@
+"""Character grids as uint8 numpy arrays
+
+parse_grid() turns the text of a grid straight into an array of character codes (np.frombuffer on
+    the bytes, then a strided view that skips the newlines), rather than a <U1 array built
+    from a list of lists (4 bytes a cell, plus a python str per cell while parsing)
+So compare cells against ord() values, ex. A == ord("#")
+
+There's also
+- pad(): a border around the grid, so neighbour lookups don't need bounds checks
+- neighbour_offsets(): flat index offsets of the neighbours, for working on A.reshape(-1)
+- find_all(), find_one(), index_values(): where the values are
+"""
+
+# pylint: disable=invalid-name
+
+import numpy as np
+
+# (di, dj) for the 4 orthogonal neighbours (clockwise from up), then the 4 diagonals
+DIRECTIONS4 = ((-1, 0), (0, 1), (1, 0), (0, -1))
+DIRECTIONS8 = DIRECTIONS4 + ((-1, 1), (1, 1), (1, -1), (-1, -1))
+
+NEWLINE = ord("\n")
+
+
+def parse_grid(s: str | bytes | memoryview, copy: bool = True) -> np.ndarray:
+    """Parse the text of a rectangular grid into a uint8 array of character codes, shape (n, m)
+    copy=False returns a read-only view of the bytes instead of a writeable copy
+        (only worth it for bytes/memoryview input, ex. from utils.inputs.get_input_bytes())
+    """
+    if isinstance(s, str):
+        s = s.strip().encode("utf-8")
+    elif isinstance(s, bytes):
+        s = s.strip()
+    raw = np.frombuffer(s, dtype=np.uint8)
+
+    # the rows are m characters plus a newline, except the last row
+    newlines = np.flatnonzero(raw == NEWLINE)
+    m = int(newlines[0]) if len(newlines) else len(raw)
+    n = (len(raw) + 1) // (m + 1)
+    assert n * (m + 1) - 1 == len(raw), "Grid isn't rectangular"
+
+    A = np.lib.stride_tricks.as_strided(
+        raw, shape=(n, m), strides=(m + 1, 1), writeable=False
+    )
+    return A.copy() if copy else A
+
+
+def grid_to_string(A: np.ndarray) -> str:
+    """Util so that print(grid_to_string(A)) prints a grid nicely"""
+    return "\n".join(row.tobytes().decode("utf-8") for row in A.astype(np.uint8))
+
+
+def pad(A: np.ndarray, value: str | int = "#", width: int = 1) -> np.ndarray:
+    """A copy of A with a border of value (a character or its code) width cells thick
+    Index (i, j) in A becomes (i + width, j + width)
+    """
+    if isinstance(value, str):
+        value = ord(value)
+    return np.pad(A, width, constant_values=value)
+
+
+def neighbour_offsets(m: int, directions=DIRECTIONS4) -> np.ndarray:
+    """Flat index offsets of the neighbours in directions, for a grid with m columns
+    Neighbours of A[i, j] are A.reshape(-1)[i * m + j + offsets]
+    (only valid away from the edges, so pad() first if the edges matter)
+    """
+    return np.array([di * m + dj for di, dj in directions], dtype=np.int64)
+
+
+def find_all(A: np.ndarray, value: str | int) -> list[tuple[int, int]]:
+    """All (i, j) such that A[i, j] == value (a character or its code), in row major order"""
+    if isinstance(value, str):
+        value = ord(value)
+    return [(int(i), int(j)) for i, j in zip(*np.nonzero(A == value))]
+
+
+def find_one(A: np.ndarray, value: str | int) -> tuple[int, int]:
+    """The (i, j) such that A[i, j] == value, asserting there's exactly one"""
+    locs = find_all(A, value)
+    assert len(locs) == 1, f"Expected one {value!r}, found {len(locs)}"
+    return locs[0]
+
+
+def index_values(A: np.ndarray, skip: str = "") -> dict[str, list[tuple[int, int]]]:
+    """Dictionary from each character in A to its (i, j) locations (row major order)
+    Characters in skip are left out (ex. skip="." for the empty cells)
+    One sort of the flat array, rather than a comparison per distinct value
+    """
+    flat = A.reshape(-1)
+    order = np.argsort(flat, kind="stable")
+    values, starts = np.unique(flat[order], return_index=True)
+    m = A.shape[1]
+    index = {}
+    for value, group in zip(values, np.split(order, starts[1:])):
+        c = chr(value)
+        if c not in skip:
+            index[c] = [(int(k // m), int(k % m)) for k in group]
+    return index
@@ -7,30 +7,220 @@ To get this working:
     - Something like "_ga=GA..."
 - Create a file cookies.txt in the same directory as inputs.py
 - Add the (plaintext) cookies to the file
+
+cookies.txt is only read (and requests only imported) when an input actually needs downloading,
+    so importing this is cheap and works without cookies.txt if the inputs are already saved
+
+Inputs are read through an InputStore (INPUT_STORE), which keeps an LRU cache of the decoded text
+    so repeated get_input() calls don't re-read the file
+get_input_bytes() gives a memoryview of a memory map of the file instead,
+    for parsers that work on bytes (ex. np.frombuffer()) and can skip the decode and copy
+iter_input_lines() and iter_blocks() stream the file instead, a block at a time,
+    for solutions with streaming entry points (ex. solution_part1_lines() in day 1)
+
+To download every missing input up front (concurrently, over one pooled session, with retries):
+python -m utils.inputs prefetch --jobs 8
+The site is BASE_URL (override with the AOC_BASE_URL environment variable or --base-url),
+    so this can be pointed at a local stand-in server, ex. one made with http.server
 """
 
 # pylint: disable=logging-fstring-interpolation
 
 import logging
 import datetime
+import mmap
 import os
-import requests
+from collections import OrderedDict
+from typing import Generator
+
+from utils.utilities import lazy_import
+
+# only needed when an input has to be downloaded (or for the command line),
+#     so they don't slow down importing this in every solution
+requests = lazy_import("requests")
+argparse = lazy_import("argparse")
+futures = lazy_import("concurrent.futures")
+random = lazy_import("random")
+tempfile = lazy_import("tempfile")
+time = lazy_import("time")
 
 logger = logging.getLogger(__name__)
 
-# cookies for url requests, read in from the cookies.txt file
-# put your plaintext url request cookies there
-cookies = {}
+# put your plaintext url request cookies in the cookies.txt file
 PATH_COOKIES_TXT = os.path.join(os.path.dirname(__file__), "cookies.txt")
-with open(PATH_COOKIES_TXT, "r", encoding="utf-8") as file:
-    cookies["session"] = file.read().strip()
 
 # file path of the 'inputs' folder for .txt files
 FOLDER_INPUTS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "inputs")
 
+# where inputs get downloaded from, {BASE_URL}/2024/day/{day}/input
+BASE_URL = os.environ.get("AOC_BASE_URL", "https://adventofcode.com")
 
-def get_input(day: int = None) -> str:
-    """Get the input for the given date"""
+# HTTP statuses worth retrying (rate limiting and server errors)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# the process umask (reading it means setting it, so it's read once here rather than from the
+#     download threads), for giving downloaded inputs the permissions a plain open() would
+UMASK = os.umask(0)
+os.umask(UMASK)
+
+# what str.strip() strips, for the ASCII inputs
+WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+
+
+def read_cookies() -> dict:
+    """Cookies for url requests, read in from the cookies.txt file"""
+    with open(PATH_COOKIES_TXT, "r", encoding="utf-8") as file:
+        return {"session": file.read().strip()}
+
+
+def make_session(pool_size: int = 1, cookies: dict = None) -> "requests.Session":
+    """A requests session keeping up to pool_size connections open for reuse
+    cookies default to read_cookies()
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.cookies.update(read_cookies() if cookies is None else cookies)
+    return session
+
+
+def download_input(
+    day: int,
+    session: "requests.Session" = None,
+    base_url: str = BASE_URL,
+    folder: str = FOLDER_INPUTS,
+    retries: int = 3,
+    backoff: float = 1.0,
+) -> str:
+    """Download the input for the day into folder, returning the file path
+    Connection errors, timeouts and RETRY_STATUSES get retried up to retries times,
+        sleeping a random (full jitter) amount up to backoff * 2**attempt seconds in between
+    The file is written to a temp file and renamed into place,
+        so a crash or a concurrent download never leaves a partial input behind
+    """
+    if session is None:
+        session = make_session()
+    url = f"{base_url}/2024/day/{day}/input"
+    file_path = os.path.join(folder, f"input{day}.txt")
+
+    for attempt in range(retries + 1):
+        try:
+            response = session.get(url, timeout=10)
+            if response.status_code not in RETRY_STATUSES:
+                response.raise_for_status()
+                break
+            error = requests.HTTPError(f"{response.status_code} for {url}")
+        except (requests.ConnectionError, requests.Timeout) as e:
+            error = e
+        if attempt == retries:
+            raise error
+        delay = random.uniform(0, backoff * 2**attempt)
+        logger.debug(f"Day {day} attempt {attempt + 1} failed ({error}), retrying")
+        time.sleep(delay)
+
+    os.makedirs(folder, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=folder, prefix=f".input{day}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            file.write(response.text)
+        # mkstemp() makes the file 0600, which os.replace() would keep
+        os.chmod(temp_path, 0o666 & ~UMASK)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    logger.debug(f"Wrote to {file_path}")
+    return file_path
+
+
+def prefetch(
+    days: list[int] = range(1, 26),
+    jobs: int = 4,
+    base_url: str = BASE_URL,
+    folder: str = FOLDER_INPUTS,
+    cookies: dict = None,
+    retries: int = 3,
+    backoff: float = 1.0,
+) -> dict:
+    """Download the inputs for the days that aren't saved yet, jobs at a time over one session
+    Returns a dictionary day -> file path, or the exception if that day failed
+    """
+    missing = [
+        day
+        for day in days
+        if not os.path.exists(os.path.join(folder, f"input{day}.txt"))
+    ]
+    if not missing:
+        return {}
+
+    session = make_session(jobs, cookies)
+
+    def fetch(day):
+        try:
+            return download_input(day, session, base_url, folder, retries, backoff)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            return e
+
+    with session, futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        return dict(zip(missing, executor.map(fetch, missing)))
+
+
+class InputStore:
+    """Reads input files, keeping an LRU cache of the decoded (stripped) text
+    Cache entries are keyed on the file path, and dropped if the file's mtime or size changes
+    """
+
+    def __init__(self, max_items: int = 32):
+        self.max_items = max_items
+        # path -> ((mtime_ns, size), text), least recently used first
+        self.cache = OrderedDict()
+
+    def get_text(self, path: str) -> str:
+        """The stripped text of the file at path"""
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        entry = self.cache.get(path)
+        if entry is not None and entry[0] == version:
+            self.cache.move_to_end(path)
+            return entry[1]
+
+        with open(path, "r", encoding="utf-8") as file:
+            s = file.read().strip()
+        self.cache[path] = (version, s)
+        self.cache.move_to_end(path)
+        while len(self.cache) > self.max_items:
+            self.cache.popitem(last=False)
+        return s
+
+    def get_bytes(self, path: str) -> memoryview:
+        """The stripped bytes of the file at path, as a read-only memoryview of a memory map
+        Nothing is copied: the map stays open while the view (or anything made from it,
+            ex. with np.frombuffer()) is alive
+        """
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return memoryview(b"")
+            view = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        start, end = 0, len(view)
+        while start < end and view[start] in WHITESPACE:
+            start += 1
+        while end > start and view[end - 1] in WHITESPACE:
+            end -= 1
+        return view[start:end]
+
+    def clear(self):
+        """Empty the text cache"""
+        self.cache.clear()
+
+
+INPUT_STORE = InputStore()
+
+
+def input_path(day: int = None) -> str:
+    """Path to the input file for the given date, downloading it first if it isn't saved yet"""
     if day is None:
         date = datetime.datetime.now()
         assert (date >= date.year == 2024) and (
@@ -44,16 +234,107 @@ def get_input(day: int = None) -> str:
     # if .txt file of input doesn't exist, download from the website
     if not os.path.exists(file_path):
         logger.debug("Retrieving from website")
-        url = f"https://adventofcode.com/2024/day/{day}/input"
-        s = requests.get(url, cookies=cookies, headers={}, timeout=10).text
-        logger.debug(f"{file_path=}")
-        with open(file_path, "w", encoding="utf-8") as file:
-            file.write(s)
-        logger.debug(f"Wrote to {file_path}")
-
-    # read the input from the .txt file
-    with open(file_path, "r", encoding="utf-8") as file:
-        s = file.read()
+        download_input(day)
+
+    return file_path
+
+
+def get_input(day: int = None) -> str:
+    """Get the input for the given date"""
+    file_path = input_path(day)
+    s = INPUT_STORE.get_text(file_path)
     logger.debug(f"Retrieved from {file_path}")
+    return s
+
+
+def get_input_bytes(day: int = None) -> memoryview:
+    """Get the input for the given date as bytes (a memoryview, see InputStore.get_bytes())"""
+    return INPUT_STORE.get_bytes(input_path(day))
+
+
+def read_input(path: str, as_bytes: bool = False) -> str | memoryview:
+    """Read an input file that isn't in the inputs folder (ex. for batch runs)"""
+    if as_bytes:
+        return INPUT_STORE.get_bytes(path)
+    return INPUT_STORE.get_text(path)
+
+
+def iter_blocks(path: str, block_size: int = 2**16) -> Generator[bytes, None, None]:
+    """Yield the bytes of the file in blocks of (at most) block_size"""
+    with open(path, "rb") as file:
+        while block := file.read(block_size):
+            yield block
+
+
+def iter_lines(path: str, block_size: int = 2**16) -> Generator[str, None, None]:
+    """Yield the stripped lines of the file, skipping blank lines
+    Reads block_size bytes at a time, so only a block (plus a partial line) is ever held
+    """
+    partial = b""
+    for block in iter_blocks(path, block_size):
+        lines = (partial + block).split(b"\n")
+        partial = lines.pop()
+        for line in lines:
+            if line := line.strip():
+                yield line.decode("utf-8")
+    if partial := partial.strip():
+        yield partial.decode("utf-8")
+
+
+def iter_input_lines(
+    day: int = None, block_size: int = 2**16
+) -> Generator[str, None, None]:
+    """Stream the lines of the input for the given date (see iter_lines())"""
+    return iter_lines(input_path(day), block_size)
+
+
+def parse_args() -> "argparse.Namespace":
+    """Command line arguments for running this file"""
+    parser = argparse.ArgumentParser(description="Input file utilities")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    parser_prefetch = subparsers.add_parser(
+        "prefetch", help="download every missing input"
+    )
+    parser_prefetch.add_argument(
+        "--day", type=int, action="append", help="only these day(s)"
+    )
+    parser_prefetch.add_argument(
+        "--jobs", "-j", type=int, default=4, help="concurrent downloads"
+    )
+    parser_prefetch.add_argument(
+        "--base-url", default=BASE_URL, help=f"site to download from ({BASE_URL})"
+    )
+    parser_prefetch.add_argument(
+        "--folder", default=FOLDER_INPUTS, help="where to save the inputs"
+    )
+    parser_prefetch.add_argument(
+        "--retries", type=int, default=3, help="retries per input"
+    )
+    parser_prefetch.add_argument(
+        "--no-cookies",
+        action="store_true",
+        help="don't send cookies.txt (ex. for a local stand-in server)",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the command line, return an exit code"""
+    args = parse_args()
+    results = prefetch(
+        args.day or range(1, 26),
+        args.jobs,
+        args.base_url,
+        args.folder,
+        {} if args.no_cookies else None,
+        args.retries,
+    )
+    for day, result in sorted(results.items()):
+        print(f"Day {day}: {result}")
+    if not results:
+        print("Nothing to download")
+    return int(any(isinstance(r, Exception) for r in results.values()))
+
 
-    return s.strip()
+if __name__ == "__main__":
+    raise SystemExit(main())
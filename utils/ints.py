@@ -0,0 +1,100 @@
+"""Pulling the integers out of an input in one vectorised pass
+
+Rather than splitting the text and calling int() on every token (a python str and int each),
+    parse_ints() works on the bytes with numpy
+- digit mask: raw - ord("0") < 10 (as uint8, so everything else wraps around to >= 10)
+- tokens: np.diff of the digit mask is +1 where a token starts and -1 just past where it ends
+- values: Horner's rule one digit position at a time (value * 10 + next digit), over all the
+    tokens at once, so it's a handful of array operations per digit of the longest token
+- a "-" right before a token makes it negative (with signed=True)
+- rows: the row offsets are where the line starts fall among the token starts (np.searchsorted)
+
+Everything that isn't a digit (or a minus sign) is a separator, so "p=0,4 v=3,-3" gives 0 4 3 -3
+Tokens can have at most 18 digits (so they fit in an int64)
+"""
+
+# pylint: disable=invalid-name
+
+import numpy as np
+
+NEWLINE = ord("\n")
+MINUS = ord("-")
+
+# what bytes.strip() strips
+WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+
+# longest token that surely fits in an int64
+MAX_DIGITS = 18
+
+
+def parse_ints(
+    s: str | bytes | memoryview, signed: bool = True
+) -> tuple[np.ndarray, np.ndarray]:
+    """All the integers in s, as a flat int64 array of values and an array of row offsets
+    Row (line) r of s has the values values[offsets[r] : offsets[r + 1]] (empty for blank lines)
+    s is stripped first, so a trailing newline doesn't make an extra row
+    """
+    if isinstance(s, str):
+        s = s.encode("utf-8")
+    # a view of the buffer (no copy, so a memory-mapped input stays mapped), stripped by index
+    raw = np.frombuffer(s, dtype=np.uint8)
+    start, end = 0, len(raw)
+    while start < end and raw[start] in WHITESPACE:
+        start += 1
+    while end > start and raw[end - 1] in WHITESPACE:
+        end -= 1
+    raw = raw[start:end]
+    if not len(raw):
+        return np.zeros(0, dtype=np.int64), np.zeros(1, dtype=np.int64)
+
+    # where each line starts, plus the end of the input
+    line_starts = np.concatenate(([0], np.flatnonzero(raw == NEWLINE) + 1, [len(raw)]))
+
+    # +1 at the first digit of a token, -1 at the byte after its last digit
+    digits = raw - np.uint8(ord("0"))
+    is_digit = digits < 10
+    edges = np.diff(is_digit.view(np.int8), prepend=np.int8(0), append=np.int8(0))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if not len(starts):
+        return np.zeros(0, dtype=np.int64), np.zeros(len(line_starts), dtype=np.int64)
+
+    # Horner's rule, for all the tokens in parallel
+    max_length = (ends - starts).max()
+    assert max_length <= MAX_DIGITS, "Integer too long for int64"
+    values = digits[starts].astype(np.int64)
+    last = len(raw) - 1
+    for k in range(1, max_length):
+        position = starts + k
+        values = np.where(
+            position < ends, values * 10 + digits[np.minimum(position, last)], values
+        )
+
+    # minus signs right before a token
+    if signed:
+        before = np.maximum(starts - 1, 0)
+        values[(starts > 0) & (raw[before] == MINUS)] *= -1
+
+    # the tokens of row r are the ones starting between line_starts[r] and line_starts[r + 1]
+    offsets = np.searchsorted(starts, line_starts)
+
+    return values, offsets
+
+
+def int_rows(values: np.ndarray, offsets: np.ndarray) -> list[np.ndarray]:
+    """Split the output of parse_ints() into a list of arrays, one per row"""
+    return np.split(values, offsets[1:-1])
+
+
+def int_table(
+    s: str | bytes | memoryview, num_columns: int, signed: bool = True
+) -> np.ndarray:
+    """The integers in s as an int64 array of shape (num rows, num_columns),
+    for inputs where every (non-blank) row has num_columns integers
+    """
+    values, offsets = parse_ints(s, signed)
+    counts = np.diff(offsets)
+    assert np.all(
+        (counts == num_columns) | (counts == 0)
+    ), "Rows aren't all the same length"
+    return values.reshape(-1, num_columns)
@@ -0,0 +1,177 @@
+"""Memo caches that are bounded, scoped to one solve, and keep hit/miss/eviction stats
+
+functools.cache never forgets, so in a long-lived process (the daemon, bench.py batch) the caches
+    of recursive solutions keep growing with every input they see
+@memo() caches are LRU with a maxsize, and scope() clears all of them at the start and end of a solve
+Since a cache only ever sees one input, it can leave out arguments that are fixed for the whole
+    solve (ex. the grid), with key=
+
+Ex.
+@memo(key=lambda A, i, j: (i, j))
+def calc_rating(A, i, j): ...
+
+with scope() as stats:
+    answer = solution_part2(s)
+print(format_stats(stats))
+
+scope() nests (only the outermost one clears), so a solution can wrap itself in a scope() to be safe
+    on its own and still have the harness's scope around it collect the stats
+A narrowed key= is only correct while a scope() is active (so the cache can't outlive the fixed
+    arguments), so calling such a function outside of one fails an assert
+
+Without key=, the cache is functools.lru_cache(maxsize) (bounded, and the LRU bookkeeping and
+    hit/miss counts are all in C), so hot recursion costs about what functools.cache did
+With key=, it's an OrderedDict LRU in python
+"""
+
+from collections import OrderedDict
+from typing import Callable
+import contextlib
+import functools
+
+# default bound on the number of entries in each cache
+MAXSIZE = 2**16
+
+# every cache made by memo(), name -> cache (see scope() and get_stats())
+CACHES = {}
+
+# how many scope()s we're inside of
+_depth = 0
+
+
+class MemoCache:
+    """The cache behind one @memo() function, plus its stats
+    Either cached is the functools.lru_cache function doing the caching,
+        or data is an OrderedDict (LRU) that the @memo() wrapper fills in
+    """
+
+    def __init__(self, name: str, maxsize: int = MAXSIZE):
+        self.name = name
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.cached = None
+        self.reset()
+
+    def clear(self):
+        """Clear the entries, keeping the stats"""
+        if self.cached is not None:
+            info = self.cached.cache_info()
+            self.hits += info.hits
+            self.misses += info.misses
+            # entries only leave an lru_cache by eviction, until it's cleared
+            self.evictions += info.misses - info.currsize
+            self.cached.cache_clear()
+        self.data.clear()
+
+    def reset(self):
+        """Clear the entries and zero the stats"""
+        self.data.clear()
+        if self.cached is not None:
+            self.cached.cache_clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict:
+        """Plain dictionary of the stats"""
+        hits, misses, evictions = self.hits, self.misses, self.evictions
+        size = len(self.data)
+        if self.cached is not None:
+            info = self.cached.cache_info()
+            hits += info.hits
+            misses += info.misses
+            evictions += info.misses - info.currsize
+            size = info.currsize
+        return {
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "size": size,
+            "maxsize": self.maxsize,
+        }
+
+
+def memo(maxsize: int = MAXSIZE, key: Callable = None):
+    """Decorator memoizing a function in a bounded LRU cache
+    key: maps the arguments to the cache key (default: the positional arguments, plus the
+        keyword arguments if any), only safe to narrow for arguments fixed within a scope()
+        (asserted on every cache miss)
+    The wrapped function gets a .memo attribute (its MemoCache)
+    """
+    assert isinstance(maxsize, int) and maxsize > 0, "Memo caches need a bound"
+
+    def decorator(function: Callable) -> Callable:
+        cache = MemoCache(function.__qualname__, maxsize)
+        CACHES[f"{function.__module__}.{function.__qualname__}"] = cache
+
+        if key is None:
+            cached_function = functools.lru_cache(maxsize)(function)
+            cache.cached = cached_function
+            cached_function.memo = cache
+            return cached_function
+
+        data = cache.data
+        sentinel = object()
+
+        @functools.wraps(function)
+        def lru_wrapper(*args, **kwargs):
+            k = key(*args, **kwargs)
+            value = data.get(k, sentinel)
+            if value is not sentinel:
+                cache.hits += 1
+                data.move_to_end(k)
+                return value
+            cache.misses += 1
+            assert _depth, f"{cache.name} has a narrowed key, call it in a scope()"
+            value = function(*args, **kwargs)
+            data[k] = value
+            if len(data) > cache.maxsize:
+                data.popitem(last=False)
+                cache.evictions += 1
+            return value
+
+        lru_wrapper.memo = cache
+        return lru_wrapper
+
+    return decorator
+
+
+def get_stats() -> dict:
+    """Stats of the caches that were used since they were last reset, name -> stats dictionary"""
+    stats = {name: cache.stats() for name, cache in CACHES.items()}
+    return {name: s for name, s in stats.items() if s["hits"] or s["misses"]}
+
+
+@contextlib.contextmanager
+def scope():
+    """Context manager for one solve: every cache starts out empty, and gets emptied afterwards
+    Yields a dictionary that gets filled in with get_stats() on the way out
+    Inner scopes don't clear anything, and yield an empty dictionary
+    """
+    global _depth  # pylint: disable=global-statement
+    stats = {}
+    outermost = _depth == 0
+    if outermost:
+        for cache in CACHES.values():
+            cache.reset()
+    _depth += 1
+    try:
+        yield stats
+    finally:
+        _depth -= 1
+        if outermost:
+            stats.update(get_stats())
+            for cache in CACHES.values():
+                cache.clear()
+
+
+def format_stats(stats: dict) -> list[str]:
+    """One line per cache describing its stats (for printing)"""
+    lines = []
+    for name, s in stats.items():
+        calls = s["hits"] + s["misses"]
+        lines.append(
+            f"{name}: {s['hits']} hits / {s['misses']} misses ({s['hits'] / calls:.0%} hit rate)"
+            f", {s['evictions']} evictions, size {s['size']}/{s['maxsize']}"
+        )
+    return lines
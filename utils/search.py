@@ -0,0 +1,206 @@
+"""Graph searches over flat integer state ids
+
+States are the ints 0, ..., num_states - 1 (ex. i * m + j for the cells of a grid, see utils.grid)
+Distances go in a preallocated int32 array, with UNREACHED for the states that weren't reached
+
+The graph is given by a neighbours function
+- bfs(): neighbours(state) gives the next states (every edge has length 1)
+- zero_one_bfs() and dijkstra(): neighbours(state) gives (next state, weight) pairs
+    (weights 0 or 1 for zero_one_bfs(), non-negative ints for dijkstra())
+
+Every search takes a list of sources (all at distance 0), and can stop early once it reaches a target
+shortest_path_states() walks back from targets over the predecessor DAG of a search,
+    to find every state on some shortest path
+label_components() labels connected components (ex. the regions of a grid)
+
+With utils.counters on, the searches count their runs and the nodes they expand
+    (tallied in a local, so it costs next to nothing when counting is off)
+"""
+
+from collections import deque
+from typing import Callable, Iterable
+import heapq
+
+import numpy as np
+
+from utils.counters import COUNTERS
+
+# distance (or label) of a state that wasn't reached
+UNREACHED = -1
+
+
+def new_distances(num_states: int) -> np.ndarray:
+    """An int32 array of num_states UNREACHED distances"""
+    return np.full(num_states, UNREACHED, dtype=np.int32)
+
+
+def bfs(
+    num_states: int,
+    sources: Iterable[int],
+    neighbours: Callable[[int], Iterable[int]],
+    target: int = None,
+    dist: np.ndarray = None,
+) -> np.ndarray:
+    """Breadth first search from the sources, returning the array of distances
+    target: stop once this state is reached (so states further out may be left UNREACHED)
+    dist: preallocated distances to fill in (see new_distances()),
+        states that already have a distance are treated as visited
+    """
+    if dist is None:
+        dist = new_distances(num_states)
+    queue = deque()
+    for source in sources:
+        dist[source] = 0
+        queue.append(source)
+
+    expanded = 0
+    while queue:
+        state = queue.popleft()
+        if state == target:
+            break
+        expanded += 1
+        d = dist[state] + 1
+        for next_state in neighbours(state):
+            if dist[next_state] == UNREACHED:
+                dist[next_state] = d
+                queue.append(next_state)
+
+    if COUNTERS.enabled:
+        COUNTERS.add("bfs runs")
+        COUNTERS.add("bfs nodes expanded", expanded)
+    return dist
+
+
+def zero_one_bfs(
+    num_states: int,
+    sources: Iterable[int],
+    neighbours: Callable[[int], Iterable[tuple[int, int]]],
+    target: int = None,
+    dist: np.ndarray = None,
+) -> np.ndarray:
+    """Shortest distances from the sources when every weight is 0 or 1
+    Like dijkstra(), but a deque instead of a heap (weight 0 edges go on the front)
+    target and dist are as in bfs()
+    """
+    if dist is None:
+        dist = new_distances(num_states)
+    queue = deque()
+    for source in sources:
+        dist[source] = 0
+        queue.append((0, source))
+
+    expanded = 0
+    while queue:
+        d, state = queue.popleft()
+        if d > dist[state]:
+            # stale entry, the state was reached more cheaply since
+            continue
+        if state == target:
+            break
+        expanded += 1
+        for next_state, weight in neighbours(state):
+            _d = d + weight
+            if dist[next_state] == UNREACHED or _d < dist[next_state]:
+                dist[next_state] = _d
+                if weight:
+                    queue.append((_d, next_state))
+                else:
+                    queue.appendleft((_d, next_state))
+
+    if COUNTERS.enabled:
+        COUNTERS.add("zero_one_bfs runs")
+        COUNTERS.add("zero_one_bfs nodes expanded", expanded)
+    return dist
+
+
+def dijkstra(
+    num_states: int,
+    sources: Iterable[int],
+    neighbours: Callable[[int], Iterable[tuple[int, int]]],
+    target: int = None,
+    dist: np.ndarray = None,
+) -> np.ndarray:
+    """Shortest distances from the sources with non-negative integer weights (heap frontier)
+    target and dist are as in bfs()
+    """
+    if dist is None:
+        dist = new_distances(num_states)
+    heap = []
+    for source in sources:
+        dist[source] = 0
+        heap.append((0, source))
+    heapq.heapify(heap)
+
+    expanded = 0
+    while heap:
+        d, state = heapq.heappop(heap)
+        if d > dist[state]:
+            # stale entry, the state was reached more cheaply since
+            continue
+        if state == target:
+            break
+        expanded += 1
+        for next_state, weight in neighbours(state):
+            _d = d + weight
+            if dist[next_state] == UNREACHED or _d < dist[next_state]:
+                dist[next_state] = _d
+                heapq.heappush(heap, (_d, next_state))
+
+    if COUNTERS.enabled:
+        COUNTERS.add("dijkstra runs")
+        COUNTERS.add("dijkstra nodes expanded", expanded)
+    return dist
+
+
+def shortest_path_states(
+    dist: np.ndarray,
+    targets: Iterable[int],
+    predecessors: Callable[[int], Iterable[tuple[int, int]]],
+) -> np.ndarray:
+    """Boolean array of the states on some shortest path (from the sources of the search that
+        gave dist) to any of the targets
+    predecessors(state) gives the (previous state, weight) pairs of the edges into state,
+        which is just the neighbours function for undirected graphs
+        (for a bfs(), wrap it so every weight is 1)
+    Walks back over the predecessor DAG: edges (u, v) with dist[u] + weight == dist[v]
+    """
+    on_path = np.zeros(len(dist), dtype=bool)
+    stack = [target for target in targets if dist[target] != UNREACHED]
+    on_path[stack] = True
+    while stack:
+        state = stack.pop()
+        for prev_state, weight in predecessors(state):
+            if (
+                not on_path[prev_state]
+                and dist[prev_state] != UNREACHED
+                and dist[prev_state] + weight == dist[state]
+            ):
+                on_path[prev_state] = True
+                stack.append(prev_state)
+    return on_path
+
+
+def label_components(
+    num_states: int,
+    neighbours: Callable[[int], Iterable[int]],
+    mask: np.ndarray = None,
+) -> np.ndarray:
+    """Label the connected components 0, 1, 2, ... (in order of their smallest state)
+    Returns the int32 array of labels, UNREACHED for states outside mask
+    neighbours should be symmetric, and only give states inside mask
+    """
+    labels = np.full(num_states, UNREACHED, dtype=np.int32)
+    states = range(num_states) if mask is None else np.flatnonzero(mask).tolist()
+    label = 0
+    for state in states:
+        if labels[state] != UNREACHED:
+            continue
+        labels[state] = label
+        stack = [state]
+        while stack:
+            for next_state in neighbours(stack.pop()):
+                if labels[next_state] == UNREACHED:
+                    labels[next_state] = label
+                    stack.append(next_state)
+        label += 1
+    return labels
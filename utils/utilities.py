@@ -1,8 +1,199 @@
 """Misc data structures and things"""
 
+import bisect
+import importlib.util
+import itertools
+import sys
+import types
 
-class BinaryList(list):
+
+def lazy_import(name: str):
+    """Import a module lazily: the real import happens on first attribute access
+    Handy for heavy packages (pandas, networkx, scipy) that only get used in one spot,
+        so importing a solution file stays cheap
+    Ex. pd = lazy_import("pandas")
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def load_lazy_imports(module: types.ModuleType):
+    """Force the lazy_import()-ed modules in a module's globals to actually load
+    So timing its solution functions doesn't count (ex.) importing pandas
+    """
+    for value in vars(module).values():
+        # a lazy module's class goes back to plain ModuleType once it's loaded
+        if isinstance(value, types.ModuleType) and type(value) is not types.ModuleType:
+            getattr(value, "__dict__")
+
+
+class BinaryList:
+    """Sorted list, stored as a list of sorted blocks (sublists) of LOAD to 2 * LOAD items
+    Assumes it's made up of a single type of object, with comparisons implemented
+    The key things are
+    - push(): insert, keeping it sorted
+    - find(): the index of an element
+    - remove(): remove an element
+    Searching is a bisect over the block maxes, then within one block, so O(log n)
+    Inserting/removing only shifts one block (split once it's too big), so O(sqrt n) for LOAD ~ sqrt n
+    Positions (find() and indexing) come from a Fenwick tree over the block lengths, so O(log n)
+        (rebuilt when blocks get split or emptied, which is rare)
+    """
+
+    LOAD = 1_000
+
+    def __init__(self, iterable=()):
+        items = sorted(iterable)
+        self._blocks = [
+            items[k : k + self.LOAD] for k in range(0, len(items), self.LOAD)
+        ]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._len = len(items)
+        self._build_index()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self._blocks)
+
+    def __reversed__(self):
+        return (obj for block in reversed(self._blocks) for obj in reversed(block))
+
+    def __contains__(self, obj) -> bool:
+        b, i = self._locate(obj)
+        return b < len(self._blocks) and self._blocks[b][i] == obj
+
+    def __getitem__(self, k: int):
+        if k < 0:
+            k += self._len
+        if not 0 <= k < self._len:
+            raise IndexError("BinaryList index out of range")
+        # descend the Fenwick tree to the block holding position k
+        b = 0
+        step = 1 << (len(self._blocks).bit_length() - 1)
+        while step:
+            if b + step <= len(self._blocks) and self._index[b + step] <= k:
+                b += step
+                k -= self._index[b]
+            step >>= 1
+        return self._blocks[b][k]
+
+    def __repr__(self) -> str:
+        return f"BinaryList({list(self)!r})"
+
+    def append(self, obj):
+        """Add obj to the end, which has to keep the list sorted (quick way to build it in order)"""
+        if not self._blocks:
+            self._blocks.append([obj])
+            self._maxes.append(obj)
+            self._len += 1
+            self._build_index()
+            return
+        assert not obj < self._maxes[-1], "append() would leave the list unsorted"
+        self._blocks[-1].append(obj)
+        self._maxes[-1] = obj
+        self._len += 1
+        self._update_index(len(self._blocks) - 1, 1)
+        self._split(len(self._blocks) - 1)
+
+    def push(self, obj):
+        """Add obj to the list, before any items equal to it
+        Assumes obj has the necessary comparisons implemented
+        """
+        if not self._blocks:
+            self.append(obj)
+            return
+        b = bisect.bisect_left(self._maxes, obj)
+        if b == len(self._blocks):
+            # bigger than everything, so it goes on the end of the last block
+            b -= 1
+            self._blocks[b].append(obj)
+            self._maxes[b] = obj
+        else:
+            block = self._blocks[b]
+            block.insert(bisect.bisect_left(block, obj), obj)
+        self._len += 1
+        self._update_index(b, 1)
+        self._split(b)
+
+    def find(self, obj) -> int:
+        """Find the index of an item in the list, raising ValueError if it isn't there"""
+        b, i = self._locate(obj)
+        if b == len(self._blocks) or not self._blocks[b][i] == obj:
+            raise ValueError(f"{obj!r} is not in the list")
+        return self._position(b) + i
+
+    def remove(self, obj):
+        """Remove item from the list, raising ValueError if it isn't there"""
+        b, i = self._locate(obj)
+        if b == len(self._blocks) or not self._blocks[b][i] == obj:
+            raise ValueError(f"{obj!r} is not in the list")
+        block = self._blocks[b]
+        del block[i]
+        self._len -= 1
+        if block:
+            self._maxes[b] = block[-1]
+            self._update_index(b, -1)
+        else:
+            del self._blocks[b]
+            del self._maxes[b]
+            self._build_index()
+
+    def _locate(self, obj) -> tuple[int, int]:
+        """(block index, index in the block) of the first item with obj <= item
+        If no such item, returns (len(self._blocks), 0)
+        """
+        b = bisect.bisect_left(self._maxes, obj)
+        if b == len(self._blocks):
+            return b, 0
+        return b, bisect.bisect_left(self._blocks[b], obj)
+
+    def _split(self, b: int):
+        """Split block b in half if it's gotten too big"""
+        block = self._blocks[b]
+        if len(block) > 2 * self.LOAD:
+            self._blocks[b : b + 1] = [block[: self.LOAD], block[self.LOAD :]]
+            self._maxes[b : b + 1] = [block[self.LOAD - 1], block[-1]]
+            self._build_index()
+
+    def _build_index(self):
+        """Build the Fenwick tree of block lengths (1-based, self._index[0] is unused)"""
+        self._index = [0] + [len(block) for block in self._blocks]
+        for i in range(1, len(self._index)):
+            j = i + (i & -i)
+            if j < len(self._index):
+                self._index[j] += self._index[i]
+
+    def _update_index(self, b: int, delta: int):
+        """Add delta to the length of block b in the Fenwick tree"""
+        i = b + 1
+        while i < len(self._index):
+            self._index[i] += delta
+            i += i & -i
+
+    def _position(self, b: int) -> int:
+        """Index of the first item of block b (total length of the blocks before it)"""
+        position = 0
+        while b:
+            position += self._index[b]
+            b -= b & -b
+        return position
+
+
+class FlatBinaryList(list):
     """list() but also sort of a binary tree
+    The original BinaryList, kept as the baseline for bench.py's sorted subcommand
+    (push() and remove() are O(n), since list.insert() and list.pop() shift everything after)
     Assumes it's made up of a single type of object, with comparisons implemented
     Assumed it's ordered at all times
     The key new things are
@@ -22,7 +213,7 @@ class BinaryList(list):
         i = self._find_above(obj)
         if i < len(self) and self[i] == obj:
             return i
-        return ValueError
+        raise ValueError(f"{obj!r} is not in the list")
 
     def _find_above(self, obj) -> int:
         """Find the smallest index i with obj <= self[i]